@@ -56,6 +56,25 @@ class Colors:
     BG_WHITE = "\033[47m"
 
 
+LOG_STYLES = {
+    LogLevel.DEBUG: ("🔍", Colors.DIM),
+    LogLevel.INFO: ("ℹ️", Colors.BLUE),
+    LogLevel.SUCCESS: ("✅", Colors.GREEN),
+    LogLevel.WARNING: ("⚠️", Colors.YELLOW),
+    LogLevel.ERROR: ("❌", Colors.RED),
+    LogLevel.THINKING: ("🤔", Colors.YELLOW),
+}
+DEFAULT_LOG_STYLE = ("•", Colors.RESET)
+
+# Pre-rendered line prefixes so logging does one concatenation per message
+_LOG_PREFIXES = {
+    level: f"{color}{icon} " for level, (icon, color) in LOG_STYLES.items()
+}
+_BULLET = f"  {Colors.CYAN}•{Colors.RESET} "
+
+PROGRESS_REDRAW_INTERVAL = 0.05  # seconds; caps progress bar redraws at ~20 Hz
+
+
 class ProgressBar:
     """Simple progress bar for CLI"""
 
@@ -68,6 +87,7 @@ class ProgressBar:
         self.fill_char = fill_char
         self.empty_char = empty_char
         self.start_time = time.time()
+        self._last_draw = 0.0
 
     def update(self, amount: int = 1):
         """Update progress by amount"""
@@ -79,8 +99,17 @@ class ProgressBar:
         self.current = min(current, self.total)
         self._draw()
 
-    def _draw(self):
+    def _draw(self, force: bool = False):
         """Draw the progress bar"""
+        now = time.monotonic()
+        if (
+            not force
+            and self.current < self.total
+            and now - self._last_draw < PROGRESS_REDRAW_INTERVAL
+        ):
+            return
+        self._last_draw = now
+
         if self.total == 0:
             percent = 100
         else:
@@ -101,7 +130,7 @@ class ProgressBar:
     def finish(self):
         """Complete the progress bar"""
         self.current = self.total
-        self._draw()
+        self._draw(force=True)
         print()  # New line
 
 
@@ -114,13 +143,24 @@ class ThinkingIndicator:
         self.thread = None
         self.frames = ["🤔", "💭", "🧠", "⚡"]
         self.current_frame = 0
+        self._stop_event = threading.Event()
+        # Longest message shown since the line was last cleared
+        self._clear_width = len(message)
+
+    def set_message(self, message: str):
+        """Change the message; a running animation picks it up on its next tick"""
+        self.message = message
+        self._clear_width = max(self._clear_width, len(message))
 
-    def start(self):
-        """Start the thinking animation"""
+    def start(self, message: Optional[str] = None):
+        """Start the thinking animation, optionally with a new message"""
+        if message is not None:
+            self.set_message(message)
         if self.is_running:
             return
 
         self.is_running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._animate)
         self.thread.daemon = True
         self.thread.start()
@@ -128,15 +168,18 @@ class ThinkingIndicator:
     def stop(self):
         """Stop the thinking animation"""
         self.is_running = False
+        # Wake the animation thread so it exits now instead of after its tick
+        self._stop_event.set()
         if self.thread:
             self.thread.join()
         # Clear the line
-        sys.stdout.write("\r" + " " * (len(self.message) + 10) + "\r")
+        sys.stdout.write("\r" + " " * (self._clear_width + 10) + "\r")
         sys.stdout.flush()
+        self._clear_width = len(self.message)
 
     def _animate(self):
         """Animation loop"""
-        while self.is_running:
+        while not self._stop_event.is_set():
             frame = self.frames[self.current_frame]
             sys.stdout.write(
                 f"\r{Colors.YELLOW}{frame} {self.message}...{Colors.RESET}"
@@ -144,7 +187,7 @@ class ThinkingIndicator:
             sys.stdout.flush()
 
             self.current_frame = (self.current_frame + 1) % len(self.frames)
-            time.sleep(0.5)
+            self._stop_event.wait(0.5)
 
 
 class ModernCLI:
@@ -176,12 +219,14 @@ class ModernCLI:
 
     def log(self, level: LogLevel, message: str, details: Optional[str] = None):
         """Log a message with appropriate styling"""
-        icon, color = self._get_log_style(level)
-
-        if level == LogLevel.DEBUG and not self.verbose:
+        if level is LogLevel.DEBUG and not self.verbose:
             return
 
-        print(f"{color}{icon} {message}{Colors.RESET}")
+        prefix = _LOG_PREFIXES.get(level)
+        if prefix is None:
+            icon, color = self._get_log_style(level)
+            prefix = f"{color}{icon} "
+        print(prefix + message + Colors.RESET)
 
         if details and (self.verbose or level in [LogLevel.ERROR, LogLevel.WARNING]):
             for line in details.split("\n"):
@@ -190,15 +235,7 @@ class ModernCLI:
 
     def _get_log_style(self, level: LogLevel) -> tuple[str, str]:
         """Get icon and color for log level"""
-        styles = {
-            LogLevel.DEBUG: ("🔍", Colors.DIM),
-            LogLevel.INFO: ("ℹ️", Colors.BLUE),
-            LogLevel.SUCCESS: ("✅", Colors.GREEN),
-            LogLevel.WARNING: ("⚠️", Colors.YELLOW),
-            LogLevel.ERROR: ("❌", Colors.RED),
-            LogLevel.THINKING: ("🤔", Colors.YELLOW),
-        }
-        return styles.get(level, ("•", Colors.RESET))
+        return LOG_STYLES.get(level, DEFAULT_LOG_STYLE)
 
     def success(self, message: str, details: Optional[str] = None):
         """Log success message"""
@@ -238,17 +275,18 @@ class ModernCLI:
     def show_summary(self, threats_count: int, processing_time: float):
         """Show final summary"""
         print(f"\n{Colors.BOLD}{Colors.GREEN}🎯 Analysis Complete!{Colors.RESET}")
+        print(f"{_BULLET}Identified {Colors.BOLD}{threats_count}{Colors.RESET} threats")
         print(
-            f"  {Colors.CYAN}•{Colors.RESET} Identified {Colors.BOLD}{threats_count}{Colors.RESET} threats"
-        )
-        print(
-            f"  {Colors.CYAN}•{Colors.RESET} Processing time: {Colors.BOLD}{processing_time:.1f}s{Colors.RESET}"
+            f"{_BULLET}Processing time: {Colors.BOLD}{processing_time:.1f}s{Colors.RESET}"
         )
 
     def show_metrics_summary(self, metrics: Dict[str, Any]):
         """Show parsing metrics in a user-friendly way"""
         self.info("Parsing metrics:")
 
+        # Collect bullet lines and print them in one write
+        lines: List[str] = []
+
         # Handle different metric types
         if hasattr(metrics, "total_lines"):
             total_lines = metrics.total_lines
@@ -257,18 +295,18 @@ class ModernCLI:
             if total_lines > 10000:  # Likely file size in bytes
                 self.debug(f"File size: {total_lines / 1024:.1f} KB")
             else:
-                print(
-                    f"  {Colors.CYAN}•{Colors.RESET} Processed {Colors.BOLD}{total_lines}{Colors.RESET} lines"
+                lines.append(
+                    f"{_BULLET}Processed {Colors.BOLD}{total_lines}{Colors.RESET} lines"
                 )
 
             # Show parsing success rates if available
             if hasattr(metrics, "nodes_parsed"):
-                print(
-                    f"  {Colors.CYAN}•{Colors.RESET} Found {Colors.BOLD}{metrics.nodes_parsed}{Colors.RESET} nodes"
+                lines.append(
+                    f"{_BULLET}Found {Colors.BOLD}{metrics.nodes_parsed}{Colors.RESET} nodes"
                 )
             if hasattr(metrics, "edges_parsed"):
-                print(
-                    f"  {Colors.CYAN}•{Colors.RESET} Found {Colors.BOLD}{metrics.edges_parsed}{Colors.RESET} edges"
+                lines.append(
+                    f"{_BULLET}Found {Colors.BOLD}{metrics.edges_parsed}{Colors.RESET} edges"
                 )
             if hasattr(metrics, "import_success_rate"):
                 rate = metrics.import_success_rate * 100
@@ -279,22 +317,25 @@ class ModernCLI:
                     if rate > 60
                     else Colors.RED
                 )
-                print(
-                    f"  {Colors.CYAN}•{Colors.RESET} Success rate: {color}{Colors.BOLD}{rate:.1f}%{Colors.RESET}"
+                lines.append(
+                    f"{_BULLET}Success rate: {color}{Colors.BOLD}{rate:.1f}%{Colors.RESET}"
                 )
         elif isinstance(metrics, dict):
             # Handle dict-type metrics
             if "total_lines" in metrics:
-                lines = metrics["total_lines"]
-                if lines > 10000:
-                    self.debug(f"File size: {lines / 1024:.1f} KB")
+                total_lines = metrics["total_lines"]
+                if total_lines > 10000:
+                    self.debug(f"File size: {total_lines / 1024:.1f} KB")
                 else:
-                    print(
-                        f"  {Colors.CYAN}•{Colors.RESET} Processed {Colors.BOLD}{lines}{Colors.RESET} lines"
+                    lines.append(
+                        f"{_BULLET}Processed {Colors.BOLD}{total_lines}{Colors.RESET} lines"
                     )
         else:
             self.debug("Metrics details", str(metrics))
 
+        if lines:
+            print("\n".join(lines))
+
     def create_progress_bar(self, total: int) -> ProgressBar:
         """Create a new progress bar"""
         return ProgressBar(total)
@@ -315,17 +356,23 @@ class ModernCLI:
             f"Preview of identified threats (showing {min(len(threats), max_show)} of {len(threats)}):"
         )
 
+        lines: List[str] = []
         for i, threat in enumerate(threats[:max_show]):
             severity_color = self._get_severity_color(threat.severity)
-            print(
+            lines.append(
                 f"  {Colors.BOLD}{i + 1}.{Colors.RESET} {severity_color}{threat.severity}{Colors.RESET} - {threat.title}"
             )
             if hasattr(threat, "score"):
-                print(f"     Score: {Colors.BOLD}{threat.score:.1f}{Colors.RESET}")
+                lines.append(
+                    f"     Score: {Colors.BOLD}{threat.score:.1f}{Colors.RESET}"
+                )
 
         if len(threats) > max_show:
             remaining = len(threats) - max_show
-            print(f"  {Colors.DIM}... and {remaining} more threats{Colors.RESET}")
+            lines.append(
+                f"  {Colors.DIM}... and {remaining} more threats{Colors.RESET}"
+            )
+        print("\n".join(lines))
 
     def _get_severity_color(self, severity: str) -> str:
         """Get color for threat severity"""
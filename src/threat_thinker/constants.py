@@ -65,7 +65,8 @@ LLM_SYSTEM = (
     "and physical-cyber interactions specific to the system's operational environment."
 )
 
-LLM_INSTRUCTIONS = (
+# Output shape spelled out as prose for providers without schema-enforced output.
+LLM_OUTPUT_FORMAT = (
     "CRITICAL: Return ONLY a valid, complete JSON object that can be parsed with json.loads(). "
     "Do NOT use markdown formatting, code blocks, or ```json markers. "
     "MUST be a complete, well-formed JSON with proper closing braces and brackets.\n\n"
@@ -87,6 +88,9 @@ LLM_INSTRUCTIONS = (
     "    }\n"
     "  ]\n"
     "}\n\n"
+)
+
+LLM_RULES = (
     "Rules:\n"
     "- Severity should be consistent with score (1..9 ~= impact*likelihood). Use integers for score.\n"
     "- Do NOT include 'id' field - IDs will be automatically assigned as T001, T002, etc.\n"
@@ -105,3 +109,5 @@ LLM_INSTRUCTIONS = (
     "- ENSURE the JSON is complete and properly closed - no truncated responses!\n"
     "- Return ONLY the JSON object, no explanatory text before or after.\n"
 )
+
+LLM_INSTRUCTIONS = LLM_OUTPUT_FORMAT + LLM_RULES
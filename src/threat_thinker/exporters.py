@@ -3,7 +3,6 @@ Export functionality for reports
 """
 
 import copy
-import json
 from html import escape
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -12,12 +11,16 @@ from threat_thinker.constants import (
     AI_OUTPUT_DISCLAIMER_JA,
     AI_OUTPUT_DISCLAIMER_MD,
 )
+from threat_thinker.json_utils import dumps_json, loads_json
 from threat_thinker.models import Edge, Graph, ImportMetrics, Node, Threat
 from threat_thinker.zone_utils import zone_path_names
 
 # Token budget sized for multi-section narrative diff explanations.
 DIFF_EXPLANATION_MAX_TOKENS = 1800
 
+# Keep Markdown table cells on one row: escape column separators, fold newlines.
+_MD_TABLE_CELL_ESCAPE = str.maketrans({"|": "\\|", "\r": " ", "\n": " "})
+
 
 def export_json(
     threats: List[Threat],
@@ -104,7 +107,7 @@ def export_json(
             ],
             "zones": zones_payload,
         }
-    s = json.dumps(obj, ensure_ascii=False, indent=2)
+    s = dumps_json(obj)
     if out_path:
         with open(out_path, "w", encoding="utf-8") as f:
             f.write(s)
@@ -127,7 +130,9 @@ def export_md(threats: List[Threat], output_file: str = None) -> str:
     md_content += "|----|---------|---------|-------|\n"
 
     for threat in threats:
-        md_content += f"| {threat.id} | {threat.title} | {threat.severity} | {threat.score:.1f} |\n"
+        cells = (threat.id, threat.title, threat.severity)
+        tid, title, severity = (str(c).translate(_MD_TABLE_CELL_ESCAPE) for c in cells)
+        md_content += f"| {tid} | {title} | {severity} | {threat.score:.1f} |\n"
 
     # Threat Details
     md_content += "\n## Threat Details\n\n"
@@ -584,7 +589,7 @@ def export_html(
         ],
     }
 
-    json_payload = json.dumps(report_payload, ensure_ascii=False)
+    json_payload = dumps_json(report_payload, indent=False)
     # Prevent accidental script termination
     safe_json_payload = json_payload.replace("</", "<\\/")
 
@@ -1023,13 +1028,34 @@ def export_threat_dragon(
     if combined_diagram_threats or "threats" in diagram:
         diagram["threats"] = combined_diagram_threats
 
-    output = json.dumps(model, ensure_ascii=False, indent=2)
+    output = dumps_json(model)
     if output_file:
         with open(output_file, "w", encoding="utf-8") as f:
             f.write(output)
     return output
 
 
+def _load_report_sections(path: str) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Load a JSON report and keep only its threats, graph nodes and graph edges."""
+    with open(path, "rb") as f:
+        data = loads_json(f.read())
+    graph = data.get("graph", {"nodes": [], "edges": []})
+    return data.get("threats", []), graph.get("nodes", []), graph.get("edges", [])
+
+
+def _diff_by_key(
+    after_items: List[Dict], before_items: List[Dict], key
+) -> Tuple[List[Dict], List[Dict]]:
+    """Return (added, removed) items, computing each item's key only once."""
+    after_keyed = [(key(item), item) for item in after_items]
+    before_keyed = [(key(item), item) for item in before_items]
+    after_keys = {k for k, _ in after_keyed}
+    before_keys = {k for k, _ in before_keyed}
+    added = [item for k, item in after_keyed if k not in before_keys]
+    removed = [item for k, item in before_keyed if k not in after_keys]
+    return added, removed
+
+
 def diff_reports(
     after_path: str,
     before_path: str,
@@ -1056,54 +1082,22 @@ def diff_reports(
     Returns:
         Dictionary containing graph differences, threat differences, and LLM explanation
     """
-    with open(after_path, "r", encoding="utf-8") as f:
-        after_data = json.load(f)
-    with open(before_path, "r", encoding="utf-8") as f:
-        before_data = json.load(f)
-
-    # Extract threats
-    after_threats = after_data.get("threats", [])
-    before_threats = before_data.get("threats", [])
-
-    # Calculate threat differences
-    after_ids = {t["id"] for t in after_threats}
-    before_ids = {t["id"] for t in before_threats}
-    added_threat_ids = after_ids - before_ids
-    removed_threat_ids = before_ids - after_ids
-
-    added_threats = [t for t in after_threats if t["id"] in added_threat_ids]
-    removed_threats = [t for t in before_threats if t["id"] in removed_threat_ids]
-
-    # Extract graph data
-    after_graph = after_data.get("graph", {"nodes": [], "edges": []})
-    before_graph = before_data.get("graph", {"nodes": [], "edges": []})
-
-    # Calculate graph differences
-    after_node_ids = {n["id"] for n in after_graph.get("nodes", [])}
-    before_node_ids = {n["id"] for n in before_graph.get("nodes", [])}
-    added_node_ids = after_node_ids - before_node_ids
-    removed_node_ids = before_node_ids - after_node_ids
-
-    added_nodes = [n for n in after_graph.get("nodes", []) if n["id"] in added_node_ids]
-    removed_nodes = [
-        n for n in before_graph.get("nodes", []) if n["id"] in removed_node_ids
-    ]
+    after_threats, after_nodes, after_edges = _load_report_sections(after_path)
+    before_threats, before_nodes, before_edges = _load_report_sections(before_path)
+
+    # Calculate threat and graph differences
+    added_threats, removed_threats = _diff_by_key(
+        after_threats, before_threats, lambda t: t["id"]
+    )
+    added_nodes, removed_nodes = _diff_by_key(
+        after_nodes, before_nodes, lambda n: n["id"]
+    )
 
     # For edges, create a unique identifier from src->dst->label
     def edge_key(edge):
         return f"{edge['src']}->{edge['dst']}:{edge.get('label', '')}"
 
-    after_edge_keys = {edge_key(e) for e in after_graph.get("edges", [])}
-    before_edge_keys = {edge_key(e) for e in before_graph.get("edges", [])}
-    added_edge_keys = after_edge_keys - before_edge_keys
-    removed_edge_keys = before_edge_keys - after_edge_keys
-
-    added_edges = [
-        e for e in after_graph.get("edges", []) if edge_key(e) in added_edge_keys
-    ]
-    removed_edges = [
-        e for e in before_graph.get("edges", []) if edge_key(e) in removed_edge_keys
-    ]
+    added_edges, removed_edges = _diff_by_key(after_edges, before_edges, edge_key)
 
     # Generate LLM explanation
     from threat_thinker.llm.inference import _get_language_name
@@ -1159,7 +1153,7 @@ def diff_reports(
     user_prompt = f"""Analyze the following changes between two system architecture diagrams and their threat models:
 
 CHANGES SUMMARY:
-{json.dumps(diff_summary, ensure_ascii=False, indent=2)}
+{dumps_json(diff_summary)}
 
 {lang_instruction}Please provide a structured analysis including:
 
@@ -2,9 +2,9 @@
 LLM-inferred hint processing functionality
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from threat_thinker.models import Graph, Node
+from threat_thinker.models import Edge, Graph, Node
 from threat_thinker.zone_utils import (
     representative_zone_name,
     sort_zone_ids_by_hierarchy,
@@ -111,27 +111,28 @@ def merge_llm_hints(g: Graph, hints: dict) -> Graph:
         n.type = attrs.get("type", n.type)
         _apply_zone_attrs(n, attrs, g)
         if isinstance(attrs.get("data"), list):
-            n.data = list({*n.data, *[str(x) for x in attrs["data"]]})
+            n.data = list(dict.fromkeys([*n.data, *map(str, attrs["data"])]))
         if "auth" in attrs:
             n.auth = attrs["auth"]
         if "notes" in attrs:
             n.notes = attrs["notes"]
 
-    # edges
+    # edges (first edge wins for parallel src->dst flows, as before)
+    edge_index: Dict[Tuple[str, str], Edge] = {}
+    for edge in g.edges:
+        edge_index.setdefault((edge.src, edge.dst), edge)
     for e in hints.get("edges") or []:
         src, dst = e.get("from"), e.get("to")
         if not src or not dst:
             continue
-        matched = None
-        for edge in g.edges:
-            if edge.src == src and edge.dst == dst:
-                matched = edge
-                break
+        matched = edge_index.get((src, dst))
         if matched:
             if e.get("protocol"):
                 matched.protocol = e["protocol"]
             if isinstance(e.get("data"), list):
-                matched.data = list({*matched.data, *[str(x) for x in e["data"]]})
+                matched.data = list(
+                    dict.fromkeys([*matched.data, *map(str, e["data"])])
+                )
 
     return g
 
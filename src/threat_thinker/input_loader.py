@@ -5,7 +5,7 @@ Shared input loader that dispatches source formats into the Graph IR.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from threat_thinker.models import Graph, ImportMetrics
 from threat_thinker.parsers.drawio_parser import parse_drawio
@@ -13,7 +13,7 @@ from threat_thinker.parsers.image_parser import parse_image
 from threat_thinker.parsers.ir_parser import parse_ir
 from threat_thinker.parsers.mermaid_parser import parse_mermaid
 from threat_thinker.parsers.threat_dragon_parser import (
-    is_threat_dragon_json,
+    load_threat_dragon_json,
     parse_threat_dragon,
 )
 
@@ -32,17 +32,41 @@ TEXT_INPUT_FORMATS = {
 ALL_INPUT_FORMATS = TEXT_INPUT_FORMATS | {INPUT_FORMAT_IMAGE}
 
 
-def detect_input_format(filename: str) -> Optional[str]:
+# .json is absent on purpose: it needs a content sniff for Threat Dragon.
+_EXT_TO_FORMAT = {
+    ".mmd": INPUT_FORMAT_MERMAID,
+    ".mermaid": INPUT_FORMAT_MERMAID,
+    ".drawio": INPUT_FORMAT_DRAWIO,
+    ".xml": INPUT_FORMAT_DRAWIO,
+    ".jpg": INPUT_FORMAT_IMAGE,
+    ".jpeg": INPUT_FORMAT_IMAGE,
+    ".png": INPUT_FORMAT_IMAGE,
+    ".gif": INPUT_FORMAT_IMAGE,
+    ".bmp": INPUT_FORMAT_IMAGE,
+    ".webp": INPUT_FORMAT_IMAGE,
+}
+
+
+def detect_input(filename: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Return the input format of `filename` plus, for Threat Dragon JSON, the
+    document parsed while sniffing it (pass it to load_input as `document`).
+    """
     name = str(filename or "").lower()
-    if name.endswith((".mmd", ".mermaid")):
-        return INPUT_FORMAT_MERMAID
-    if name.endswith((".drawio", ".xml")):
-        return INPUT_FORMAT_DRAWIO
-    if name.endswith(".json") and is_threat_dragon_json(filename):
-        return INPUT_FORMAT_THREAT_DRAGON
-    if name.endswith((".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp")):
-        return INPUT_FORMAT_IMAGE
-    return None
+    _, dot, ext = name.rpartition(".")
+    if not dot:
+        return None, None
+    suffix = f".{ext}"
+    if suffix == ".json":
+        document = load_threat_dragon_json(filename)
+        if document is None:
+            return None, None
+        return INPUT_FORMAT_THREAT_DRAGON, document
+    return _EXT_TO_FORMAT.get(suffix), None
+
+
+def detect_input_format(filename: str) -> Optional[str]:
+    return detect_input(filename)[0]
 
 
 def suffix_for_text_input(input_format: str) -> str:
@@ -65,13 +89,14 @@ def load_input(
     aws_profile: Optional[str] = None,
     aws_region: Optional[str] = None,
     ollama_host: Optional[str] = None,
+    document: Optional[Dict[str, Any]] = None,
 ) -> Tuple[Graph, ImportMetrics]:
     if input_format == INPUT_FORMAT_MERMAID:
         return parse_mermaid(path)
     if input_format == INPUT_FORMAT_DRAWIO:
         return parse_drawio(path, page=drawio_page)
     if input_format == INPUT_FORMAT_THREAT_DRAGON:
-        return parse_threat_dragon(path)
+        return parse_threat_dragon(path, document=document)
     if input_format == INPUT_FORMAT_IR:
         return parse_ir(path)
     if input_format == INPUT_FORMAT_IMAGE:
@@ -0,0 +1,66 @@
+"""
+JSON serialization and parsing helpers backed by orjson.
+"""
+
+import json
+from typing import Any
+
+import orjson
+
+# Line boundaries recognized by str.splitlines, UTF-8 encoded. Raw U+0085,
+# U+2028 and U+2029 are legal inside JSON strings; the control characters are
+# not, but counting them keeps invalid documents consistent with splitlines.
+_LINE_BREAKS = (
+    b"\n",
+    b"\r",
+    b"\v",
+    b"\f",
+    b"\x1c",
+    b"\x1d",
+    b"\x1e",
+    "\x85".encode("utf-8"),
+    "\u2028".encode("utf-8"),
+    "\u2029".encode("utf-8"),
+)
+
+
+def dumps_json(obj: Any, indent: bool = True) -> str:
+    """
+    Serialize ``obj`` like ``json.dumps(obj, ensure_ascii=False, indent=2)``.
+
+    Falls back to the standard library for values orjson rejects (e.g.
+    integers wider than 64 bits).
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    except orjson.JSONEncodeError:
+        pass
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads_json(text: str | bytes) -> Any:
+    """
+    Parse JSON text with orjson.
+
+    Raises json.JSONDecodeError on invalid input (orjson's decode error
+    subclasses it), so callers keep a single except clause.
+    """
+    return orjson.loads(text)
+
+
+def count_json_lines(raw: bytes) -> int:
+    """
+    Count the lines of a UTF-8 JSON document like
+    ``len(raw.decode().splitlines())`` without decoding it.
+
+    Every boundary splitlines recognizes is counted, with ``\\r\\n`` as one.
+    UTF-8 is self-synchronizing, so no other character's encoding contains
+    these byte sequences and the count is exact.
+    """
+    breaks = sum(raw.count(sep) for sep in _LINE_BREAKS) - raw.count(b"\r\n")
+    return breaks + (1 if raw and not raw.endswith(_LINE_BREAKS) else 0)
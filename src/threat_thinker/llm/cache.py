@@ -0,0 +1,118 @@
+"""
+Content-addressed disk cache for validated LLM JSON responses.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+
+DEFAULT_CACHE_DIR = "~/.cache/threat_thinker"
+# Set to a truthy value to bypass the cache without touching CLI flags (e.g. in CI).
+NO_CACHE_ENV = "THREAT_THINKER_NO_CACHE"
+
+# Disabled until configured; library, API and worker callers keep fresh calls.
+_cache_dir: Optional[Path] = None
+
+
+def configure_response_cache(cache_dir: Optional[str]) -> None:
+    """
+    Enable the response cache under ``cache_dir``, or disable it with None.
+    The THREAT_THINKER_NO_CACHE environment variable overrides ``cache_dir``.
+    """
+    global _cache_dir
+    if os.getenv(NO_CACHE_ENV, "").strip().lower() not in ("", "0", "false", "no"):
+        cache_dir = None
+    _cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+
+
+def response_cache_key(*parts: str) -> str:
+    """Hash the request parts (api, model, endpoint, format, prompts) into a key."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def endpoint_identity(
+    api: str,
+    aws_profile: Optional[str] = None,
+    aws_region: Optional[str] = None,
+    ollama_host: Optional[str] = None,
+) -> str:
+    """
+    Describe where a request for ``api`` would be sent, resolving the same
+    environment defaults as the providers, so responses from different
+    endpoints, regions or accounts never share a cache entry.
+    """
+    api = (api or "").lower()
+    if api == "bedrock":
+        profile = aws_profile or os.getenv("AWS_PROFILE") or ""
+        region = aws_region or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
+        return f"{profile}@{region}"
+    if api == "ollama":
+        return ollama_host or os.getenv("OLLAMA_HOST") or "http://localhost:11434"
+    if api == "openai":
+        return os.getenv("OPENAI_BASE_URL") or ""
+    if api == "anthropic":
+        return os.getenv("ANTHROPIC_BASE_URL") or ""
+    return ""
+
+
+def load_cached_response(key: str) -> Optional[dict]:
+    if _cache_dir is None:
+        return None
+    try:
+        with open(_cache_dir / f"{key}.json", "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def store_cached_response(key: str, data: dict) -> None:
+    if _cache_dir is None:
+        return
+    try:
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, _cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # A read-only or full cache directory must not fail the analysis.
+        pass
+
+
+def cached_json_response(
+    api: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    call_fn: Callable[[], dict],
+    endpoint: str = "",
+    request_format: Optional[dict] = None,
+) -> dict:
+    """
+    Return the cached payload for this prompt, or call the LLM and store it.
+
+    ``endpoint`` (see `endpoint_identity`) and ``request_format`` (the
+    response format and schema sent to the provider) are part of the key.
+    """
+    key = response_cache_key(
+        api,
+        model,
+        endpoint,
+        json.dumps(request_format, sort_keys=True),
+        system_prompt,
+        user_prompt,
+    )
+    cached = load_cached_response(key)
+    if cached is not None:
+        return cached
+    data = call_fn()
+    store_cached_response(key, data)
+    return data
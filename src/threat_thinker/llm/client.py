@@ -3,7 +3,7 @@ LLM client functionality
 """
 
 import os
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .providers import get_provider
 
@@ -140,6 +140,42 @@ The overall security risk level appears consistent between the two analyses. The
             max_tokens=max_tokens,
         )
 
+    def call_llm_batch(
+        self,
+        requests: List[Tuple[str, str, str]],
+        *,
+        response_format: Optional[Dict[str, str]] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 1600,
+        poll_interval: float = 30.0,
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """
+        Submit several prompts as one provider batch job and wait for results.
+
+        Args:
+            requests: (custom_id, system_prompt, user_prompt) triples
+            response_format: Optional response format specification
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in each response
+            poll_interval: Initial seconds between batch status polls
+
+        Returns:
+            (outputs, errors) dictionaries keyed by custom_id: response text
+            for completed requests and error details for failed ones
+
+        Raises:
+            NotImplementedError: If provider doesn't support batch requests
+            RuntimeError: If the batch job fails
+        """
+        return self.provider.call_api_batch(
+            model=self.model,
+            requests=requests,
+            response_format=response_format,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            poll_interval=poll_interval,
+        )
+
     def analyze_image_for_graph(
         self,
         base64_image: str,
@@ -3,7 +3,9 @@ LLM inference functions for threat analysis
 """
 
 import json
-from typing import Callable, Dict, List, Optional
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Set, Tuple, Type
 
 from threat_thinker.models import Graph, Threat
 from threat_thinker.constants import (
@@ -11,8 +13,12 @@ from threat_thinker.constants import (
     HINT_INSTRUCTIONS,
     LLM_SYSTEM,
     LLM_INSTRUCTIONS,
+    LLM_RULES,
 )
 from threat_thinker.context_loader import count_tokens
+from threat_thinker.json_utils import dumps_json
+from threat_thinker.threat_analyzer import edge_prompt_dict, node_prompt_dict
+from .cache import cached_json_response, endpoint_identity
 from .client import LLMClient
 from .response_utils import safe_json_loads
 
@@ -21,9 +27,57 @@ HINT_INFERENCE_MAX_TOKENS = 4096
 THREAT_INFERENCE_MAX_TOKENS = (
     10000  # Headroom for 10-12 verbose multilingual threats with evidence metadata
 )
+MAX_THREATS_PER_RESPONSE = 12  # mirrors the cap stated in LLM_RULES
 RERANK_MAX_TOKENS = 1500
 DEFAULT_HOSTED_PROMPT_TOKEN_LIMIT = 60000
 DEFAULT_OLLAMA_PROMPT_TOKEN_LIMIT = 12000
+LANGUAGE_NAMES: Dict[str, str] = {
+    "ja": "Japanese",
+    "fr": "French",
+    "de": "German",
+    "es": "Spanish",
+    "ko": "Korean",
+    "zh": "Chinese",
+    "pt": "Portuguese",
+    "it": "Italian",
+    "ru": "Russian",
+    "ar": "Arabic",
+    "hi": "Hindi",
+    "th": "Thai",
+    "vi": "Vietnamese",
+    "nl": "Dutch",
+    "sv": "Swedish",
+    "da": "Danish",
+    "no": "Norwegian",
+    "fi": "Finnish",
+    "pl": "Polish",
+    "cs": "Czech",
+    "hu": "Hungarian",
+    "tr": "Turkish",
+    "he": "Hebrew",
+    "id": "Indonesian",
+    "ms": "Malay",
+    "tl": "Filipino",
+    "bn": "Bengali",
+    "ta": "Tamil",
+    "te": "Telugu",
+    "ml": "Malayalam",
+    "kn": "Kannada",
+    "gu": "Gujarati",
+    "ur": "Urdu",
+    "fa": "Persian",
+    "uk": "Ukrainian",
+    "bg": "Bulgarian",
+    "hr": "Croatian",
+    "sr": "Serbian",
+    "sk": "Slovak",
+    "sl": "Slovenian",
+    "et": "Estonian",
+    "lv": "Latvian",
+    "lt": "Lithuanian",
+    "mt": "Maltese",
+}
+JSON_OBJECT_RESPONSE_FORMAT: Dict = {"type": "json_object"}
 HINT_JSON_SCHEMA: Dict = {
     "type": "object",
     "properties": {
@@ -70,6 +124,81 @@ THREAT_JSON_SCHEMA: Dict = {
     },
     "required": ["threats"],
 }
+STRUCTURED_OUTPUT_APIS = frozenset({"openai"})
+# (api, endpoint, model) combinations that rejected THREAT_RESPONSE_FORMAT.
+_STRICT_SCHEMA_REJECTED: Set[Tuple[str, str, str]] = set()
+# Strict variant of THREAT_JSON_SCHEMA for providers that enforce the schema
+# server-side (every property required, no extra keys), which lets the prompt
+# drop the prose copy of the output format.
+_STRING_ARRAY: Dict = {"type": "array", "items": {"type": "string"}}
+THREAT_RESPONSE_FORMAT: Dict = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "threat_report",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "threats": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string"},
+                            "stride": _STRING_ARRAY,
+                            "severity": {"enum": ["High", "Medium", "Low"]},
+                            "score": {"type": "integer"},
+                            "affected": _STRING_ARRAY,
+                            "why": {"type": "string"},
+                            "recommended_action": {"type": "string"},
+                            "references": _STRING_ARRAY,
+                            "rag_sources": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "kb": {"type": "string"},
+                                        "source": {"type": "string"},
+                                        "chunk_id": {"type": "string"},
+                                        "score": {"type": "number"},
+                                    },
+                                    "required": ["kb", "source", "chunk_id", "score"],
+                                    "additionalProperties": False,
+                                },
+                            },
+                            "evidence": {
+                                "type": "object",
+                                "properties": {
+                                    "nodes": _STRING_ARRAY,
+                                    "edges": _STRING_ARRAY,
+                                },
+                                "required": ["nodes", "edges"],
+                                "additionalProperties": False,
+                            },
+                            "confidence": {"type": ["number", "null"]},
+                        },
+                        "required": [
+                            "title",
+                            "stride",
+                            "severity",
+                            "score",
+                            "affected",
+                            "why",
+                            "recommended_action",
+                            "references",
+                            "rag_sources",
+                            "evidence",
+                            "confidence",
+                        ],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["threats"],
+            "additionalProperties": False,
+        },
+    },
+}
 RERANK_JSON_SCHEMA: Dict = {
     "type": "object",
     "properties": {
@@ -89,6 +218,10 @@ RERANK_JSON_SCHEMA: Dict = {
 }
 
 
+class PermanentLLMError(ValueError):
+    """Invalid LLM payload that repeating the identical request would not fix."""
+
+
 def _validate_hints_payload(payload: dict) -> None:
     if not isinstance(payload, dict):
         raise ValueError("Hints payload must be a JSON object")
@@ -103,15 +236,17 @@ def _validate_hints_payload(payload: dict) -> None:
         raise ValueError("'policies' must be an object when present")
 
 
-def _validate_threats_payload(payload: dict) -> None:
+def _validate_threats_payload(
+    payload: dict, shape_error: Type[ValueError] = ValueError
+) -> None:
     if not isinstance(payload, dict):
-        raise ValueError("Threat payload must be a JSON object")
+        raise shape_error("Threat payload must be a JSON object")
     threats = payload.get("threats")
     if not isinstance(threats, list):
-        raise ValueError("Threat payload missing 'threats' list")
+        raise shape_error("Threat payload missing 'threats' list")
     for threat in threats:
         if not isinstance(threat, dict):
-            raise ValueError("Each threat entry must be an object")
+            raise shape_error("Each threat entry must be an object")
         if not threat.get("title"):
             raise ValueError("Each threat must include a title")
 
@@ -129,25 +264,45 @@ def _validate_rerank_payload(payload: dict) -> None:
             raise ValueError("Each rerank score entry requires idx and score")
 
 
+def _rejects_strict_schema(status_code: Optional[int], details: List[object]) -> bool:
+    # Context-length and other invalid-parameter errors are also 400s; only a
+    # complaint about the response format means the model lacks strict schemas.
+    if status_code != 400:
+        return False
+    text = " ".join(str(part) for part in details if part).lower()
+    return "response_format" in text or "json_schema" in text
+
+
+def _is_strict_schema_rejection(exc: Exception) -> bool:
+    """Return True when a 400 error rejects the json_schema response format."""
+    parts = [str(exc), getattr(exc, "param", None), getattr(exc, "code", None)]
+    body = getattr(exc, "body", None)
+    if isinstance(body, dict):
+        error = body.get("error", body)
+        if isinstance(error, dict):
+            parts.extend(error.get(key) for key in ("message", "param", "code"))
+    return _rejects_strict_schema(getattr(exc, "status_code", None), parts)
+
+
 def _call_llm_json_with_retry(
     call_fn: Callable[[], str],
     validate_fn: Callable[[dict], None],
     attempts: int = 2,
 ) -> dict:
-    errors: List[Exception] = []
-    for idx in range(attempts):
+    last_exc: Optional[Exception] = None
+    for _ in range(attempts):
         raw = call_fn()
         try:
             data = safe_json_loads(raw)
             validate_fn(data)
             return data
+        except PermanentLLMError as exc:
+            raise RuntimeError(f"LLM returned invalid JSON: {exc}") from exc
         except Exception as exc:  # json decode or validation
-            errors.append(exc)
-            if idx == attempts - 1:
-                raise RuntimeError(
-                    f"LLM returned invalid JSON after {attempts} attempt(s): {exc}"
-                ) from exc
-    raise RuntimeError(f"LLM returned invalid JSON: {errors!r}")
+            last_exc = exc
+    raise RuntimeError(
+        f"LLM returned invalid JSON after {attempts} attempt(s): {last_exc}"
+    ) from last_exc
 
 
 def _get_language_name(lang_code: str) -> str:
@@ -160,53 +315,7 @@ def _get_language_name(lang_code: str) -> str:
     Returns:
         Language name in English
     """
-    lang_names = {
-        "ja": "Japanese",
-        "fr": "French",
-        "de": "German",
-        "es": "Spanish",
-        "ko": "Korean",
-        "zh": "Chinese",
-        "pt": "Portuguese",
-        "it": "Italian",
-        "ru": "Russian",
-        "ar": "Arabic",
-        "hi": "Hindi",
-        "th": "Thai",
-        "vi": "Vietnamese",
-        "nl": "Dutch",
-        "sv": "Swedish",
-        "da": "Danish",
-        "no": "Norwegian",
-        "fi": "Finnish",
-        "pl": "Polish",
-        "cs": "Czech",
-        "hu": "Hungarian",
-        "tr": "Turkish",
-        "he": "Hebrew",
-        "id": "Indonesian",
-        "ms": "Malay",
-        "tl": "Filipino",
-        "bn": "Bengali",
-        "ta": "Tamil",
-        "te": "Telugu",
-        "ml": "Malayalam",
-        "kn": "Kannada",
-        "gu": "Gujarati",
-        "ur": "Urdu",
-        "fa": "Persian",
-        "uk": "Ukrainian",
-        "bg": "Bulgarian",
-        "hr": "Croatian",
-        "sr": "Serbian",
-        "sk": "Slovak",
-        "sl": "Slovenian",
-        "et": "Estonian",
-        "lv": "Latvian",
-        "lt": "Lithuanian",
-        "mt": "Maltese",
-    }
-    return lang_names.get(lang_code, lang_code.upper())
+    return LANGUAGE_NAMES.get(lang_code, lang_code.upper())
 
 
 def default_prompt_token_limit(api: str) -> int:
@@ -277,26 +386,39 @@ def llm_infer_hints(
         f"{HINT_INSTRUCTIONS}"
     )
 
-    # Use LLMClient for better handling
-    llm_client = LLMClient(
-        api=api,
-        model=model,
-        aws_profile=aws_profile,
-        aws_region=aws_region,
-        ollama_host=ollama_host,
-    )
-    data = _call_llm_json_with_retry(
-        lambda: llm_client.call_llm(
-            system_prompt=HINT_SYSTEM,
-            user_prompt=user_prompt,
-            response_format={"type": "json_object"},
-            json_schema=HINT_JSON_SCHEMA,
-            temperature=0.15,
-            max_tokens=HINT_INFERENCE_MAX_TOKENS,
-        ),
-        _validate_hints_payload,
+    def _call() -> dict:
+        # Use LLMClient for better handling
+        llm_client = LLMClient(
+            api=api,
+            model=model,
+            aws_profile=aws_profile,
+            aws_region=aws_region,
+            ollama_host=ollama_host,
+        )
+        return _call_llm_json_with_retry(
+            lambda: llm_client.call_llm(
+                system_prompt=HINT_SYSTEM,
+                user_prompt=user_prompt,
+                response_format=JSON_OBJECT_RESPONSE_FORMAT,
+                json_schema=HINT_JSON_SCHEMA,
+                temperature=0.15,
+                max_tokens=HINT_INFERENCE_MAX_TOKENS,
+            ),
+            _validate_hints_payload,
+        )
+
+    return cached_json_response(
+        api,
+        model,
+        HINT_SYSTEM,
+        user_prompt,
+        _call,
+        endpoint=endpoint_identity(api, aws_profile, aws_region, ollama_host),
+        request_format={
+            "response_format": JSON_OBJECT_RESPONSE_FORMAT,
+            "json_schema": HINT_JSON_SCHEMA,
+        },
     )
-    return data
 
 
 def llm_rerank_chunks(
@@ -350,7 +472,7 @@ def llm_rerank_chunks(
                     "You are a strict relevance ranker for threat-modeling context retrieval."
                 ),
                 user_prompt=user_prompt,
-                response_format={"type": "json_object"},
+                response_format=JSON_OBJECT_RESPONSE_FORMAT,
                 json_schema=RERANK_JSON_SCHEMA,
                 temperature=0.0,
                 max_tokens=RERANK_MAX_TOKENS,
@@ -370,46 +492,34 @@ def llm_rerank_chunks(
     return out_scores
 
 
-def llm_infer_threats(
+def graph_skeleton_json(g: Graph) -> str:
+    """Compact id/label skeleton of `g` for `llm_infer_hints`."""
+    return dumps_json(
+        {
+            "nodes": [{"id": n.id, "label": n.label} for n in g.nodes.values()],
+            "edges": [{"from": e.src, "to": e.dst, "label": e.label} for e in g.edges],
+        },
+        indent=False,
+    )
+
+
+def _graph_prompt_payload(g: Graph) -> str:
+    # Serialized as raw node/edge fields (no zone_path, unlike graph_to_prompt)
+    nodes = [node_prompt_dict(n) for n in g.nodes.values()]
+    edges = [edge_prompt_dict(e) for e in g.edges]
+    return dumps_json({"nodes": nodes, "edges": edges}, indent=False)
+
+
+def _build_threat_user_prompt(
     g: Graph,
-    api: str,
-    model: str,
-    aws_profile: str = None,
-    aws_region: str = None,
-    ollama_host: str = None,
     lang: str = "en",
     rag_context: Optional[str] = None,
     rag_candidates: Optional[List[dict]] = None,
     business_context: Optional[str] = None,
-    prompt_token_limit: Optional[int] = None,
-) -> List[Threat]:
-    """
-    Use LLM to infer threats from graph.
-
-    Args:
-        g: Graph object
-        api: LLM API provider
-        model: Model name
-        aws_profile: AWS profile name (for bedrock provider only)
-        aws_region: AWS region (for bedrock provider only)
-        lang: Language code for output (en, ja, fr, de, es, etc.)
-        rag_context: Optional retrieved knowledge to ground the analysis
-        business_context: Optional full business context document text
-        prompt_token_limit: Optional token limit for the assembled prompt
-
-    Returns:
-        List of Threat objects
-
-    Raises:
-        RuntimeError: If no threats are returned
-    """
-    # Import here to avoid circular import
-    from dataclasses import asdict
-
-    # Convert graph to prompt format (inline to avoid circular import)
-    nodes = [asdict(n) for n in g.nodes.values()]
-    edges = [asdict(e) for e in g.edges]
-    payload = json.dumps({"nodes": nodes, "edges": edges}, ensure_ascii=False, indent=2)
+    structured_output: bool = False,
+    graph_payload: Optional[str] = None,
+) -> str:
+    payload = graph_payload if graph_payload is not None else _graph_prompt_payload(g)
 
     # Simple language instruction approach
     if lang == "en":
@@ -441,64 +551,36 @@ def llm_infer_threats(
             f"Available chunks:\n{candidate_text}\n"
         )
 
-    user_prompt = (
+    return (
         f"System graph (JSON):\n{payload}\n"
         f"{business_context_block}\n"
         f"{context_block}\n"
         f"{rag_source_instruction}\n"
         f"{lang_instruction}Perform threat analysis following the instructions below.\n"
-        f"{LLM_INSTRUCTIONS}"
+        f"{LLM_RULES if structured_output else LLM_INSTRUCTIONS}"
     )
 
-    _validate_prompt_token_limit(
-        system_prompt=LLM_SYSTEM,
-        user_prompt=user_prompt,
-        api=api,
-        model=model,
-        prompt_token_limit=prompt_token_limit,
-    )
-
-    # Use LLMClient for better handling
-    llm_client = LLMClient(
-        api=api,
-        model=model,
-        aws_profile=aws_profile,
-        aws_region=aws_region,
-        ollama_host=ollama_host,
-    )
-    data = _call_llm_json_with_retry(
-        lambda: llm_client.call_llm(
-            system_prompt=LLM_SYSTEM,
-            user_prompt=user_prompt,
-            response_format={"type": "json_object"},
-            json_schema=THREAT_JSON_SCHEMA,
-            temperature=0.15,
-            max_tokens=THREAT_INFERENCE_MAX_TOKENS,
-        ),
-        _validate_threats_payload,
-    )
 
+def _threats_from_payload(data: dict) -> List[Threat]:
     threats_out: List[Threat] = []
-    threat_list = data.get("threats", [])
-
-    # Limit to maximum 12 threats as instructed to LLM
-    if len(threat_list) > 12:
-        threat_list = threat_list[:12]
+    # Limit to the maximum instructed to the LLM; the tail is never touched.
+    threat_list = islice(data.get("threats", []), MAX_THREATS_PER_RESPONSE)
 
     for index, t in enumerate(threat_list):
         # Don't assign ID here - will be assigned after filtering/sorting
-
-        severity = str(t.get("severity", "Medium"))
-        score = float(t.get("score", 4))
-        ev = t.get("evidence") or {}
-        ev_nodes = [str(x) for x in (ev.get("nodes") or [])]
-        ev_edges = [str(x) for x in (ev.get("edges") or [])]
-        conf = t.get("confidence", None)
+        get = t.get
+
+        severity = str(get("severity", "Medium"))
+        score = float(get("score", 4))
+        ev = get("evidence") or {}
+        ev_nodes = list(map(str, ev.get("nodes") or ()))
+        ev_edges = list(map(str, ev.get("edges") or ()))
+        conf = get("confidence", None)
         if isinstance(conf, (int, float)):
             conf = float(conf)
         else:
             conf = None
-        raw_sources = t.get("rag_sources") or []
+        raw_sources = get("rag_sources") or ()
         rag_sources = []
         if isinstance(raw_sources, list):
             for src in raw_sources:
@@ -518,22 +600,262 @@ def llm_infer_threats(
         threats_out.append(
             Threat(
                 id="",  # Empty ID - will be assigned later
-                title=str(t.get("title") or "Untitled"),
-                stride=[str(s) for s in (t.get("stride") or [])],
+                title=str(get("title") or "Untitled"),
+                stride=list(map(str, get("stride") or ())),
                 severity=severity,
                 score=score,
-                affected=[str(a) for a in (t.get("affected") or [])],
-                why=str(t.get("why") or ""),
+                affected=list(map(str, get("affected") or ())),
+                why=str(get("why") or ""),
                 recommended_action=str(
-                    t.get("recommended_action") or "No specific action provided"
+                    get("recommended_action") or "No specific action provided"
                 ),
-                references=[str(r) for r in (t.get("references") or [])],
+                references=list(map(str, get("references") or ())),
                 evidence_nodes=ev_nodes,
                 evidence_edges=ev_edges,
                 confidence=conf,
                 rag_sources=rag_sources,
             )
         )
+    return threats_out
+
+
+def llm_infer_threats(
+    g: Graph,
+    api: str,
+    model: str,
+    aws_profile: str = None,
+    aws_region: str = None,
+    ollama_host: str = None,
+    lang: str = "en",
+    rag_context: Optional[str] = None,
+    rag_candidates: Optional[List[dict]] = None,
+    business_context: Optional[str] = None,
+    prompt_token_limit: Optional[int] = None,
+) -> List[Threat]:
+    """
+    Use LLM to infer threats from graph.
+
+    Args:
+        g: Graph object
+        api: LLM API provider
+        model: Model name
+        aws_profile: AWS profile name (for bedrock provider only)
+        aws_region: AWS region (for bedrock provider only)
+        lang: Language code for output (en, ja, fr, de, es, etc.)
+        rag_context: Optional retrieved knowledge to ground the analysis
+        business_context: Optional full business context document text
+        prompt_token_limit: Optional token limit for the assembled prompt
+
+    Returns:
+        List of Threat objects
+
+    Raises:
+        RuntimeError: If no threats are returned
+    """
+    endpoint = endpoint_identity(api, aws_profile, aws_region, ollama_host)
+    # Shared by the strict-schema attempt and its plain JSON fallback.
+    graph_payload = _graph_prompt_payload(g)
+
+    def _infer(structured_output: bool) -> dict:
+        user_prompt = _build_threat_user_prompt(
+            g,
+            lang,
+            rag_context=rag_context,
+            rag_candidates=rag_candidates,
+            business_context=business_context,
+            structured_output=structured_output,
+            graph_payload=graph_payload,
+        )
+
+        _validate_prompt_token_limit(
+            system_prompt=LLM_SYSTEM,
+            user_prompt=user_prompt,
+            api=api,
+            model=model,
+            prompt_token_limit=prompt_token_limit,
+        )
+
+        response_format = (
+            THREAT_RESPONSE_FORMAT if structured_output else JSON_OBJECT_RESPONSE_FORMAT
+        )
+
+        def _call() -> dict:
+            # Use LLMClient for better handling
+            llm_client = LLMClient(
+                api=api,
+                model=model,
+                aws_profile=aws_profile,
+                aws_region=aws_region,
+                ollama_host=ollama_host,
+            )
+            return _call_llm_json_with_retry(
+                lambda: llm_client.call_llm(
+                    system_prompt=LLM_SYSTEM,
+                    user_prompt=user_prompt,
+                    response_format=response_format,
+                    json_schema=THREAT_JSON_SCHEMA,
+                    temperature=0.15,
+                    max_tokens=THREAT_INFERENCE_MAX_TOKENS,
+                ),
+                # A server-enforced schema makes shape errors deterministic, so
+                # only content problems (e.g. an empty title) are worth a retry.
+                (
+                    partial(_validate_threats_payload, shape_error=PermanentLLMError)
+                    if structured_output
+                    else _validate_threats_payload
+                ),
+            )
+
+        return cached_json_response(
+            api,
+            model,
+            LLM_SYSTEM,
+            user_prompt,
+            _call,
+            endpoint=endpoint,
+            request_format={
+                "response_format": response_format,
+                "json_schema": THREAT_JSON_SCHEMA,
+            },
+        )
+
+    rejection_key = (api.lower(), endpoint, model)
+    structured_output = (
+        api.lower() in STRUCTURED_OUTPUT_APIS
+        and rejection_key not in _STRICT_SCHEMA_REJECTED
+    )
+    try:
+        data = _infer(structured_output)
+    except Exception as exc:
+        # Older or OpenAI-compatible models answer a strict json_schema
+        # request with 400 Bad Request; retry in plain JSON mode and skip the
+        # strict schema for this model from now on.
+        if not structured_output or not _is_strict_schema_rejection(exc):
+            raise
+        _STRICT_SCHEMA_REJECTED.add(rejection_key)
+        data = _infer(False)
+    threats_out = _threats_from_payload(data)
     if not threats_out:
         raise RuntimeError("LLM returned no threats")
     return threats_out
+
+
+def llm_infer_threats_batch(
+    graphs: List[Tuple[str, Graph]],
+    model: str,
+    lang: str = "en",
+    rag_context: Optional[str] = None,
+    rag_candidates: Optional[List[dict]] = None,
+    business_context: Optional[str] = None,
+    prompt_token_limit: Optional[int] = None,
+    poll_interval: float = 30.0,
+) -> Dict[str, List[Threat]]:
+    """
+    Infer threats for one or more graphs through the OpenAI Batch API.
+
+    Batch jobs complete asynchronously (within a 24h window) at a reduced
+    token price, which suits CI sweeps where latency is not critical.
+
+    Args:
+        graphs: (graph_id, Graph) pairs; ids must be unique
+        model: OpenAI model name
+        lang: Language code for output (en, ja, fr, de, es, etc.)
+        rag_context: Optional retrieved knowledge shared by every graph
+        business_context: Optional full business context document text
+        prompt_token_limit: Optional token limit for each assembled prompt
+        poll_interval: Initial seconds between batch status polls
+
+    Returns:
+        Dictionary mapping graph ids to their Threat lists. Graphs whose batch
+        request failed or returned invalid output are omitted.
+
+    Raises:
+        RuntimeError: If no graph produced threats; the message lists the
+            per-graph errors
+    """
+    if not graphs:
+        return {}
+    graphs_by_id = dict(graphs)
+    llm_client = LLMClient(api="openai", model=model)
+
+    def _requests(
+        ids: List[str], structured_output: bool
+    ) -> List[Tuple[str, str, str]]:
+        requests: List[Tuple[str, str, str]] = []
+        for graph_id in ids:
+            user_prompt = _build_threat_user_prompt(
+                graphs_by_id[graph_id],
+                lang,
+                rag_context=rag_context,
+                rag_candidates=rag_candidates,
+                business_context=business_context,
+                structured_output=structured_output,
+            )
+            _validate_prompt_token_limit(
+                system_prompt=LLM_SYSTEM,
+                user_prompt=user_prompt,
+                api="openai",
+                model=model,
+                prompt_token_limit=prompt_token_limit,
+            )
+            requests.append((graph_id, LLM_SYSTEM, user_prompt))
+        return requests
+
+    def _submit(ids: List[str], structured_output: bool):
+        return llm_client.call_llm_batch(
+            _requests(ids, structured_output),
+            response_format=(
+                THREAT_RESPONSE_FORMAT
+                if structured_output
+                else JSON_OBJECT_RESPONSE_FORMAT
+            ),
+            temperature=0.15,
+            max_tokens=THREAT_INFERENCE_MAX_TOKENS,
+            poll_interval=poll_interval,
+        )
+
+    graph_ids = [graph_id for graph_id, _ in graphs]
+    rejection_key = ("openai", endpoint_identity("openai"), model)
+    structured_output = rejection_key not in _STRICT_SCHEMA_REJECTED
+    raw_outputs, errors = _submit(graph_ids, structured_output)
+
+    rejected = [
+        graph_id
+        for graph_id, error in errors.items()
+        if _rejects_strict_schema(
+            error.get("status_code"),
+            [error.get("message"), error.get("param"), error.get("code")],
+        )
+    ]
+    if structured_output and rejected:
+        # Same fallback as llm_infer_threats: resubmit the rejected requests
+        # in plain JSON mode and skip the strict schema for this model.
+        _STRICT_SCHEMA_REJECTED.add(rejection_key)
+        retry_outputs, retry_errors = _submit(rejected, False)
+        for graph_id in rejected:
+            errors.pop(graph_id, None)
+        raw_outputs.update(retry_outputs)
+        errors.update(retry_errors)
+
+    results: Dict[str, List[Threat]] = {}
+    for graph_id in graph_ids:
+        raw = raw_outputs.get(graph_id)
+        if not raw:
+            continue
+        try:
+            data = safe_json_loads(raw)
+            _validate_threats_payload(data)
+        except (json.JSONDecodeError, ValueError) as exc:
+            errors[graph_id] = {"message": f"invalid threat JSON: {exc}"}
+            continue
+        threats_out = _threats_from_payload(data)
+        if threats_out:
+            results[graph_id] = threats_out
+    if not results:
+        details = "; ".join(
+            f"{graph_id}: {error.get('message')}" for graph_id, error in errors.items()
+        )
+        raise RuntimeError(
+            "LLM returned no threats" + (f" ({details})" if details else "")
+        )
+    return results
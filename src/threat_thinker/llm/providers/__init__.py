@@ -3,7 +3,7 @@ LLM providers base classes and interfaces
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class LLMProvider(ABC):
@@ -73,6 +73,39 @@ class LLMProvider(ABC):
         """
         raise NotImplementedError("Image analysis not implemented for this provider")
 
+    def call_api_batch(
+        self,
+        model: str,
+        requests: List[Tuple[str, str, str]],
+        *,
+        response_format: Optional[Dict[str, str]] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 1600,
+        poll_interval: float = 30.0,
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """
+        Run several prompts through the provider's asynchronous batch endpoint.
+        Default implementation raises NotImplementedError.
+
+        Args:
+            model: Model name
+            requests: (custom_id, system_prompt, user_prompt) triples
+            response_format: Optional response format specification
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in each response
+            poll_interval: Initial seconds between batch status polls
+
+        Returns:
+            (outputs, errors): outputs maps custom_id to the response text for
+            every request that completed successfully; errors maps the
+            custom_id of every failed request to its status_code, code, param
+            and message
+
+        Raises:
+            NotImplementedError: If provider doesn't support batch requests
+        """
+        raise NotImplementedError("Batch requests not implemented for this provider")
+
 
 def get_provider(
     api: str,
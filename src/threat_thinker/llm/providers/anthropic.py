@@ -3,6 +3,7 @@ Anthropic Claude LLM provider implementation
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 from anthropic import Anthropic
 
@@ -19,7 +20,7 @@ class AnthropicProvider(LLMProvider):
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise RuntimeError("ANTHROPIC_API_KEY is not set")
-        self.client = Anthropic(api_key=api_key)
+        self.client = _shared_client(api_key)
 
     def call_api(
         self,
@@ -147,3 +148,12 @@ class AnthropicProvider(LLMProvider):
 
         except Exception as e:
             raise RuntimeError(f"Claude image analysis failed: {str(e)}")
+
+
+@lru_cache(maxsize=4)
+def _shared_client(api_key: str) -> Anthropic:
+    """
+    Return a process-wide Anthropic client for the given API key so hint and
+    threat calls reuse one HTTP connection pool.
+    """
+    return Anthropic(api_key=api_key)
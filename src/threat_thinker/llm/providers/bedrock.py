@@ -4,6 +4,7 @@ AWS Bedrock LLM provider implementation
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
@@ -31,13 +32,7 @@ class BedrockProvider(LLMProvider):
         region = aws_region or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
 
         try:
-            # Initialize AWS session
-            if aws_profile:
-                session = boto3.Session(profile_name=aws_profile, region_name=region)
-                self.client = session.client("bedrock-runtime")
-            else:
-                # Use default credentials (environment variables or IAM role)
-                self.client = boto3.client("bedrock-runtime", region_name=region)
+            self.client = _shared_session(aws_profile, region).client("bedrock-runtime")
 
         except NoCredentialsError:
             raise RuntimeError(
@@ -215,3 +210,16 @@ class BedrockProvider(LLMProvider):
             )
         except Exception as e:
             raise RuntimeError(f"Bedrock image analysis failed: {str(e)}")
+
+
+@lru_cache(maxsize=4)
+def _shared_session(aws_profile: Optional[str], region: str) -> boto3.Session:
+    """
+    Return a process-wide boto3 session per profile and region so repeated
+    providers reuse its loaded config and service models. Clients are still
+    created per provider, and botocore refreshes expiring credentials (SSO,
+    assumed roles, instance metadata) through the session's resolver.
+    """
+    # Initialize AWS session; without a profile it uses default credentials
+    # (environment variables or IAM role)
+    return boto3.Session(profile_name=aws_profile, region_name=region)
@@ -2,12 +2,22 @@
 OpenAI LLM provider implementation
 """
 
+import json
+import logging
 import os
-from typing import Dict, Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from openai import OpenAI
 
 from . import LLMProvider
 
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_MAX_POLL_INTERVAL = 300.0
+BATCH_TERMINAL_FAILURES = {"failed", "expired", "cancelled"}
+
+logger = logging.getLogger(__name__)
+
 
 class OpenAIProvider(LLMProvider):
     """
@@ -16,9 +26,10 @@ class OpenAIProvider(LLMProvider):
 
     def __init__(self):
         """Initialize OpenAI provider."""
-        if not os.getenv("OPENAI_API_KEY"):
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
             raise RuntimeError("OPENAI_API_KEY is not set")
-        self.client = OpenAI()
+        self.client = _shared_client(api_key, os.getenv("OPENAI_BASE_URL"))
 
     def call_api(
         self,
@@ -48,37 +59,142 @@ class OpenAIProvider(LLMProvider):
         Raises:
             RuntimeError: If response is empty
         """
-        # gpt-5 models don't need temperature
-        if model.startswith("gpt-5"):
-            kwargs = {
-                "model": model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-            }
-        else:
-            kwargs = {
-                "model": model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                "temperature": temperature,
-                "max_completion_tokens": max_tokens,
-            }
-        if response_format is not None:
-            kwargs["response_format"] = response_format
-        if json_schema and response_format is None:
-            # Future-proof: allow json_schema passthrough if response_format not set
-            kwargs["response_format"] = {"type": "json_object"}
-
+        kwargs = _chat_completion_kwargs(
+            model,
+            system_prompt,
+            user_prompt,
+            response_format=response_format,
+            json_schema=json_schema,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
         resp = self.client.chat.completions.create(**kwargs)
         content = resp.choices[0].message.content
         if not content:
             raise RuntimeError("LLM returned empty content")
         return content
 
+    def call_api_batch(
+        self,
+        model: str,
+        requests: List[Tuple[str, str, str]],
+        *,
+        response_format: Optional[Dict[str, str]] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 10000,
+        poll_interval: float = 30.0,
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """
+        Run chat completions through the OpenAI Batch API.
+
+        Uploads the requests as JSONL, creates a batch job, polls it with
+        exponential backoff until it finishes, and collates the output and
+        error files.
+
+        Args:
+            model: Model name
+            requests: (custom_id, system_prompt, user_prompt) triples
+            response_format: Optional response format specification
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in each response
+            poll_interval: Initial seconds between batch status polls
+
+        Returns:
+            (outputs, errors): outputs maps custom_id to response content for
+            every request that completed successfully; errors maps the
+            custom_id of every failed request to its status_code, code, param
+            and message
+
+        Raises:
+            RuntimeError: If the batch job fails, expires, or is cancelled
+        """
+        lines = []
+        for custom_id, system_prompt, user_prompt in requests:
+            body = _chat_completion_kwargs(
+                model,
+                system_prompt,
+                user_prompt,
+                response_format=response_format,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    },
+                    ensure_ascii=False,
+                )
+            )
+        batch_input = ("\n".join(lines) + "\n").encode("utf-8")
+
+        input_file = self.client.files.create(
+            file=("threat-thinker-batch.jsonl", batch_input), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+
+        delay = max(0.0, poll_interval)
+        while batch.status != "completed":
+            if batch.status in BATCH_TERMINAL_FAILURES:
+                details = [
+                    getattr(error, "message", None) or str(error)
+                    for error in (getattr(batch.errors, "data", None) or [])
+                ]
+                suffix = f": {'; '.join(details)}" if details else ""
+                raise RuntimeError(
+                    f"OpenAI batch {batch.id} ended with status '{batch.status}'"
+                    f"{suffix}"
+                )
+            time.sleep(delay)
+            delay = min(BATCH_MAX_POLL_INTERVAL, max(1.0, delay * 2))
+            batch = self.client.batches.retrieve(batch.id)
+
+        results: Dict[str, str] = {}
+        errors: Dict[str, Dict[str, Any]] = {}
+        # Successful requests land in the output file and failed ones in the
+        # error file; either may be absent when every request went one way.
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                custom_id = entry.get("custom_id")
+                response = entry.get("response") or {}
+                if entry.get("error") or response.get("status_code") != 200:
+                    errors[custom_id] = _batch_entry_error(entry)
+                    logger.warning(
+                        "OpenAI batch %s request %s failed: %s",
+                        batch.id,
+                        custom_id,
+                        errors[custom_id]["message"],
+                    )
+                    continue
+                choices = (response.get("body") or {}).get("choices") or []
+                content = (
+                    (choices[0].get("message") or {}).get("content")
+                    if choices
+                    else None
+                )
+                if content:
+                    results[custom_id] = content
+                else:
+                    errors[custom_id] = {
+                        "status_code": 200,
+                        "code": None,
+                        "param": None,
+                        "message": "empty response content",
+                    }
+        return results, errors
+
     def analyze_image(
         self,
         model: str,
@@ -139,3 +255,63 @@ class OpenAIProvider(LLMProvider):
             )
         except Exception as e:
             raise RuntimeError(f"OpenAI Responses API image analysis failed: {e}")
+
+
+@lru_cache(maxsize=4)
+def _shared_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    """
+    Return a process-wide OpenAI client for the given credentials so hint,
+    threat, rerank and diff calls reuse one HTTP connection pool.
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+def _batch_entry_error(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a failed Batch API output line into status_code/code/param/message."""
+    response = entry.get("response") or {}
+    error = entry.get("error") or (response.get("body") or {}).get("error") or {}
+    status_code = response.get("status_code")
+    return {
+        "status_code": status_code,
+        "code": error.get("code"),
+        "param": error.get("param"),
+        "message": error.get("message") or f"HTTP {status_code}",
+    }
+
+
+def _chat_completion_kwargs(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    *,
+    response_format: Optional[Dict[str, str]] = None,
+    json_schema: Optional[Dict] = None,
+    temperature: float = 0.2,
+    max_tokens: int = 10000,
+) -> Dict[str, Any]:
+    """Build chat.completions parameters shared by direct and batch calls."""
+    # gpt-5 models don't need temperature
+    if model.startswith("gpt-5"):
+        kwargs = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+    else:
+        kwargs = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": temperature,
+            "max_completion_tokens": max_tokens,
+        }
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+    if json_schema and response_format is None:
+        # Future-proof: allow json_schema passthrough if response_format not set
+        kwargs["response_format"] = {"type": "json_object"}
+    return kwargs
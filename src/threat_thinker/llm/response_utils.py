@@ -3,7 +3,18 @@ Utility functions for parsing LLM responses
 """
 
 import json
+import logging
 import re
+from typing import List
+
+from threat_thinker.json_utils import loads_json
+
+logger = logging.getLogger(__name__)
+
+_JSON_CLOSERS = {"{": "}", "[": "]"}
+# String literals (group 1 is empty when one runs to the end of the input)
+# and structural brackets; everything else is irrelevant to repair.
+_JSON_STRUCTURE_RE = re.compile(r'"(?:[^"\\]|\\.)*("?)|[{}\[\]]', re.DOTALL)
 
 
 def clean_json_response(response: str) -> str:
@@ -19,26 +30,23 @@ def clean_json_response(response: str) -> str:
     """
     # Remove common markdown markers
     response = response.strip()
+    if not response.startswith("```") and not response.endswith("```"):
+        return response  # no fences (the JSON-mode common case)
 
-    # Remove ```json and ``` markers
-    if response.startswith("```json"):
-        response = response[7:]  # Remove '```json'
-    elif response.startswith("```"):
-        response = response[3:]  # Remove '```'
-
-    if response.endswith("```"):
-        response = response[:-3]  # Remove trailing '```'
-
-    # Strip whitespace again
-    response = response.strip()
-
-    return response
+    # Remove ```json and ``` markers, then strip whitespace again
+    response = response.removeprefix("```json").removeprefix("```")
+    return response.removesuffix("```").strip()
 
 
 def fix_truncated_json(json_str: str) -> str:
     """
     Attempt to fix truncated JSON by properly closing arrays and objects.
 
+    Scans the structure once (string literals are skipped whole, so brackets
+    inside them are ignored), cuts the text back to the last point where the
+    document can be closed cleanly, and appends the closers still open there
+    in the right order.
+
     Args:
         json_str: Potentially truncated JSON string
 
@@ -51,55 +59,36 @@ def fix_truncated_json(json_str: str) -> str:
         return json_str  # Already valid
     except json.JSONDecodeError:
         pass
-
-    # Count unclosed brackets and braces
-    open_braces = json_str.count("{")
-    close_braces = json_str.count("}")
-    open_brackets = json_str.count("[")
-    close_brackets = json_str.count("]")
-
-    # Remove any trailing incomplete content after the last complete threat
-    # Look for the pattern that indicates we're in the middle of a threat definition
-    lines = json_str.split("\n")
-    fixed_lines = []
-    in_truncated_section = False
-
-    for i, line in enumerate(lines):
-        # If we find a line that looks like it's starting a new object but incomplete
-        if '"id":' in line or '"title":' in line:
-            # Check if this line is properly formatted
-            if line.strip().endswith(",") or line.strip().endswith('"'):
-                fixed_lines.append(line)
-            else:
-                # This looks like a truncated line, stop here
-                in_truncated_section = True
-                break
-        elif not in_truncated_section:
-            fixed_lines.append(line)
-
-    # Reconstruct the JSON
-    fixed_json = "\n".join(fixed_lines)
-
-    # Remove trailing comma if it exists before closing
-    fixed_json = re.sub(r",(\s*[}\]])", r"\1", fixed_json)
-
-    # Count brackets again after cleanup
-    open_braces = fixed_json.count("{")
-    close_braces = fixed_json.count("}")
-    open_brackets = fixed_json.count("[")
-    close_brackets = fixed_json.count("]")
-
-    # Add missing closing brackets and braces
-    missing_brackets = open_brackets - close_brackets
-    missing_braces = open_braces - close_braces
-
-    for _ in range(missing_brackets):
-        fixed_json += "]"
-
-    for _ in range(missing_braces):
-        fixed_json += "}"
-
-    return fixed_json
+    return _close_truncated_json(json_str)
+
+
+def _close_truncated_json(json_str: str) -> str:
+    stack: List[str] = []
+    safe_end = 0
+    safe_stack: List[str] = []
+    for match in _JSON_STRUCTURE_RE.finditer(json_str):
+        token = match.group()
+        if token[0] == '"':
+            if not match.group(1):
+                break  # string literal cut off by the truncation
+            continue
+        if token in "{[":
+            in_array = bool(stack) and stack[-1] == "["
+            stack.append(token)
+            if in_array:
+                # A just-opened array element is incomplete; closing it here
+                # would invent an empty element, so keep the previous cut.
+                continue
+        elif stack and _JSON_CLOSERS[stack[-1]] == token:
+            stack.pop()
+        else:
+            break  # unbalanced closer; keep the last good prefix
+        # Everything up to here is complete or closable as-is.
+        safe_end = match.end()
+        safe_stack = stack.copy()
+
+    closers = "".join(_JSON_CLOSERS[opener] for opener in reversed(safe_stack))
+    return json_str[:safe_end] + closers
 
 
 def safe_json_loads(response: str) -> dict:
@@ -115,20 +104,26 @@ def safe_json_loads(response: str) -> dict:
     Raises:
         json.JSONDecodeError: If JSON parsing fails after cleanup
     """
-    cleaned_response = clean_json_response(response)
-
-    # First try to parse as-is
+    # Providers in JSON mode return bare JSON; skip cleanup in that case.
     try:
-        return json.loads(cleaned_response)
+        return loads_json(response)
     except json.JSONDecodeError as e:
-        print(f"Initial JSON parse failed: {e}")
+        error = e
 
-        # Try to fix truncated JSON
+    cleaned_response = clean_json_response(response)
+    if cleaned_response != response:
         try:
-            fixed_response = fix_truncated_json(cleaned_response)
-            print("Fixed response:", fixed_response)
-            return json.loads(fixed_response)
-        except json.JSONDecodeError as e2:
-            print(f"Failed to fix truncated JSON: {e2}")
-            # Re-raise the original error
-            raise e
+            return loads_json(cleaned_response)
+        except json.JSONDecodeError as e:
+            error = e
+    logger.debug("Initial JSON parse failed: %s", error)
+
+    # Try to fix truncated JSON; known invalid, so skip fix_truncated_json's check
+    try:
+        fixed_response = _close_truncated_json(cleaned_response)
+        logger.debug("Fixed response: %s", fixed_response)
+        return json.loads(fixed_response)
+    except json.JSONDecodeError as e2:
+        logger.debug("Failed to fix truncated JSON: %s", e2)
+        # Re-raise the original error
+        raise error
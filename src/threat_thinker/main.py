@@ -39,12 +39,13 @@ Examples:
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
 import time
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as package_version
 from pathlib import Path
@@ -55,13 +56,21 @@ from threat_thinker.input_loader import (
     INPUT_FORMAT_IR,
     INPUT_FORMAT_MERMAID,
     INPUT_FORMAT_THREAT_DRAGON,
-    detect_input_format,
+    detect_input,
     load_input,
 )
 from threat_thinker.hint_processor import merge_llm_hints
+from threat_thinker.json_utils import dumps_json
+from threat_thinker.llm.cache import (
+    DEFAULT_CACHE_DIR,
+    configure_response_cache,
+    endpoint_identity,
+)
 from threat_thinker.llm.inference import (
+    graph_skeleton_json,
     llm_infer_hints,
     llm_infer_threats,
+    llm_infer_threats_batch,
     llm_rerank_chunks,
 )
 from threat_thinker.threat_analyzer import denoise_threats
@@ -80,8 +89,7 @@ from threat_thinker.context_loader import (
     format_context_documents,
     load_context_documents,
 )
-from threat_thinker.rag import (
-    KnowledgeBaseError,
+from threat_thinker.rag.constants import (
     DEFAULT_CHUNK_OVERLAP,
     DEFAULT_CHUNK_TOKENS,
     DEFAULT_EMBED_MODEL,
@@ -90,22 +98,11 @@ from threat_thinker.rag import (
     DEFAULT_RAG_RERANKER,
     DEFAULT_RAG_CANDIDATES,
     DEFAULT_RAG_MIN_SCORE,
+    DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_FILENAME,
     RAG_STRATEGIES,
     RAG_RERANKERS,
-    RetrievalOptions,
-    build_kb,
-    list_kbs,
-    search_kb,
-    remove_kb,
-    retrieve_context_for_graph,
-    attach_rag_sources_to_threats,
-    get_kb_root,
 )
-from threat_thinker.serve.api import create_app
-from threat_thinker.serve.config import load_config
-from threat_thinker.worker.main import run_worker
-import threat_thinker.webui as webui
-import uvicorn
 
 
 def _read_pyproject_version() -> str | None:
@@ -170,10 +167,10 @@ def _prepare_diff_output_paths(
     return target_dir, json_path, md_path
 
 
-def _select_think_input(args) -> tuple[str, str]:
+def _select_think_input(args) -> tuple[str, str, dict | None]:
     if args.diagram:
         diagram_file = args.diagram
-        diagram_format = detect_input_format(diagram_file)
+        diagram_format, document = detect_input(diagram_file)
         if not diagram_format:
             if diagram_file.lower().endswith(".json"):
                 ui.error(
@@ -186,17 +183,17 @@ def _select_think_input(args) -> tuple[str, str]:
                     "Supported: Mermaid (.mmd/.mermaid), Draw.io (.drawio/.xml), Threat Dragon JSON (.json), or images (.jpg/.jpeg/.png/.gif/.bmp/.webp). Use --ir for native IR JSON.",
                 )
             sys.exit(2)
-        return diagram_file, diagram_format
+        return diagram_file, diagram_format, document
     if args.mermaid:
-        return args.mermaid, INPUT_FORMAT_MERMAID
+        return args.mermaid, INPUT_FORMAT_MERMAID, None
     if args.drawio:
-        return args.drawio, INPUT_FORMAT_DRAWIO
+        return args.drawio, INPUT_FORMAT_DRAWIO, None
     if args.threat_dragon:
-        return args.threat_dragon, INPUT_FORMAT_THREAT_DRAGON
+        return args.threat_dragon, INPUT_FORMAT_THREAT_DRAGON, None
     if args.image:
-        return args.image, INPUT_FORMAT_IMAGE
+        return args.image, INPUT_FORMAT_IMAGE, None
     if args.ir:
-        return args.ir, INPUT_FORMAT_IR
+        return args.ir, INPUT_FORMAT_IR, None
 
     ui.error(
         "No diagram file specified",
@@ -205,14 +202,28 @@ def _select_think_input(args) -> tuple[str, str]:
     sys.exit(2)
 
 
-def main():
+class _VersionAction(argparse.Action):
+    """Like action="version", but reads the version when invoked, not when built."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, help=None):
+        super().__init__(
+            option_strings, dest, default=argparse.SUPPRESS, nargs=0, help=help
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(format_version_output())
+        parser.exit()
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # Built once per process; parse_args() does not mutate the parser.
     p = argparse.ArgumentParser(prog="threat_thinker", description="Threat Thinker CLI")
     p.add_argument(
         "-v",
         "--version",
         "--verison",
-        action="version",
-        version=format_version_output(),
+        action=_VersionAction,
         help="Show the installed Threat Thinker version",
     )
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -292,6 +303,24 @@ def main():
         help="Fail if the assembled threat prompt exceeds this token budget.",
     )
 
+    p_think.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit threat inference through the OpenAI Batch API (lower cost, completes asynchronously within 24h)",
+    )
+
+    p_think.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing cached responses for identical prompts",
+    )
+    p_think.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached LLM responses (default: {DEFAULT_CACHE_DIR})",
+    )
+
     p_think.add_argument(
         "--topn", type=int, default=10, help="Keep top-N threats after de-noise"
     )
@@ -359,6 +388,17 @@ def main():
         default=DEFAULT_RAG_MIN_SCORE,
         help=f"Minimum normalized retrieval score [0..1] after reranking (default: {DEFAULT_RAG_MIN_SCORE})",
     )
+    p_think.add_argument(
+        "--rag-cache",
+        action="store_true",
+        help="Reuse a previous retrieval when the graph query embeds close to one already answered",
+    )
+    p_think.add_argument(
+        "--rag-cache-threshold",
+        type=float,
+        default=DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+        help=f"Minimum query cosine similarity [0..1] for --rag-cache hits (default: {DEFAULT_SEMANTIC_CACHE_THRESHOLD})",
+    )
 
     p_kb = sub.add_parser("kb", help="Manage local knowledge bases for RAG")
     p_kb.add_argument(
@@ -481,8 +521,11 @@ def main():
     p_worker.add_argument(
         "--config", type=str, required=True, help="Path to serve YAML configuration"
     )
+    return p
 
-    args = p.parse_args()
+
+def main():
+    args = _build_parser().parse_args()
 
     if args.cmd == "version":
         print(format_version_output())
@@ -500,14 +543,7 @@ def main():
         )  # Parse, Infer hints, (Context), (Retrieve), Analyze threats, Denoise, Export
 
         # Determine diagram file and format
-        diagram_file, diagram_format = _select_think_input(args)
-
-        supported_apis = ["openai", "anthropic", "bedrock", "ollama"]
-        if args.llm_api.lower() not in supported_apis:
-            ui.error(
-                f"Invalid LLM API: {args.llm_api}", f"Must be one of {supported_apis}"
-            )
-            sys.exit(2)
+        diagram_file, diagram_format, diagram_document = _select_think_input(args)
 
         supported_apis = ["openai", "anthropic", "bedrock", "ollama"]
         if args.llm_api.lower() not in supported_apis:
@@ -557,6 +593,17 @@ def main():
 
         rag_kbs: list[str] = []
         if args.rag:
+            # numpy/tiktoken are only needed once retrieval is requested.
+            from threat_thinker.rag import (
+                KnowledgeBaseError,
+                RetrievalOptions,
+                SemanticCache,
+                attach_rag_sources_to_threats,
+                get_kb_root,
+                load_kb_bundles,
+                retrieve_context_for_graph,
+            )
+
             if not os.getenv("OPENAI_API_KEY"):
                 ui.error(
                     "OPENAI_API_KEY is required for --rag",
@@ -585,174 +632,236 @@ def main():
             if args.rag_min_score < 0.0 or args.rag_min_score > 1.0:
                 ui.error("--rag-min-score must be between 0 and 1.")
                 sys.exit(2)
+            if args.rag_cache_threshold < 0.0 or args.rag_cache_threshold > 1.0:
+                ui.error("--rag-cache-threshold must be between 0 and 1.")
+                sys.exit(2)
+        if args.batch_api and args.llm_api.lower() != "openai":
+            ui.error(
+                "--batch-api requires --llm-api openai",
+                "The Batch API is only available for the OpenAI provider.",
+            )
+            sys.exit(2)
         if args.prompt_token_limit is not None and args.prompt_token_limit <= 0:
             ui.error("--prompt-token-limit must be a positive integer.")
             sys.exit(2)
 
-        # 1) Parse diagram to skeleton graph (+ metrics)
-        ui.step("Parsing architecture diagram")
-        ui.info(f"Loading {diagram_format} diagram: {diagram_file}")
-
-        thinking = ui.create_thinking_indicator("Parsing diagram structure")
-        thinking.start()
-
+        configure_response_cache(None if args.no_cache else args.cache_dir)
+
+        # Business context documents and knowledge bases do not depend on the
+        # diagram, so read them in the background while parsing and hint
+        # inference wait on their LLM round-trips. Retrieval itself needs the
+        # hint-enriched graph and still runs afterwards.
+        background_executor = None
+        context_future = None
+        kb_future = None
+        if args.context or args.rag:
+            background_executor = ThreadPoolExecutor(max_workers=2)
         try:
-            g, metrics = load_input(
-                diagram_format,
-                diagram_file,
-                drawio_page=args.drawio_page,
-                api=args.llm_api,
-                model=args.llm_model,
-                aws_profile=args.aws_profile,
-                aws_region=args.aws_region,
-                ollama_host=ollama_host,
-            )
-
-            thinking.stop()
-            ui.success("Successfully parsed diagram")
-            ui.show_metrics_summary(metrics)
-            ui.debug("Parsed graph details", str(g))
-
-        except Exception as e:
-            thinking.stop()
-            ui.error("Failed to parse diagram", str(e))
-            sys.exit(2)
-
-        # 2) (Optional) LLM-based attribute inference from skeleton
-        if args.infer_hints:
-            ui.step("Inferring node and edge attributes")
-            ui.thinking(
-                "AI is analyzing diagram components to infer security-relevant attributes"
-            )
+            if args.context:
+                context_future = background_executor.submit(
+                    load_context_documents, args.context, args.llm_model
+                )
+            if args.rag:
+                kb_future = background_executor.submit(load_kb_bundles, rag_kbs)
 
-            skeleton = json.dumps(
-                {
-                    "nodes": [{"id": n.id, "label": n.label} for n in g.nodes.values()],
-                    "edges": [
-                        {"from": e.src, "to": e.dst, "label": e.label} for e in g.edges
-                    ],
-                },
-                ensure_ascii=False,
-                indent=2,
-            )
+            # 1) Parse diagram to skeleton graph (+ metrics)
+            ui.step("Parsing architecture diagram")
+            ui.info(f"Loading {diagram_format} diagram: {diagram_file}")
 
-            thinking = ui.create_thinking_indicator(
-                "AI is inferring component attributes"
-            )
-            thinking.start()
+            # One indicator serves every phase; each start() just swaps the message.
+            thinking = ui.create_thinking_indicator()
+            thinking.start("Parsing diagram structure")
 
             try:
-                inferred = llm_infer_hints(
-                    skeleton,
-                    args.llm_api,
-                    args.llm_model,
-                    args.aws_profile,
-                    args.aws_region,
-                    ollama_host,
-                    args.lang,
+                g, metrics = load_input(
+                    diagram_format,
+                    diagram_file,
+                    drawio_page=args.drawio_page,
+                    api=args.llm_api,
+                    model=args.llm_model,
+                    aws_profile=args.aws_profile,
+                    aws_region=args.aws_region,
+                    ollama_host=ollama_host,
+                    document=diagram_document,
                 )
-                g = merge_llm_hints(g, inferred)
+
                 thinking.stop()
-                ui.success("Successfully inferred component attributes")
-                ui.debug("Graph after LLM-inferred hints", str(g))
+                ui.success("Successfully parsed diagram")
+                ui.show_metrics_summary(metrics)
+                ui.debug("Parsed graph details", str(g))
 
             except Exception as e:
                 thinking.stop()
-                ui.error("Failed to infer hints", str(e))
+                ui.error("Failed to parse diagram", str(e))
                 sys.exit(2)
-        else:
-            ui.step("Skipping attribute inference")
-            ui.info("Using basic component attributes from diagram")
 
-        business_context_text = None
-        if args.context:
-            ui.step("Loading business context")
-            try:
-                context_docs = load_context_documents(args.context, args.llm_model)
-                doc_count, token_count, sources = context_summary(context_docs)
-                business_context_text = format_context_documents(context_docs)
-                ui.success(
-                    f"Loaded {doc_count} business context document(s), approximately {token_count} tokens"
+            # 2) (Optional) LLM-based attribute inference from skeleton
+            if args.infer_hints:
+                ui.step("Inferring node and edge attributes")
+                ui.thinking(
+                    "AI is analyzing diagram components to infer security-relevant attributes"
                 )
-                ui.info(f"Context documents: {', '.join(sources)}")
-            except ContextDocumentError as e:
-                ui.error("Failed to load business context", str(e))
-                sys.exit(2)
 
-        rag_context_text = None
-        retrieval = None
-        rerank_fn = None
-        if args.rag:
-            ui.step("Retrieving local knowledge")
-            try:
-                retrieval_options = RetrievalOptions(
-                    strategy=args.rag_strategy,
-                    reranker=args.rag_reranker,
-                    candidates=args.rag_candidates,
-                    min_score=args.rag_min_score,
-                )
-                if args.rag_reranker in {"auto", "llm"}:
-
-                    def _rerank_with_llm(q, candidates):
-                        return llm_rerank_chunks(
-                            q,
-                            candidates,
-                            args.llm_api,
-                            args.llm_model,
-                            args.aws_profile,
-                            args.aws_region,
-                            ollama_host,
-                        )
+                skeleton = graph_skeleton_json(g)
 
-                    rerank_fn = _rerank_with_llm
-                retrieval = retrieve_context_for_graph(
-                    g,
-                    rag_kbs,
-                    topk=args.rag_topk or DEFAULT_TOPK,
-                    options=retrieval_options,
-                    rerank_fn=rerank_fn,
-                )
-                rag_context_text = retrieval.get("context_text") or ""
-                num_chunks = len(retrieval.get("results", []))
-                if rag_context_text and num_chunks:
+                thinking.start("AI is inferring component attributes")
+
+                try:
+                    inferred = llm_infer_hints(
+                        skeleton,
+                        args.llm_api,
+                        args.llm_model,
+                        args.aws_profile,
+                        args.aws_region,
+                        ollama_host,
+                        args.lang,
+                    )
+                    g = merge_llm_hints(g, inferred)
+                    thinking.stop()
+                    ui.success("Successfully inferred component attributes")
+                    ui.debug("Graph after LLM-inferred hints", str(g))
+
+                except Exception as e:
+                    thinking.stop()
+                    ui.error("Failed to infer hints", str(e))
+                    sys.exit(2)
+            else:
+                ui.step("Skipping attribute inference")
+                ui.info("Using basic component attributes from diagram")
+
+            business_context_text = None
+            if args.context:
+                ui.step("Loading business context")
+                try:
+                    context_docs = context_future.result()
+                    doc_count, token_count, sources = context_summary(context_docs)
+                    business_context_text = format_context_documents(context_docs)
                     ui.success(
-                        f"Retrieved {num_chunks} knowledge chunks from {', '.join(rag_kbs)}"
+                        f"Loaded {doc_count} business context document(s), approximately {token_count} tokens"
                     )
-                    ui.debug(
-                        "RAG strategy",
-                        f"{args.rag_strategy} (reranker={retrieval.get('reranker_backend', 'off')})",
+                    ui.info(f"Context documents: {', '.join(sources)}")
+                except ContextDocumentError as e:
+                    ui.error("Failed to load business context", str(e))
+                    sys.exit(2)
+
+            rag_context_text = None
+            retrieval = None
+            rerank_fn = None
+            if args.rag:
+                ui.step("Retrieving local knowledge")
+                try:
+                    retrieval_options = RetrievalOptions(
+                        strategy=args.rag_strategy,
+                        reranker=args.rag_reranker,
+                        candidates=args.rag_candidates,
+                        min_score=args.rag_min_score,
                     )
-                    ui.debug("RAG query", retrieval.get("query", ""))
-                else:
-                    ui.warning(
-                        "No knowledge snippets retrieved",
-                        "Proceeding without additional context.",
+                    rerank_id = None
+                    if args.rag_reranker in {"auto", "llm"}:
+
+                        def _rerank_with_llm(q, candidates):
+                            return llm_rerank_chunks(
+                                q,
+                                candidates,
+                                args.llm_api,
+                                args.llm_model,
+                                args.aws_profile,
+                                args.aws_region,
+                                ollama_host,
+                            )
+
+                        rerank_fn = _rerank_with_llm
+                        # Keys semantic cache entries to this reranker.
+                        rerank_id = ":".join(
+                            (
+                                args.llm_api,
+                                endpoint_identity(
+                                    args.llm_api,
+                                    args.aws_profile,
+                                    args.aws_region,
+                                    ollama_host,
+                                ),
+                                args.llm_model,
+                            )
+                        )
+                    semantic_cache = None
+                    if args.rag_cache:
+                        semantic_cache = SemanticCache.load(
+                            get_kb_root() / SEMANTIC_CACHE_FILENAME,
+                            threshold=args.rag_cache_threshold,
+                        )
+                    retrieval = retrieve_context_for_graph(
+                        g,
+                        rag_kbs,
+                        topk=args.rag_topk or DEFAULT_TOPK,
+                        options=retrieval_options,
+                        rerank_fn=rerank_fn,
+                        bundles=kb_future.result(),
+                        semantic_cache=semantic_cache,
+                        rerank_id=rerank_id,
                     )
-            except KnowledgeBaseError as e:
-                ui.error("Failed to retrieve local knowledge", str(e))
-                sys.exit(2)
+                    if semantic_cache is not None:
+                        semantic_cache.save()
+                    rag_context_text = retrieval.get("context_text") or ""
+                    num_chunks = len(retrieval.get("results", []))
+                    if rag_context_text and num_chunks:
+                        ui.success(
+                            f"Retrieved {num_chunks} knowledge chunks from {', '.join(rag_kbs)}"
+                        )
+                        ui.debug(
+                            "RAG strategy",
+                            f"{args.rag_strategy} (reranker={retrieval.get('reranker_backend', 'off')})",
+                        )
+                        ui.debug("RAG query", retrieval.get("query", ""))
+                    else:
+                        ui.warning(
+                            "No knowledge snippets retrieved",
+                            "Proceeding without additional context.",
+                        )
+                except KnowledgeBaseError as e:
+                    ui.error("Failed to retrieve local knowledge", str(e))
+                    sys.exit(2)
+        finally:
+            # Also runs on the sys.exit() error paths above so the loader
+            # threads never outlive the command.
+            if background_executor is not None:
+                background_executor.shutdown(cancel_futures=True)
 
         # 4) LLM-driven threat inference
         ui.step("Analyzing potential security threats")
         ui.thinking("AI is performing comprehensive security threat analysis")
 
-        thinking = ui.create_thinking_indicator("AI is identifying security threats")
-        thinking.start()
+        thinking.start("AI is identifying security threats")
 
         try:
-            threats = llm_infer_threats(
-                g,
-                args.llm_api,
-                args.llm_model,
-                args.aws_profile,
-                args.aws_region,
-                ollama_host,
-                args.lang,
-                rag_context=rag_context_text,
-                rag_candidates=(retrieval or {}).get("candidate_results"),
-                business_context=business_context_text,
-                prompt_token_limit=args.prompt_token_limit,
-            )
+            if args.batch_api:
+                ui.info("Waiting for OpenAI batch job to complete")
+                batch_results = llm_infer_threats_batch(
+                    [(diagram_file, g)],
+                    args.llm_model,
+                    args.lang,
+                    rag_context=rag_context_text,
+                    rag_candidates=(retrieval or {}).get("candidate_results"),
+                    business_context=business_context_text,
+                    prompt_token_limit=args.prompt_token_limit,
+                )
+                threats = batch_results.get(diagram_file) or []
+                if not threats:
+                    raise RuntimeError("LLM returned no threats")
+            else:
+                threats = llm_infer_threats(
+                    g,
+                    args.llm_api,
+                    args.llm_model,
+                    args.aws_profile,
+                    args.aws_region,
+                    ollama_host,
+                    args.lang,
+                    rag_context=rag_context_text,
+                    rag_candidates=(retrieval or {}).get("candidate_results"),
+                    business_context=business_context_text,
+                    prompt_token_limit=args.prompt_token_limit,
+                )
             if args.rag:
                 threats, dropped_by_citation = attach_rag_sources_to_threats(
                     threats,
@@ -813,18 +922,33 @@ def main():
         )
 
         try:
-            json_output = export_json(threats, str(out_json), metrics, g)
-            md_output = export_md(threats, str(out_md))
-            html_output = export_html(threats, str(out_html), g)
+            # The reports are independent renderings of the same threats, so
+            # render and write them side by side.
             td_output = None
             td_path = None
-            if g.source_format == "threat-dragon" and g.threat_dragon:
-                td_path = out_dir / f"{out_json.stem}.threat-dragon.json"
-                try:
-                    td_output = export_threat_dragon(threats, g, str(td_path))
-                    ui.success(f"Threat Dragon report saved to: {td_path}")
-                except Exception as exc:
-                    ui.warning("Threat Dragon export skipped", str(exc))
+            with ThreadPoolExecutor(max_workers=4) as export_executor:
+                json_future = export_executor.submit(
+                    export_json, threats, str(out_json), metrics, g
+                )
+                md_future = export_executor.submit(export_md, threats, str(out_md))
+                html_future = export_executor.submit(
+                    export_html, threats, str(out_html), g
+                )
+                td_future = None
+                if g.source_format == "threat-dragon" and g.threat_dragon:
+                    td_path = out_dir / f"{out_json.stem}.threat-dragon.json"
+                    td_future = export_executor.submit(
+                        export_threat_dragon, threats, g, str(td_path)
+                    )
+                json_output = json_future.result()
+                md_output = md_future.result()
+                html_output = html_future.result()
+                if td_future is not None:
+                    try:
+                        td_output = td_future.result()
+                        ui.success(f"Threat Dragon report saved to: {td_path}")
+                    except Exception as exc:
+                        ui.warning("Threat Dragon export skipped", str(exc))
 
             ui.success(f"JSON report saved to: {out_json}")
             ui.success(f"Markdown report saved to: {out_md}")
@@ -857,6 +981,15 @@ def main():
         ui.show_summary(len(threats), processing_time)
 
     elif args.cmd == "kb":
+        from threat_thinker.rag import (
+            KnowledgeBaseError,
+            build_kb,
+            get_kb_root,
+            list_kbs,
+            remove_kb,
+            search_kb,
+        )
+
         set_verbose(args.verbose)
 
         if args.kb_cmd == "list":
@@ -1018,7 +1151,7 @@ def main():
                 f"  • Threats: +{threat_changes.get('count_added', 0)} -{threat_changes.get('count_removed', 0)}"
             )
 
-            s = json.dumps(d, ensure_ascii=False, indent=2)
+            s = dumps_json(d)
             with open(diff_json_path, "w", encoding="utf-8") as f:
                 f.write(s)
             ui.success(f"Diff JSON saved to: {diff_json_path}")
@@ -1042,6 +1175,13 @@ def main():
         processing_time = end_time - start_time
         ui.info(f"Diff completed in {processing_time:.1f}s")
     elif args.cmd == "serve":
+        # Server, worker and Web UI stacks are imported only by their own
+        # subcommands; gradio and fastapi alone add seconds to CLI startup.
+        import uvicorn
+
+        from threat_thinker.serve.api import create_app
+        from threat_thinker.serve.config import load_config
+
         cfg = load_config(args.config)
         logging.basicConfig(level=cfg.observability.log_level.upper())
         app = create_app(cfg)
@@ -1049,13 +1189,19 @@ def main():
             app,
             host=cfg.server.bind,
             port=cfg.server.port,
+            loop=cfg.server.event_loop,
             log_level=cfg.observability.log_level.lower(),
         )
     elif args.cmd == "worker":
+        from threat_thinker.serve.config import load_config
+        from threat_thinker.worker.main import run_worker
+
         cfg = load_config(args.config)
         logging.basicConfig(level=cfg.observability.log_level.upper())
         run_worker(cfg)
     elif args.cmd == "webui":
+        import threat_thinker.webui as webui
+
         ui.info("Starting Threat Thinker Web UI")
 
         webui.launch_webui(
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     id: str
     label: str
@@ -18,7 +18,7 @@ class Node:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     src: str
     dst: str
@@ -49,7 +49,7 @@ class Zone:
     parent_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Graph:
     nodes: Dict[str, Node] = field(default_factory=dict)
     edges: List[Edge] = field(default_factory=list)
@@ -72,7 +72,7 @@ class ImportMetrics:
         return round((self.edges_parsed + self.node_labels_parsed) / denom, 3)
 
 
-@dataclass
+@dataclass(slots=True)
 class Threat:
     id: str
     title: str
@@ -6,7 +6,11 @@ from .mermaid_parser import parse_mermaid
 from .drawio_parser import parse_drawio
 from .image_parser import parse_image
 from .ir_parser import parse_ir
-from .threat_dragon_parser import parse_threat_dragon, is_threat_dragon_json
+from .threat_dragon_parser import (
+    parse_threat_dragon,
+    is_threat_dragon_json,
+    load_threat_dragon_json,
+)
 
 __all__ = [
     "parse_mermaid",
@@ -15,4 +19,5 @@ __all__ = [
     "parse_ir",
     "parse_threat_dragon",
     "is_threat_dragon_json",
+    "load_threat_dragon_json",
 ]
@@ -8,6 +8,7 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Iterable, Tuple
 
+from threat_thinker.json_utils import count_json_lines, loads_json
 from threat_thinker.models import Edge, Graph, ImportMetrics, Node, Zone
 from threat_thinker.zone_utils import (
     representative_zone_name,
@@ -24,11 +25,11 @@ def parse_ir(path: str) -> Tuple[Graph, ImportMetrics]:
     Parse a JSON file containing the native Graph IR.
     """
     metrics = ImportMetrics()
-    raw_text = Path(path).read_text(encoding="utf-8")
-    metrics.total_lines = len(raw_text.splitlines())
+    raw = Path(path).read_bytes()
+    metrics.total_lines = count_json_lines(raw)
 
     try:
-        payload = json.loads(raw_text)
+        payload = loads_json(raw)
     except json.JSONDecodeError as exc:
         raise IRValidationError(f"Invalid IR JSON: {exc}") from exc
 
@@ -31,9 +31,22 @@ MERMAID_EDGE_PLAIN_RE = re.compile(
     rf"^\s*(?P<src>.+?)\s*(?P<op>{EDGE_OP_PATTERN})\s*(?P<dst>.+?)\s*$"
 )
 
+# Edge patterns in match priority order, each paired with a literal the line
+# must contain for the pattern to match. The substring test is a linear scan,
+# so lines that cannot match skip the backtracking regex entirely.
+MERMAID_EDGE_PATTERNS = (
+    ("|", MERMAID_EDGE_PIPE_RE),
+    ("|", MERMAID_EDGE_TRAILING_PIPE_RE),
+    ("--", MERMAID_EDGE_INLINE_RE),
+    ("", MERMAID_EDGE_PLAIN_RE),
+)
+
 NODE_ID_RE = re.compile(r"^\s*([A-Za-z0-9_.-]+)(.*)$")
-SUBGRAPH_START_RE = re.compile(r"^\s*subgraph\s+(.+)", re.IGNORECASE)
-SUBGRAPH_END_RE = re.compile(r"^\s*end\s*$", re.IGNORECASE)
+# Subgraph open/close share one pattern so ordinary lines cost a single match.
+SUBGRAPH_RE = re.compile(
+    r"^\s*(?:subgraph\s+(?P<label>.+)|(?P<end>end)\s*$)", re.IGNORECASE
+)
+SUBGRAPH_PREFIXES = ("subgraph", "end")
 PAIR_DELIMITERS = [
     ("[(", ")]"),
     ("((", "))"),
@@ -43,6 +56,12 @@ PAIR_DELIMITERS = [
     ("(", ")"),
     ("{", "}"),
 ]
+# Shape delimiters grouped by the label's first character (priority order kept),
+# so a node token only tries the shapes that can match it.
+PAIR_DELIMITERS_BY_FIRST_CHAR: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    char: tuple(pair for pair in PAIR_DELIMITERS if pair[0][0] == char)
+    for char in {opener[0] for opener, _ in PAIR_DELIMITERS}
+}
 
 
 def _normalize_label(text: Optional[str]) -> Optional[str]:
@@ -72,7 +91,7 @@ def _parse_node_token(token: str) -> Tuple[Optional[str], Optional[str]]:
     if not remainder:
         return node_id, None
 
-    for opener, closer in PAIR_DELIMITERS:
+    for opener, closer in PAIR_DELIMITERS_BY_FIRST_CHAR.get(remainder[0], ()):
         if remainder.startswith(opener) and remainder.endswith(closer):
             inner = remainder[len(opener) : len(remainder) - len(closer)]
             return node_id, _normalize_label(inner)
@@ -80,10 +99,50 @@ def _parse_node_token(token: str) -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
+def _is_edge_candidate(line: str) -> bool:
+    # Same test as ARROW_CANDIDATE_RE.search: every operator but "==>"
+    # contains "->".
+    return "->" in line or "==>" in line
+
+
+def _plain_arrow_split(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a bare "src --> dst" line without running the edge regexes.
+
+    Returns None unless "-->" is the line's only edge operator and nothing
+    could make an earlier pattern (bidirectional, pipe or inline label)
+    match, so the result always equals MERMAID_EDGE_PLAIN_RE's.
+    """
+    if (
+        "|" in line
+        or "<" in line
+        or "==>" in line
+        or "-.->" in line
+        or "--->" in line
+        or line.count("--") != 1
+        or line.count("->") != 1
+    ):
+        return None
+    src, sep, dst = line.partition("-->")
+    src, dst = src.strip(), dst.strip()
+    # An empty side lets the lazy regex settle on a shorter operator instead.
+    if not sep or not src or not dst:
+        return None
+    return src, dst
+
+
 def _parse_edge_entries(
     line: str,
 ) -> List[Tuple[str, str, Optional[str], Optional[str], Optional[str]]]:
-    bidir = MERMAID_EDGE_BIDIRECTIONAL_RE.match(line)
+    plain = _plain_arrow_split(line)
+    if plain is not None:
+        src_id, src_label = _parse_node_token(plain[0])
+        dst_id, dst_label = _parse_node_token(plain[1])
+        if not src_id or not dst_id:
+            return []
+        return [(src_id, dst_id, None, src_label, dst_label)]
+
+    bidir = "<-->" in line and MERMAID_EDGE_BIDIRECTIONAL_RE.match(line)
     if bidir:
         src_id, src_label = _parse_node_token(bidir.group("src"))
         dst_id, dst_label = _parse_node_token(bidir.group("dst"))
@@ -95,12 +154,9 @@ def _parse_edge_entries(
             (dst_id, src_id, label, dst_label, src_label),
         ]
 
-    for pattern in (
-        MERMAID_EDGE_PIPE_RE,
-        MERMAID_EDGE_TRAILING_PIPE_RE,
-        MERMAID_EDGE_INLINE_RE,
-        MERMAID_EDGE_PLAIN_RE,
-    ):
+    for required, pattern in MERMAID_EDGE_PATTERNS:
+        if required not in line:
+            continue
         match = pattern.match(line)
         if not match:
             continue
@@ -114,6 +170,20 @@ def _parse_edge_entries(
     return []
 
 
+def _zone_chain(
+    zone_id: str, zones: Dict[str, Zone], cache: Dict[str, List[str]]
+) -> List[str]:
+    """Zone ids from the outermost ancestor down to `zone_id`."""
+    chain = cache.get(zone_id)
+    if chain is None:
+        parent_id = zones[zone_id].parent_id
+        chain = [zone_id]
+        if parent_id is not None:
+            chain = _zone_chain(parent_id, zones, cache) + chain
+        cache[zone_id] = chain
+    return chain
+
+
 def parse_mermaid(path: str) -> Tuple[Graph, ImportMetrics]:
     """
     Parse a Mermaid diagram file and return a Graph object and import metrics.
@@ -128,83 +198,96 @@ def parse_mermaid(path: str) -> Tuple[Graph, ImportMetrics]:
     metrics = ImportMetrics()
     zone_stack: List[str] = []
     zone_defs: Dict[str, Zone] = {}
-    node_zone_membership: Dict[str, List[str]] = {}
-
-    with open(path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-    metrics.total_lines = len(lines)
+    # Innermost zones each node was seen in (dict as an ordered set); the
+    # enclosing subgraph stack is that zone's parent chain.
+    node_zone_membership: Dict[str, Dict[str, None]] = {}
 
     def _ensure_node(node_id: str) -> Node:
-        if node_id not in g.nodes:
-            g.nodes[node_id] = Node(id=node_id, label=node_id)
-        return g.nodes[node_id]
-
-    for line in lines:
-        # manage subgraph nesting first
-        start = SUBGRAPH_START_RE.match(line)
-        if start:
-            raw_label = start.group(1).strip()
-            label = raw_label
-            if "[" in raw_label and raw_label.endswith("]"):
-                label = raw_label.split("[", 1)[1].rstrip("]")
-            zone_id = f"zone_{len(zone_defs)}"
-            parent_id = zone_stack[-1] if zone_stack else None
-            zone_defs[zone_id] = Zone(
-                id=zone_id, name=label.strip(), parent_id=parent_id
-            )
-            zone_stack.append(zone_id)
-            continue
-        if SUBGRAPH_END_RE.match(line):
-            if zone_stack:
-                zone_stack.pop()
-            continue
+        node = g.nodes.get(node_id)
+        if node is None:
+            node = g.nodes[node_id] = Node(id=node_id, label=node_id)
+        return node
 
-        # normalize common arrow typos and strip Mermaid comments
-        norm = (
-            line.split("%%", 1)[0].replace("—", "-").replace("→", ">").strip()
-        )  # emdash/arrow variants
-        if not norm:
-            continue
-
-        edge_entries: List[
-            Tuple[str, str, Optional[str], Optional[str], Optional[str]]
-        ] = []
-        if ARROW_CANDIDATE_RE.search(norm):
-            metrics.edge_candidates += 1
-            edge_entries = _parse_edge_entries(norm)
-
-        if edge_entries:
-            for src, dst, label, src_label, dst_label in edge_entries:
-                g.edges.append(Edge(src=src, dst=dst, label=label))
-                metrics.edges_parsed += 1
-
-                src_node = _ensure_node(src)
-                dst_node = _ensure_node(dst)
-                if src_label:
-                    src_node.label = src_label
-                if dst_label:
-                    dst_node.label = dst_label
+    # Stream the file; only the current line is held in memory.
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            metrics.total_lines += 1
+            # manage subgraph nesting first; the prefix test keeps ordinary
+            # lines out of the regex engine
+            subgraph = None
+            if line.lstrip()[:8].lower().startswith(SUBGRAPH_PREFIXES):
+                subgraph = SUBGRAPH_RE.match(line)
+            if subgraph and subgraph.group("end"):
                 if zone_stack:
-                    node_zone_membership.setdefault(src, []).extend(zone_stack)
-                    node_zone_membership.setdefault(dst, []).extend(zone_stack)
-
-            continue
-
-        # standalone node labels like A[User], B((API))
-        node_id, node_label = _parse_node_token(norm)
-        if node_id and node_label:
-            metrics.node_label_candidates += 1
-            n = _ensure_node(node_id)
-            n.label = node_label
-            if zone_stack:
-                node_zone_membership.setdefault(node_id, []).extend(zone_stack)
-            metrics.node_labels_parsed += 1
+                    zone_stack.pop()
+                continue
+            if subgraph:
+                raw_label = subgraph.group("label").strip()
+                label = raw_label
+                bracket = raw_label.find("[")
+                if bracket != -1 and raw_label.endswith("]"):
+                    label = raw_label[bracket + 1 :].rstrip("]")
+                zone_id = f"zone_{len(zone_defs)}"
+                parent_id = zone_stack[-1] if zone_stack else None
+                zone_defs[zone_id] = Zone(
+                    id=zone_id, name=label.strip(), parent_id=parent_id
+                )
+                zone_stack.append(zone_id)
+                continue
+
+            # normalize common arrow typos and strip Mermaid comments
+            norm = (
+                line.split("%%", 1)[0].replace("—", "-").replace("→", ">").strip()
+            )  # emdash/arrow variants
+            if not norm:
+                continue
+
+            edge_entries: List[
+                Tuple[str, str, Optional[str], Optional[str], Optional[str]]
+            ] = []
+            if _is_edge_candidate(norm):
+                metrics.edge_candidates += 1
+                edge_entries = _parse_edge_entries(norm)
+
+            if edge_entries:
+                for src, dst, label, src_label, dst_label in edge_entries:
+                    g.edges.append(Edge(src=src, dst=dst, label=label))
+                    metrics.edges_parsed += 1
+
+                    src_node = _ensure_node(src)
+                    dst_node = _ensure_node(dst)
+                    if src_label:
+                        src_node.label = src_label
+                    if dst_label:
+                        dst_node.label = dst_label
+                    if zone_stack:
+                        inner = zone_stack[-1]
+                        node_zone_membership.setdefault(src, {})[inner] = None
+                        node_zone_membership.setdefault(dst, {})[inner] = None
+
+                continue
+
+            # standalone node labels like A[User], B((API))
+            node_id, node_label = _parse_node_token(norm)
+            if node_id and node_label:
+                metrics.node_label_candidates += 1
+                n = _ensure_node(node_id)
+                n.label = node_label
+                if zone_stack:
+                    node_zone_membership.setdefault(node_id, {})[zone_stack[-1]] = None
+                metrics.node_labels_parsed += 1
 
     # finalize zone membership/order
     g.zones = zone_defs
+    chains: Dict[str, List[str]] = {}
     for nid, node in g.nodes.items():
         zone_ids = sort_zone_ids_by_hierarchy(
-            node_zone_membership.get(nid, []), g.zones
+            (
+                zid
+                for inner in node_zone_membership.get(nid, ())
+                for zid in _zone_chain(inner, zone_defs, chains)
+            ),
+            g.zones,
         )
         node.zones = zone_ids
         if not node.zone:
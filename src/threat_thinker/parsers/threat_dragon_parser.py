@@ -3,8 +3,12 @@ Threat Dragon v2 JSON parser.
 """
 
 import json
-from pathlib import Path
-from typing import Any, Dict, List, Tuple
+import logging
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Any, DefaultDict, Dict, List, Mapping, Optional, Tuple
+
+from threat_thinker.json_utils import count_json_lines, loads_json
 
 from threat_thinker.models import (
     Edge,
@@ -12,52 +16,75 @@ from threat_thinker.models import (
     ImportMetrics,
     Node,
     ThreatDragonMetadata,
-    Zone,
 )
 from threat_thinker.zone_utils import (
     compute_zone_tree_from_rectangles,
-    containing_zone_ids_for_point,
+    containing_zone_ids_for_points,
     representative_zone_name,
 )
 
+logger = logging.getLogger(__name__)
+
 # Mapping from Threat Dragon data.type to internal node.type values
 NODE_TYPE_MAP = {
     "tm.Actor": "actor",
     "tm.Process": "process",
     "tm.Store": "store",
 }
+BOUNDARY_TYPES = frozenset({"tm.BoundaryBox", "tm.boundary"})
+# Shared read-only stand-in for missing per-cell sub-objects, so absent
+# data/position/size blocks do not allocate a fresh dict per cell.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
 
-def is_threat_dragon_json(path: str) -> bool:
+def load_threat_dragon_json(path: str) -> Optional[Dict[str, Any]]:
     """
-    Quick detection helper to check whether a JSON file looks like
-    a Threat Dragon v2 model.
+    Read `path` and return the parsed document if it looks like a Threat
+    Dragon v2 model, otherwise None. Pass the result to parse_threat_dragon
+    to avoid parsing the file a second time.
     """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = loads_json(f.read())
     except Exception:
-        return False
+        return None
 
+    if not isinstance(data, dict):
+        return None
     version = str(data.get("version", ""))
     if version and not version.startswith("2."):
-        return False
+        return None
 
     detail = data.get("detail") or {}
     diagrams = detail.get("diagrams") or []
     if not isinstance(diagrams, list) or not diagrams:
-        return False
+        return None
 
     first_diagram = diagrams[0]
-    return isinstance(first_diagram, dict) and bool(first_diagram.get("cells"))
+    if not (isinstance(first_diagram, dict) and bool(first_diagram.get("cells"))):
+        return None
+    return data
 
 
-def parse_threat_dragon(path: str) -> Tuple[Graph, ImportMetrics]:
+def is_threat_dragon_json(path: str) -> bool:
+    """
+    Quick detection helper to check whether a JSON file looks like
+    a Threat Dragon v2 model.
+    """
+    return load_threat_dragon_json(path) is not None
+
+
+def parse_threat_dragon(
+    path: str, document: Optional[Dict[str, Any]] = None
+) -> Tuple[Graph, ImportMetrics]:
     """
     Parse a Threat Dragon v2 JSON file into the internal Graph structure.
 
     Args:
         path: Path to the Threat Dragon JSON file.
+        document: Optional already parsed contents of `path`, as returned by
+            load_threat_dragon_json; the file is then only read for its
+            line count.
 
     Returns:
         Tuple of (Graph, ImportMetrics)
@@ -66,23 +93,25 @@ def parse_threat_dragon(path: str) -> Tuple[Graph, ImportMetrics]:
     metrics = ImportMetrics()
 
     try:
-        text = Path(path).read_text(encoding="utf-8")
-        metrics.total_lines = len(text.splitlines())
-        model = json.loads(text)
+        with open(path, "rb") as f:
+            raw = f.read()
+        model = loads_json(raw) if document is None else document
+        metrics.total_lines = count_json_lines(raw)
     except FileNotFoundError:
-        print(f"Warning: Threat Dragon file not found: {path}")
+        logger.warning("Threat Dragon file not found: %s", path)
         return g, metrics
     except json.JSONDecodeError as exc:
-        print(f"Warning: Failed to parse Threat Dragon JSON {path}: {exc}")
+        logger.warning("Failed to parse Threat Dragon JSON %s: %s", path, exc)
         return g, metrics
     except Exception as exc:
-        print(f"Warning: Error reading Threat Dragon file {path}: {exc}")
+        logger.warning("Error reading Threat Dragon file %s: %s", path, exc)
         return g, metrics
 
     version = str(model.get("version", ""))
     if version and not version.startswith("2."):
-        print(
-            f"Warning: Threat Dragon version {version} is not in the 2.x range; attempting to parse anyway."
+        logger.warning(
+            "Threat Dragon version %s is not in the 2.x range; attempting to parse anyway.",
+            version,
         )
 
     detail = model.get("detail") or {}
@@ -93,54 +122,62 @@ def parse_threat_dragon(path: str) -> Tuple[Graph, ImportMetrics]:
     diagram = diagrams[0] or {}
     cells = diagram.get("cells") or []
     meta = ThreatDragonMetadata(original_model=model)
-    meta.cells_by_id = {
-        cell.get("id"): cell
-        for cell in cells
-        if isinstance(cell, dict) and cell.get("id")
-    }
-    meta.flow_cells_by_key = {}
-    node_ids = set()
-    boundaries = _collect_boundaries(cells)
-    zones = compute_zone_tree_from_rectangles(boundaries)
-    g.zones = zones
 
-    # First pass: collect nodes
+    # One pass over the cells indexes them by id and buckets them by role;
+    # nodes are then built before flows, which need every node id.
+    boundary_cells: List[Tuple[Dict[str, Any], Mapping[str, Any]]] = []
+    node_cells: List[Tuple[Dict[str, Any], Mapping[str, Any]]] = []
+    flow_cells: List[Tuple[Dict[str, Any], Mapping[str, Any]]] = []
     for cell in cells:
-        data_block: Dict[str, Any] = cell.get("data") or {}
-        cell_type = data_block.get("type")
-        cell_id = cell.get("id")
-
-        if not cell_id or cell_type not in NODE_TYPE_MAP:
+        if not isinstance(cell, dict):
             continue
+        cell_id = cell.get("id")
+        if cell_id:
+            meta.cells_by_id[cell_id] = cell
+        data_block: Mapping[str, Any] = cell.get("data") or _EMPTY
+        cell_type = data_block.get("type")
+        shape = cell.get("shape")
+        if shape == "trust-boundary-box" or cell_type in BOUNDARY_TYPES:
+            boundary_cells.append((cell, data_block))
+        if cell_id and cell_type in NODE_TYPE_MAP:
+            node_cells.append((cell, data_block))
+        if cell_type == "tm.Flow" and shape == "flow":
+            flow_cells.append((cell, data_block))
+
+    boundaries = _collect_boundaries(boundary_cells)
+    zones = compute_zone_tree_from_rectangles(boundaries)
+    g.zones = zones
 
+    node_zone_ids = containing_zone_ids_for_points(
+        [_cell_center(cell) for cell, _ in node_cells], boundaries, zones
+    )
+    for (cell, data_block), zone_ids in zip(node_cells, node_zone_ids):
+        cell_id = cell["id"]
         label = _extract_label(cell, data_block)
-        zone_ids = _match_boundaries(cell, boundaries, zones)
         node = Node(
             id=cell_id,
             label=label,
-            type=NODE_TYPE_MAP[cell_type],
+            type=NODE_TYPE_MAP[data_block["type"]],
             zones=zone_ids,
             zone=representative_zone_name(zone_ids, zones),
         )
         g.nodes[cell_id] = node
-        node_ids.add(cell_id)
 
     metrics.node_label_candidates = len(g.nodes)
     metrics.node_labels_parsed = len(g.nodes)
 
-    # Second pass: collect flows
-    for cell in cells:
-        data_block: Dict[str, Any] = cell.get("data") or {}
-        if data_block.get("type") != "tm.Flow" or cell.get("shape") != "flow":
-            continue
-
+    nodes = g.nodes
+    flow_cells_by_key: DefaultDict[
+        Tuple[str, str, Optional[str]], List[Dict[str, Any]]
+    ] = defaultdict(list)
+    for cell, data_block in flow_cells:
         metrics.edge_candidates += 1
 
-        source = (cell.get("source") or {}).get("cell")
-        target = (cell.get("target") or {}).get("cell")
+        source = (cell.get("source") or _EMPTY).get("cell")
+        target = (cell.get("target") or _EMPTY).get("cell")
         if not source or not target:
             continue
-        if source not in node_ids or target not in node_ids:
+        if source not in nodes or target not in nodes:
             continue
 
         label = _extract_flow_label(cell, data_block)
@@ -162,24 +199,26 @@ def parse_threat_dragon(path: str) -> Tuple[Graph, ImportMetrics]:
         g.edges.append(edge)
         metrics.edges_parsed += 1
         flow_key = (source, target, label or None)
-        meta.flow_cells_by_key.setdefault(flow_key, []).append(cell)
+        flow_cells_by_key[flow_key].append(cell)
 
+    # Plain dict so later lookups of unknown flows do not insert keys.
+    meta.flow_cells_by_key = dict(flow_cells_by_key)
     g.threat_dragon = meta
 
     return g, metrics
 
 
-def _extract_label(cell: Dict[str, Any], data_block: Dict[str, Any]) -> str:
+def _extract_label(cell: Dict[str, Any], data_block: Mapping[str, Any]) -> str:
     """Pick the best available label for a node cell."""
     if data_block.get("name"):
         return str(data_block["name"]).strip()
 
-    attrs = cell.get("attrs") or {}
-    text_attr = (attrs.get("text") or {}).get("text")
+    attrs = cell.get("attrs") or _EMPTY
+    text_attr = (attrs.get("text") or _EMPTY).get("text")
     if text_attr:
         return str(text_attr).strip()
 
-    label_attr = (attrs.get("label") or {}).get("text")
+    label_attr = (attrs.get("label") or _EMPTY).get("text")
     if label_attr:
         return str(label_attr).strip()
 
@@ -187,7 +226,9 @@ def _extract_label(cell: Dict[str, Any], data_block: Dict[str, Any]) -> str:
     return str(cell_id).strip()
 
 
-def _extract_flow_label(cell: Dict[str, Any], data_block: Dict[str, Any]) -> str | None:
+def _extract_flow_label(
+    cell: Dict[str, Any], data_block: Mapping[str, Any]
+) -> str | None:
     """Pick the best available label for a flow edge."""
     if data_block.get("name"):
         return str(data_block["name"]).strip() or None
@@ -206,19 +247,15 @@ def _extract_flow_label(cell: Dict[str, Any], data_block: Dict[str, Any]) -> str
     return None
 
 
-def _collect_boundaries(cells: List[Dict[str, Any]]) -> List[Dict[str, float]]:
-    """Extract trust boundary rectangles from Threat Dragon cells."""
+def _collect_boundaries(
+    boundary_cells: List[Tuple[Dict[str, Any], Mapping[str, Any]]],
+) -> List[Dict[str, float]]:
+    """Extract trust boundary rectangles from (cell, data) boundary pairs."""
     boundaries: List[Dict[str, float]] = []
-    for cell in cells:
-        data_block: Dict[str, Any] = cell.get("data") or {}
-        if cell.get("shape") != "trust-boundary-box" and data_block.get("type") not in {
-            "tm.BoundaryBox",
-            "tm.boundary",
-        }:
-            continue
+    for cell, data_block in boundary_cells:
         label = _extract_label(cell, data_block)
-        position = cell.get("position") or {}
-        size = cell.get("size") or {}
+        position = cell.get("position") or _EMPTY
+        size = cell.get("size") or _EMPTY
         boundaries.append(
             {
                 "id": str(cell.get("id") or label),
@@ -232,14 +269,10 @@ def _collect_boundaries(cells: List[Dict[str, Any]]) -> List[Dict[str, float]]:
     return boundaries
 
 
-def _match_boundaries(
-    node_cell: Dict[str, Any],
-    boundaries: List[Dict[str, float]],
-    zones: Dict[str, Zone],
-) -> List[str]:
-    """Return ordered containing boundary ids for the node center."""
-    position = node_cell.get("position") or {}
-    size = node_cell.get("size") or {}
+def _cell_center(node_cell: Dict[str, Any]) -> Tuple[float, float]:
+    """Return the center point of a node cell, used to match its boundaries."""
+    position = node_cell.get("position") or _EMPTY
+    size = node_cell.get("size") or _EMPTY
     center_x = float(position.get("x") or 0) + float(size.get("width") or 0) / 2
     center_y = float(position.get("y") or 0) + float(size.get("height") or 0) / 2
-    return containing_zone_ids_for_point(center_x, center_y, boundaries, zones)
+    return center_x, center_y
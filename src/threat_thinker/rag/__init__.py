@@ -3,11 +3,13 @@ Local RAG utilities for Threat Thinker.
 
 This package exposes helper functions to build and query on-disk knowledge bases
 that store chunked text documents and their embeddings.  The public API lives in
-`rag.local`.
+`rag.local`; its functions and classes are imported on first access so that
+reading the defaults below does not load numpy/tiktoken.
 """
 
-from .local import (
-    KnowledgeBaseError,
+from importlib import import_module
+
+from .constants import (
     DEFAULT_EMBED_MODEL,
     DEFAULT_CHUNK_TOKENS,
     DEFAULT_CHUNK_OVERLAP,
@@ -16,20 +18,38 @@ from .local import (
     DEFAULT_RAG_RERANKER,
     DEFAULT_RAG_CANDIDATES,
     DEFAULT_RAG_MIN_SCORE,
+    DEFAULT_SEMANTIC_CACHE_THRESHOLD,
     RAG_STRATEGIES,
     RAG_RERANKERS,
-    RetrievalOptions,
-    build_kb,
-    list_kbs,
-    search_kb,
-    remove_kb,
-    generate_graph_query,
-    generate_graph_queries,
-    retrieve_context_for_graph,
-    attach_rag_sources_to_threats,
-    get_kb_root,
+    SEMANTIC_CACHE_FILENAME,
 )
 
+_LAZY_EXPORTS = {
+    "KnowledgeBaseError": ".local",
+    "RetrievalOptions": ".local",
+    "build_kb": ".local",
+    "list_kbs": ".local",
+    "search_kb": ".local",
+    "load_kb_bundles": ".local",
+    "remove_kb": ".local",
+    "generate_graph_query": ".local",
+    "generate_graph_queries": ".local",
+    "retrieve_context_for_graph": ".local",
+    "attach_rag_sources_to_threats": ".local",
+    "get_kb_root": ".local",
+    "SemanticCache": ".semantic_cache",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "KnowledgeBaseError",
     "DEFAULT_EMBED_MODEL",
@@ -46,10 +66,14 @@ __all__ = [
     "build_kb",
     "list_kbs",
     "search_kb",
+    "load_kb_bundles",
     "remove_kb",
     "generate_graph_query",
     "generate_graph_queries",
     "retrieve_context_for_graph",
     "attach_rag_sources_to_threats",
     "get_kb_root",
+    "DEFAULT_SEMANTIC_CACHE_THRESHOLD",
+    "SEMANTIC_CACHE_FILENAME",
+    "SemanticCache",
 ]
@@ -0,0 +1,34 @@
+"""
+Default settings for the local RAG feature.
+
+Kept free of numpy/tiktoken imports so the CLI can build its argument parser
+without loading the retrieval stack.
+"""
+
+DEFAULT_EMBED_MODEL = "text-embedding-3-small"
+DEFAULT_CHUNK_TOKENS = 800
+DEFAULT_CHUNK_OVERLAP = 80
+DEFAULT_TOPK = 8
+
+DEFAULT_RAG_STRATEGY = "hybrid"
+DEFAULT_RAG_RERANKER = "auto"
+DEFAULT_RAG_CANDIDATES = 40
+DEFAULT_RAG_MIN_SCORE = 0.25
+DEFAULT_RAG_RRF_K = 60
+DEFAULT_RAG_MMR_LAMBDA = 0.7
+DEFAULT_RAG_MAX_PER_SOURCE = 2
+DEFAULT_RAG_DENSE_RRF_WEIGHT = 0.30
+DEFAULT_RAG_SPARSE_RRF_WEIGHT = 0.40
+DEFAULT_RAG_DENSE_RAW_WEIGHT = 0.10
+DEFAULT_RAG_SPARSE_RAW_WEIGHT = 0.20
+DEFAULT_LOCAL_RERANK_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+RAG_STRATEGIES = {"dense", "hybrid"}
+RAG_RERANKERS = {"auto", "local", "llm", "off"}
+
+TEXT_EXTENSIONS = {".md", ".markdown", ".txt", ".text"}
+HTML_EXTENSIONS = {".html", ".htm"}
+SUPPORTED_EXTENSIONS = {".pdf", *TEXT_EXTENSIONS, *HTML_EXTENSIONS}
+
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_FILENAME = "_semcache.json"
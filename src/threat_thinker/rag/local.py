@@ -11,13 +11,39 @@ import math
 import os
 import re
 import shutil
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
+from .constants import (
+    DEFAULT_EMBED_MODEL,
+    DEFAULT_CHUNK_TOKENS,
+    DEFAULT_CHUNK_OVERLAP,
+    DEFAULT_TOPK,
+    DEFAULT_RAG_STRATEGY,
+    DEFAULT_RAG_RERANKER,
+    DEFAULT_RAG_CANDIDATES,
+    DEFAULT_RAG_MIN_SCORE,
+    DEFAULT_RAG_RRF_K,
+    DEFAULT_RAG_MMR_LAMBDA,
+    DEFAULT_RAG_MAX_PER_SOURCE,
+    DEFAULT_RAG_DENSE_RRF_WEIGHT,
+    DEFAULT_RAG_SPARSE_RRF_WEIGHT,
+    DEFAULT_RAG_DENSE_RAW_WEIGHT,
+    DEFAULT_RAG_SPARSE_RAW_WEIGHT,
+    DEFAULT_LOCAL_RERANK_MODEL,
+    RAG_STRATEGIES,
+    RAG_RERANKERS,
+    TEXT_EXTENSIONS,
+    HTML_EXTENSIONS,
+    SUPPORTED_EXTENSIONS,
+)
+from .semantic_cache import SemanticCache
+
 try:
     import tiktoken
 except ImportError as exc:  # pragma: no cover - enforced via requirements
@@ -25,31 +51,11 @@ except ImportError as exc:  # pragma: no cover - enforced via requirements
         "tiktoken is required for the local RAG feature. Please install dependencies."
     ) from exc
 
-DEFAULT_EMBED_MODEL = "text-embedding-3-small"
-DEFAULT_CHUNK_TOKENS = 800
-DEFAULT_CHUNK_OVERLAP = 80
-DEFAULT_TOPK = 8
-
-DEFAULT_RAG_STRATEGY = "hybrid"
-DEFAULT_RAG_RERANKER = "auto"
-DEFAULT_RAG_CANDIDATES = 40
-DEFAULT_RAG_MIN_SCORE = 0.25
-DEFAULT_RAG_RRF_K = 60
-DEFAULT_RAG_MMR_LAMBDA = 0.7
-DEFAULT_RAG_MAX_PER_SOURCE = 2
-DEFAULT_RAG_DENSE_RRF_WEIGHT = 0.30
-DEFAULT_RAG_SPARSE_RRF_WEIGHT = 0.40
-DEFAULT_RAG_DENSE_RAW_WEIGHT = 0.10
-DEFAULT_RAG_SPARSE_RAW_WEIGHT = 0.20
-DEFAULT_LOCAL_RERANK_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
-
-RAG_STRATEGIES = {"dense", "hybrid"}
-RAG_RERANKERS = {"auto", "local", "llm", "off"}
-
-TEXT_EXTENSIONS = {".md", ".markdown", ".txt", ".text"}
-HTML_EXTENSIONS = {".html", ".htm"}
-SUPPORTED_EXTENSIONS = {".pdf", *TEXT_EXTENSIONS, *HTML_EXTENSIONS}
 _TOKEN_RE = re.compile(r"[A-Za-z0-9_:/.-]+")
+# Rows upcast per step when scoring float16 KBs; keeps the float32 copy cache-sized.
+_MATVEC_TILE_ROWS = 4096
+# Knowledge bases loaded/searched at once; the work is disk and embedding I/O.
+KB_MAX_WORKERS = 4
 
 _CROSS_ENCODER_CACHE: Dict[str, Any] = {}
 _CROSS_ENCODER_IMPORT_FAILED = False
@@ -91,6 +97,10 @@ class LoadedKB:
     meta: dict
     bm25_df: Dict[str, int]
     bm25_avgdl: float
+    # Column views over `chunks` so result assembly can gather k rows at once.
+    chunk_ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    sources: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    texts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
 
 
 def get_kb_root() -> Path:
@@ -199,13 +209,18 @@ def _embed_with_openai(texts: List[str], model: str) -> np.ndarray:
         return np.zeros((0, 0), dtype=np.float32)
 
     try:
-        from openai import OpenAI
+        from threat_thinker.llm.providers.openai import OpenAIProvider
     except ImportError as exc:
         raise KnowledgeBaseError(
             "openai python package is required for embeddings."
         ) from exc
 
-    client = OpenAI()
+    # Reuse the provider's shared client so embedding, rerank and chat calls
+    # go through the same HTTP connection pool.
+    try:
+        client = OpenAIProvider().client
+    except RuntimeError as exc:
+        raise KnowledgeBaseError(str(exc)) from exc
     vectors: List[List[float]] = []
     for batch in _batched(texts, 64):
         response = client.embeddings.create(model=model, input=batch)
@@ -213,16 +228,37 @@ def _embed_with_openai(texts: List[str], model: str) -> np.ndarray:
     return np.array(vectors, dtype=np.float32)
 
 
-def _cosine_similarities(embeddings: np.ndarray, query_vec: np.ndarray) -> np.ndarray:
+def _unit_rows(embeddings: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize embedding rows (zero rows stay zero). float16 matrices stay
+    float16 to keep their memory halved; anything else becomes float32.
+    """
     if embeddings.ndim != 2:
         raise KnowledgeBaseError("Invalid embedding matrix format.")
-
-    doc_norms = np.linalg.norm(embeddings, axis=1)
-    query_norm = np.linalg.norm(query_vec)
-    if query_norm == 0:
-        raise KnowledgeBaseError("Query embedding has zero norm.")
-
-    return embeddings.dot(query_vec) / (doc_norms * query_norm + 1e-10)
+    dtype = np.float16 if embeddings.dtype == np.float16 else np.float32
+    rows = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return (rows / np.maximum(norms, 1e-10)).astype(dtype, copy=False)
+
+
+def _matvec(embeddings: np.ndarray, vec: np.ndarray) -> np.ndarray:
+    """`embeddings @ vec` in float32, upcasting float16 rows tile by tile."""
+    if embeddings.dtype == np.float32:
+        return embeddings.dot(vec)
+    out = np.empty(embeddings.shape[0], dtype=np.float32)
+    for start in range(0, embeddings.shape[0], _MATVEC_TILE_ROWS):
+        tile = embeddings[start : start + _MATVEC_TILE_ROWS]
+        out[start : start + len(tile)] = tile.astype(np.float32).dot(vec)
+    return out
+
+
+def _top_indices(scores: np.ndarray, topk: int) -> np.ndarray:
+    """Indices of the `topk` highest scores, best first."""
+    if topk < len(scores):
+        part = np.argpartition(-scores, topk - 1)[:topk]
+    else:
+        part = np.arange(len(scores))
+    return part[np.argsort(-scores[part], kind="stable")]
 
 
 def _compute_bm25_stats(chunks: List[dict]) -> Tuple[Dict[str, int], float]:
@@ -478,13 +514,42 @@ def _load_kb_bundle(kb_name: str) -> LoadedKB:
     return LoadedKB(
         name=kb_name,
         chunks=chunks,
-        embeddings=embeddings,
+        # Unit rows turn every cosine query into a single matrix-vector product.
+        embeddings=_unit_rows(embeddings) if chunks else embeddings,
         meta=meta,
         bm25_df=bm25_df,
         bm25_avgdl=bm25_avgdl,
+        chunk_ids=_object_column(c["chunk_id"] for c in chunks),
+        sources=_object_column(c.get("source") for c in chunks),
+        texts=_object_column(c.get("text", "") for c in chunks),
     )
 
 
+def load_kb_bundles(kb_names: List[str]) -> List[LoadedKB]:
+    """
+    Load knowledge bases for `retrieve_context_for_graph(..., bundles=...)`.
+
+    Loading does not depend on the graph, so callers can do it while other
+    work (e.g. hint inference) is still in flight.
+    """
+    return _map_kbs(_load_kb_bundle, kb_names)
+
+
+def _map_kbs(fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """Apply `fn` to each KB item on a small thread pool, keeping input order."""
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(KB_MAX_WORKERS, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+def _object_column(values: Iterable[Any]) -> np.ndarray:
+    items = list(values)
+    column = np.empty(len(items), dtype=object)
+    column[:] = items
+    return column
+
+
 def _dense_rank(
     chunks: List[dict],
     embeddings: np.ndarray,
@@ -492,17 +557,24 @@ def _dense_rank(
     topk: int,
     model: str,
     embedder: Callable[[List[str], str], np.ndarray],
+    query_vec: Optional[np.ndarray] = None,
 ) -> Tuple[List[int], Dict[int, float], np.ndarray]:
     if not chunks or topk <= 0:
         return [], {}, np.zeros((0,), dtype=np.float32)
 
-    qvecs = embedder([query], model)
-    if qvecs.size == 0:
-        return [], {}, np.zeros((0,), dtype=np.float32)
+    if query_vec is None:
+        qvecs = embedder([query], model)
+        if qvecs.size == 0:
+            return [], {}, np.zeros((0,), dtype=np.float32)
+        query_vec = qvecs[0]
 
-    qvec = qvecs[0]
-    sims = _cosine_similarities(embeddings, qvec)
-    top_indices = np.argsort(sims)[::-1][:topk]
+    qvec = query_vec
+    query_norm = np.linalg.norm(qvec)
+    if query_norm == 0:
+        raise KnowledgeBaseError("Query embedding has zero norm.")
+    # `embeddings` holds unit rows (see _load_kb_bundle).
+    sims = _matvec(embeddings, (qvec / query_norm).astype(np.float32))
+    top_indices = _top_indices(sims, topk)
     scores = {int(idx): float(sims[idx]) for idx in top_indices}
     return [int(i) for i in top_indices], scores, qvec
 
@@ -515,7 +587,7 @@ def _sparse_rank(
     sparse_scores = _bm25_scores(
         bundle.chunks, query, bundle.bm25_df, bundle.bm25_avgdl
     )
-    top_indices = np.argsort(sparse_scores)[::-1][:topk]
+    top_indices = _top_indices(sparse_scores, topk)
     scores = {int(idx): float(sparse_scores[idx]) for idx in top_indices}
     return [int(i) for i in top_indices], scores
 
@@ -601,7 +673,12 @@ def build_kb(
                 + "\n"
             )
 
-    np.save(kb_path / "embeddings.npy", embeddings, allow_pickle=False)
+    # Unit rows in float16 halve the KB size; cosine ranking is unaffected.
+    np.save(
+        kb_path / "embeddings.npy",
+        _unit_rows(embeddings).astype(np.float16),
+        allow_pickle=False,
+    )
 
     bm25_df, bm25_avgdl = _compute_bm25_stats(
         [
@@ -617,6 +694,7 @@ def build_kb(
     meta = {
         "kb_name": kb_name,
         "embedding_model": embed_model,
+        "embedding_dtype": "float16",
         "chunk_tokens": chunk_tokens,
         "chunk_overlap": chunk_overlap,
         "num_chunks": len(chunks),
@@ -660,8 +738,11 @@ def search_kb(
     embed_model: Optional[str] = None,
     embed_fn: Optional[Callable[[List[str], str], np.ndarray]] = None,
     strategy: str = "dense",
+    bundle: Optional[LoadedKB] = None,
+    query_vec: Optional[np.ndarray] = None,
 ) -> List[dict]:
-    bundle = _load_kb_bundle(kb_name)
+    if bundle is None:
+        bundle = _load_kb_bundle(kb_name)
     if not bundle.chunks:
         return []
 
@@ -675,21 +756,32 @@ def search_kb(
         )
 
     dense_indices, dense_scores, _ = _dense_rank(
-        bundle.chunks, bundle.embeddings, query, max(1, topk), model, embedder
+        bundle.chunks,
+        bundle.embeddings,
+        query,
+        max(1, topk),
+        model,
+        embedder,
+        query_vec=query_vec,
     )
 
     if strategy == "dense":
+        top_indices = dense_indices[:topk]
         results = []
-        for idx in dense_indices[:topk]:
-            chunk = bundle.chunks[int(idx)]
+        for idx, chunk_id, source, text in zip(
+            top_indices,
+            bundle.chunk_ids[top_indices],
+            bundle.sources[top_indices],
+            bundle.texts[top_indices],
+        ):
             score = float(dense_scores.get(int(idx), 0.0))
             results.append(
                 {
                     "kb": kb_name,
-                    "chunk_id": chunk["chunk_id"],
+                    "chunk_id": chunk_id,
                     "score": score,
-                    "source": chunk.get("source"),
-                    "text": chunk.get("text", ""),
+                    "source": source,
+                    "text": text,
                     "dense_score": score,
                     "sparse_score": 0.0,
                     "fused_score": score,
@@ -724,16 +816,20 @@ def search_kb(
 
     top_indices = sorted(fused.keys(), key=lambda i: fused[i], reverse=True)[:topk]
     results = []
-    for idx in top_indices:
-        chunk = bundle.chunks[int(idx)]
+    for idx, chunk_id, source, text in zip(
+        top_indices,
+        bundle.chunk_ids[top_indices],
+        bundle.sources[top_indices],
+        bundle.texts[top_indices],
+    ):
         final = float(fused[idx])
         results.append(
             {
                 "kb": kb_name,
-                "chunk_id": chunk["chunk_id"],
+                "chunk_id": chunk_id,
                 "score": final,
-                "source": chunk.get("source"),
-                "text": chunk.get("text", ""),
+                "source": source,
+                "text": text,
                 "dense_score": float(dense_scores.get(int(idx), 0.0)),
                 "sparse_score": float(sparse_scores.get(int(idx), 0.0)),
                 "fused_score": final,
@@ -897,7 +993,16 @@ def retrieve_context_for_graph(
     embed_fn: Optional[Callable[[List[str], str], np.ndarray]] = None,
     options: Optional[RetrievalOptions] = None,
     rerank_fn: Optional[Callable[[str, List[dict]], List[float]]] = None,
+    bundles: Optional[List[LoadedKB]] = None,
+    semantic_cache: Optional[SemanticCache] = None,
+    rerank_id: Optional[str] = None,
 ) -> dict:
+    """
+    Retrieve knowledge for `graph`. With `semantic_cache`, a previous result
+    for a similar query under the same KBs, options and reranker is reused;
+    `rerank_id` names the reranker behind `rerank_fn` (e.g. LLM api and
+    model), and the cache is skipped when `rerank_fn` has no id.
+    """
     if not kb_names:
         raise KnowledgeBaseError("At least one KB name is required for retrieval.")
 
@@ -908,19 +1013,107 @@ def retrieve_context_for_graph(
         raise KnowledgeBaseError("topk must be a positive integer")
 
     query = generate_graph_query(graph)
+    if semantic_cache is None or (rerank_fn is not None and rerank_id is None):
+        return _retrieve_context(
+            graph, query, kb_names, topk, embed_fn, opts, rerank_fn, bundles
+        )
+
+    if bundles is None:
+        bundles = load_kb_bundles(kb_names)
+    model = bundles[0].meta.get("embedding_model") or DEFAULT_EMBED_MODEL
+    qvecs = (embed_fn or _embed_with_openai)([query], model)
+    if qvecs.size == 0:
+        return _retrieve_context(
+            graph, query, kb_names, topk, embed_fn, opts, rerank_fn, bundles
+        )
+    scope = json.dumps(
+        {
+            "kbs": [[b.name, b.meta.get("updated_at")] for b in bundles],
+            "model": model,
+            "topk": topk,
+            "options": asdict(opts),
+            "reranker": rerank_id if rerank_fn is not None else None,
+        },
+        sort_keys=True,
+    )
+    cached = semantic_cache.lookup(scope, qvecs[0])
+    if cached is not None:
+        # The hit came from a similar, not necessarily identical, query.
+        return {**cached, "query": query}
+    # Reuse the lookup embedding so a miss does not embed `query` again.
+    retrieval = _retrieve_context(
+        graph,
+        query,
+        kb_names,
+        topk,
+        embed_fn,
+        opts,
+        rerank_fn,
+        bundles,
+        known_vectors={model: qvecs[0]},
+    )
+    semantic_cache.store(scope, qvecs[0], retrieval)
+    return retrieval
+
+
+def _embed_queries(
+    embedder: Callable[[List[str], str], np.ndarray],
+    queries: List[str],
+    model: str,
+    first_vec: Optional[np.ndarray],
+) -> np.ndarray:
+    """Embed `queries`, reusing `first_vec` as the embedding of queries[0]."""
+    if first_vec is None:
+        return embedder(queries, model)
+    first = np.asarray(first_vec, dtype=np.float32)[None, :]
+    if len(queries) == 1:
+        return first
+    rest = embedder(queries[1:], model)
+    if len(rest) != len(queries) - 1:
+        return rest
+    return np.vstack([first, np.asarray(rest, dtype=np.float32)])
+
+
+def _retrieve_context(
+    graph,
+    query: str,
+    kb_names: List[str],
+    topk: int,
+    embed_fn: Optional[Callable[[List[str], str], np.ndarray]],
+    opts: RetrievalOptions,
+    rerank_fn: Optional[Callable[[str, List[dict]], List[float]]],
+    bundles: Optional[List[LoadedKB]],
+    known_vectors: Optional[Dict[str, np.ndarray]] = None,
+) -> dict:
+    """
+    Retrieve and rank context for `query`. `known_vectors` maps embedding
+    model names to an already computed embedding of `query`.
+    """
+    known_vectors = known_vectors or {}
 
     if opts.strategy == "dense":
-        aggregated: List[dict] = []
-        for kb in kb_names:
-            aggregated.extend(
-                search_kb(
-                    kb,
-                    query,
-                    topk=topk,
-                    embed_fn=embed_fn,
-                    strategy="dense",
+
+        def _search_one(idx: int) -> List[dict]:
+            bundle = bundles[idx] if bundles is not None else None
+            query_vec = None
+            if known_vectors and bundle is not None:
+                query_vec = known_vectors.get(
+                    bundle.meta.get("embedding_model") or DEFAULT_EMBED_MODEL
                 )
+            return search_kb(
+                kb_names[idx],
+                query,
+                topk=topk,
+                embed_fn=embed_fn,
+                strategy="dense",
+                bundle=bundle,
+                query_vec=query_vec,
             )
+
+        # Each KB search is independent (load + query embedding + scoring).
+        aggregated: List[dict] = []
+        for results in _map_kbs(_search_one, list(range(len(kb_names)))):
+            aggregated.extend(results)
         aggregated.sort(key=lambda r: r.get("score", 0.0), reverse=True)
         trimmed = aggregated[:topk]
         context_blocks = []
@@ -941,23 +1134,35 @@ def retrieve_context_for_graph(
     queries = generate_graph_queries(graph)
     embedder = embed_fn or _embed_with_openai
 
-    bundles = [_load_kb_bundle(kb) for kb in kb_names]
+    if bundles is None:
+        bundles = load_kb_bundles(kb_names)
     fused_candidates: Dict[Tuple[str, int], dict] = {}
 
     per_query_limit = max(topk, opts.candidates)
+    # One embeddings request per model for all query variants, instead of
+    # one per (KB, query) pair.
+    query_vectors: Dict[str, Optional[np.ndarray]] = {}
 
     for bundle in bundles:
         model = bundle.meta.get("embedding_model") or DEFAULT_EMBED_MODEL
-
-        for q in queries:
-            dense_indices, dense_scores, _ = _dense_rank(
-                bundle.chunks,
-                bundle.embeddings,
-                q,
-                per_query_limit,
-                model,
-                embedder,
-            )
+        if bundle.chunks and model not in query_vectors:
+            qvecs = _embed_queries(embedder, queries, model, known_vectors.get(model))
+            query_vectors[model] = qvecs if len(qvecs) == len(queries) else None
+        qvecs = query_vectors.get(model)
+
+        for qi, q in enumerate(queries):
+            if qvecs is None:
+                dense_indices, dense_scores = [], {}
+            else:
+                dense_indices, dense_scores, _ = _dense_rank(
+                    bundle.chunks,
+                    bundle.embeddings,
+                    q,
+                    per_query_limit,
+                    model,
+                    embedder,
+                    query_vec=qvecs[qi],
+                )
             sparse_indices, sparse_scores = _sparse_rank(bundle, q, per_query_limit)
 
             dense_ranks = {idx: rank + 1 for rank, idx in enumerate(dense_indices)}
@@ -1000,7 +1205,7 @@ def retrieve_context_for_graph(
                         "sparse_score": 0.0,
                         "fused_score": 0.0,
                         "query_hits": [],
-                        "_vector": bundle.embeddings[idx],
+                        "_vector": bundle.embeddings[idx].astype(np.float32),
                     }
                     fused_candidates[key] = rec
 
@@ -0,0 +1,146 @@
+"""
+Similarity cache for graph retrievals.
+
+Reuses a previous `retrieve_context_for_graph` result when a new graph query
+embeds close to one already answered against the same KBs and options.
+Candidates are found through random-projection LSH signatures and confirmed
+with the exact cosine similarity.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .constants import DEFAULT_SEMANTIC_CACHE_THRESHOLD
+
+DEFAULT_SEMANTIC_CACHE_BITS = 16
+DEFAULT_SEMANTIC_CACHE_MAX_ENTRIES = 256
+
+
+class SemanticCache:
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        threshold: float = DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+        bits: int = DEFAULT_SEMANTIC_CACHE_BITS,
+        max_entries: int = DEFAULT_SEMANTIC_CACHE_MAX_ENTRIES,
+        seed: int = 0,
+    ):
+        self.path = Path(path) if path is not None else None
+        self.threshold = threshold
+        self.bits = bits
+        self.max_entries = max_entries
+        self.seed = seed
+        self._entries: List[dict] = []
+        self._vectors: List[np.ndarray] = []
+        self._buckets: Dict[int, List[int]] = {}
+        self._projections: Optional[np.ndarray] = None
+
+    @classmethod
+    def load(cls, path: Path, **kwargs) -> "SemanticCache":
+        """Open the cache stored at `path`; unreadable files start empty."""
+        cache = cls(path, **kwargs)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cache
+        if not isinstance(data, dict):
+            return cache
+        for entry in data.get("entries") or []:
+            try:
+                vector = np.asarray(entry["vector"], dtype=np.float32)
+                cache._add(str(entry["scope"]), vector, dict(entry["payload"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, scope: str, vector: np.ndarray) -> Optional[dict]:
+        """Return the closest cached payload for `scope`, if similar enough."""
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0 or not self._entries:
+            return None
+        signature = self._signature(vector)
+        best_score = self.threshold
+        best: Optional[dict] = None
+        # Probe the signature itself and every neighbour at Hamming distance 1.
+        for probe in (signature, *(signature ^ (1 << b) for b in range(self.bits))):
+            for idx in self._buckets.get(probe, ()):
+                entry = self._entries[idx]
+                cached = self._vectors[idx]
+                if entry["scope"] != scope or cached.shape != vector.shape:
+                    continue
+                score = float(cached.dot(vector)) / (
+                    float(np.linalg.norm(cached)) * norm + 1e-10
+                )
+                if score >= best_score:
+                    best_score = score
+                    best = entry["payload"]
+        return best
+
+    def store(self, scope: str, vector: np.ndarray, payload: dict) -> None:
+        vector = np.asarray(vector, dtype=np.float32)
+        if float(np.linalg.norm(vector)) == 0.0:
+            return
+        self._add(scope, vector, payload)
+        if len(self._entries) > self.max_entries:
+            # Drop the oldest entries and rebuild the buckets.
+            keep = list(zip(self._entries, self._vectors))[-self.max_entries :]
+            self._entries, self._vectors, self._buckets = [], [], {}
+            for entry, cached in keep:
+                self._add(entry["scope"], cached, entry["payload"])
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            "entries": [
+                {
+                    "scope": entry["scope"],
+                    "vector": cached.tolist(),
+                    "payload": entry["payload"],
+                }
+                for entry, cached in zip(self._entries, self._vectors)
+            ]
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # A read-only KB root must not fail the analysis.
+            pass
+
+    def _add(self, scope: str, vector: np.ndarray, payload: dict) -> None:
+        idx = len(self._entries)
+        self._entries.append({"scope": scope, "payload": payload})
+        self._vectors.append(vector)
+        self._buckets.setdefault(self._signature(vector), []).append(idx)
+
+    def _signature(self, vector: np.ndarray) -> int:
+        dim = vector.shape[0]
+        if self._projections is None or self._projections.shape[1] != dim:
+            # Seeded so signatures stay comparable across runs.
+            rng = np.random.default_rng(self.seed)
+            self._projections = rng.standard_normal((self.bits, dim)).astype(np.float32)
+        signature = 0
+        for bit, positive in enumerate(self._projections.dot(vector) > 0):
+            if positive:
+                signature |= 1 << bit
+        return signature
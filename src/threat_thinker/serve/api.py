@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import base64
-import io
 import logging
+import os
 import zipfile
+from collections import deque
 from contextlib import asynccontextmanager
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
 
+import anyio
 from fastapi import (
     Depends,
     FastAPI,
@@ -18,8 +21,9 @@ from fastapi import (
 )
 from starlette.datastructures import UploadFile as StarletteUploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.openapi.utils import get_openapi
-from redis.asyncio import from_url as redis_from_url
+from redis.asyncio import BlockingConnectionPool, Redis as AsyncRedis
 
 from threat_thinker.input_loader import (
     INPUT_FORMAT_DRAWIO,
@@ -27,6 +31,7 @@ from threat_thinker.input_loader import (
     INPUT_FORMAT_MERMAID,
     INPUT_FORMAT_THREAT_DRAGON,
 )
+from threat_thinker.json_utils import dumps_json, loads_json
 from threat_thinker.serve.auth import APIKeyAuthenticator
 from threat_thinker.serve.config import ServeConfig
 from threat_thinker.serve.jobstore import (
@@ -50,25 +55,104 @@ from threat_thinker.serve.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Uploads are read in slices so size limits trip before the whole file is read.
+UPLOAD_READ_CHUNK_SIZE = 64 * 1024
+# Text reports deflate several times faster at level 3 than at the default 6,
+# for a modestly larger archive.
+ZIP_COMPRESSLEVEL = 3
+# Uncompressed bytes fed to deflate between chunks of a streamed archive.
+ZIP_STREAM_CHUNK_SIZE = 64 * 1024
+# Deflate runs on worker threads; cap them so large archives cannot take over
+# the shared threadpool used by sync dependencies.
+_ZIP_LIMITER = anyio.CapacityLimiter(max(2, os.cpu_count() or 1))
+
+
+_EXTENSION_FOR_FORMAT = {
+    "markdown": ".md",
+    "html": ".html",
+    "json": ".json",
+    "threat-dragon": ".threat-dragon.json",
+}
+
 
 def _extension_for_format(fmt: str) -> str:
-    return {
-        "markdown": ".md",
-        "html": ".html",
-        "json": ".json",
-        "threat-dragon": ".threat-dragon.json",
-    }.get(fmt, ".txt")
+    return _EXTENSION_FOR_FORMAT.get(fmt, ".txt")
 
 
-def _build_zip_bytes(job_id: str, reports: list[ReportContent]) -> bytes:
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+def _parse_reports(result: dict) -> list[ReportContent]:
+    """Reports stored for a finished job, including the single-report layout."""
+    reports = [
+        ReportContent(
+            report_format=entry["report_format"],
+            content=entry.get("content", ""),
+        )
+        for entry in result.get("reports") or []
+        if entry.get("report_format")
+    ]
+    if not reports and result.get("report_format"):
+        reports.append(
+            ReportContent(
+                report_format=result["report_format"],
+                content=result.get("content", ""),
+            )
+        )
+    return reports
+
+
+class _ZipChunkBuffer:
+    """Write-only sink that hands zipfile output back in drained chunks."""
+
+    def __init__(self) -> None:
+        self._chunks: deque[bytes] = deque()
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_zip_chunks(job_id: str, reports: list[ReportContent]) -> Iterator[bytes]:
+    """
+    Yield the report archive piece by piece.
+
+    The sink is not seekable, so zipfile writes data descriptors after each
+    member and only one slice of compressed output is held at a time.
+    """
+    sink = _ZipChunkBuffer()
+    with zipfile.ZipFile(
+        sink,
+        mode="w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=ZIP_COMPRESSLEVEL,
+    ) as zf:
         for entry in reports:
             suffix = _extension_for_format(entry.report_format)
             filename = f"threat-thinker-{job_id}{suffix}"
-            zf.writestr(filename, entry.content or "")
-    buffer.seek(0)
-    return buffer.read()
+            data = (entry.content or "").encode("utf-8")
+            with zf.open(filename, mode="w") as member:
+                for start in range(0, len(data), ZIP_STREAM_CHUNK_SIZE):
+                    member.write(data[start : start + ZIP_STREAM_CHUNK_SIZE])
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
+
+
+def _build_zip_bytes(job_id: str, reports: list[ReportContent]) -> bytes:
+    return b"".join(_iter_zip_chunks(job_id, reports))
 
 
 def _apply_security_schemes(app: FastAPI, config: ServeConfig) -> None:
@@ -103,23 +187,55 @@ def _apply_security_schemes(app: FastAPI, config: ServeConfig) -> None:
         app.openapi_schema = openapi_schema
         return app.openapi_schema
 
+    # Serialized schema per root_path; the schema never changes once built.
+    serialized: dict[str, bytes] = {}
+
+    async def openapi_json(request: Request) -> Response:
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        body = serialized.get(root_path)
+        if body is None:
+            schema = app.openapi()
+            if root_path and app.root_path_in_servers:
+                server_urls = {s.get("url") for s in schema.get("servers", [])}
+                if root_path not in server_urls:
+                    schema = dict(schema)
+                    schema["servers"] = [{"url": root_path}] + schema.get("servers", [])
+            body = serialized[root_path] = dumps_json(schema, indent=False).encode(
+                "utf-8"
+            )
+        return Response(content=body, media_type="application/json")
+
     if config.server.openapi.enabled:
         app.openapi = custom_openapi  # type: ignore[assignment]
+        # Swap FastAPI's handler, which re-encodes the schema on every request.
+        app.router.routes = [
+            route
+            for route in app.router.routes
+            if getattr(route, "path", None) != app.openapi_url
+        ]
+        app.add_route(app.openapi_url, openapi_json, include_in_schema=False)
+
+
+_EXT_TO_INPUT_TYPE = {
+    ".mmd": InputType(INPUT_FORMAT_MERMAID),
+    ".mermaid": InputType(INPUT_FORMAT_MERMAID),
+    ".drawio": InputType(INPUT_FORMAT_DRAWIO),
+    ".xml": InputType(INPUT_FORMAT_DRAWIO),
+    ".json": InputType(INPUT_FORMAT_THREAT_DRAGON),
+    ".png": InputType(INPUT_FORMAT_IMAGE),
+    ".jpg": InputType(INPUT_FORMAT_IMAGE),
+    ".jpeg": InputType(INPUT_FORMAT_IMAGE),
+    ".webp": InputType(INPUT_FORMAT_IMAGE),
+}
 
 
 def _detect_input_type(filename: Optional[str]) -> Optional[InputType]:
     if not filename:
         return None
-    name = filename.lower()
-    if name.endswith((".mmd", ".mermaid")):
-        return InputType(INPUT_FORMAT_MERMAID)
-    if name.endswith((".drawio", ".xml")):
-        return InputType(INPUT_FORMAT_DRAWIO)
-    if name.endswith(".json"):
-        return InputType(INPUT_FORMAT_THREAT_DRAGON)
-    if name.endswith((".png", ".jpg", ".jpeg", ".webp")):
-        return InputType(INPUT_FORMAT_IMAGE)
-    return None
+    _, dot, ext = filename.lower().rpartition(".")
+    if not dot:
+        return None
+    return _EXT_TO_INPUT_TYPE.get(f".{ext}")
 
 
 def _input_type_value(value: object) -> str:
@@ -142,6 +258,27 @@ def _validate_body_size(request: Request, limit: int) -> None:
         return
 
 
+async def _read_upload_limited(file: UploadFile, limit: int, detail: str) -> bytes:
+    """
+    Read an uploaded file in chunks, failing with 413 as soon as it exceeds
+    `limit` bytes instead of loading an oversized upload into memory first.
+    """
+    chunks: list[bytes] = []
+    size = 0
+    while True:
+        chunk = await file.read(UPLOAD_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > limit:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=detail,
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 def _validate_context_payloads(
     contexts: list[ContextPayload], max_text_chars: int
 ) -> None:
@@ -244,7 +381,9 @@ def _options_from_request(req: AnalyzeRequest) -> AnalyzeOptions:
     )
 
 
+@lru_cache(maxsize=1)
 def _analyze_request_body_schema() -> dict:
+    # Built once per process; FastAPI only reads openapi_extra.
     json_schema = AnalyzeRequest.model_json_schema()
     multipart_schema = {
         "type": "object",
@@ -280,7 +419,7 @@ def create_app(config: ServeConfig) -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         yield
-        await redis.close()
+        await redis.aclose()
 
     app = FastAPI(
         title="Threat Thinker Serve",
@@ -301,7 +440,15 @@ def create_app(config: ServeConfig) -> FastAPI:
         )
 
     authenticator = APIKeyAuthenticator(config.security.auth)
-    redis = redis_from_url(config.queue.redis_url, decode_responses=True)
+    # One bounded pool shared by the job store, rate limiter and auth; callers
+    # wait for a free connection instead of opening sockets without limit.
+    redis = AsyncRedis.from_pool(
+        BlockingConnectionPool.from_url(
+            config.queue.redis_url,
+            decode_responses=True,
+            max_connections=config.queue.redis_max_connections,
+        )
+    )
     job_store = AsyncJobStore(redis, config.queue)
     rate_limiter = RateLimiter(redis, config.security.rate_limit)
     _apply_security_schemes(app, config)
@@ -340,6 +487,7 @@ def create_app(config: ServeConfig) -> FastAPI:
         _validate_body_size(request, config.security.request_limits.max_body_bytes)
 
         content_type = (request.headers.get("content-type") or "").lower()
+        input_bytes: Optional[bytes] = None
         if content_type.startswith("multipart/form-data"):
             form = await request.form()
             file = form.get("file")
@@ -395,7 +543,6 @@ def create_app(config: ServeConfig) -> FastAPI:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Input type '{input_type_value}' is not allowed.",
                 )
-            raw_bytes = await file.read()
             if input_type == InputType.IMAGE:
                 if (
                     file.content_type
@@ -405,18 +552,25 @@ def create_app(config: ServeConfig) -> FastAPI:
                         status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
                         detail="Image content type not allowed.",
                     )
-                if len(raw_bytes) > config.security.request_limits.max_image_bytes:
-                    raise HTTPException(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        detail="Image exceeds configured size limit.",
-                    )
+                raw_bytes = await _read_upload_limited(
+                    file,
+                    config.security.request_limits.max_image_bytes,
+                    "Image exceeds configured size limit.",
+                )
                 input_payload = InputPayload(
                     type=input_type,
                     filename=file.filename,
                     content_type=file.content_type,
-                    data_b64=base64.b64encode(raw_bytes).decode("utf-8"),
                 )
+                input_bytes = raw_bytes
             else:
+                # A UTF-8 character is at most 4 bytes, so this bounds the read
+                # without rejecting text the character limit would accept.
+                raw_bytes = await _read_upload_limited(
+                    file,
+                    4 * config.security.request_limits.max_text_chars,
+                    "Diagram text exceeds configured limit.",
+                )
                 try:
                     decoded = raw_bytes.decode("utf-8")
                 except UnicodeDecodeError:
@@ -443,12 +597,11 @@ def create_app(config: ServeConfig) -> FastAPI:
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Invalid context file payload.",
                     )
-                context_bytes = await context_file.read()
-                if len(context_bytes) > config.security.request_limits.max_text_chars:
-                    raise HTTPException(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        detail="Context file exceeds configured limit.",
-                    )
+                context_bytes = await _read_upload_limited(
+                    context_file,
+                    config.security.request_limits.max_text_chars,
+                    "Context file exceeds configured limit.",
+                )
                 context_payloads.append(
                     ContextPayload(
                         filename=context_file.filename,
@@ -481,7 +634,7 @@ def create_app(config: ServeConfig) -> FastAPI:
             job_payload = req
         else:
             try:
-                body = await request.json()
+                body = loads_json(await request.body())
             except Exception as exc:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -523,7 +676,7 @@ def create_app(config: ServeConfig) -> FastAPI:
 
         payload_dict = job_payload.model_dump()
 
-        job_id = await job_store.enqueue(payload_dict)
+        job_id = await job_store.enqueue(payload_dict, input_bytes=input_bytes)
         logger.info("Enqueued job %s", job_id)
         return JobResponse(job_id=job_id, status=STATUS_QUEUED)
 
@@ -542,24 +695,8 @@ def create_app(config: ServeConfig) -> FastAPI:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Result not available.",
             )
-        reports = result.get("reports") or []
-        parsed_reports = [
-            ReportContent(
-                report_format=entry.get("report_format"),
-                content=entry.get("content", ""),
-            )
-            for entry in reports
-            if entry.get("report_format")
-        ]
-        if not parsed_reports and result.get("report_format"):
-            parsed_reports = [
-                ReportContent(
-                    report_format=result.get("report_format"),
-                    content=result.get("content", ""),
-                )
-            ]
         return JobResultResponse(
-            reports=parsed_reports,
+            reports=_parse_reports(result),
             duration_ms=int(result["duration_ms"])
             if result.get("duration_ms")
             else None,
@@ -574,27 +711,29 @@ def create_app(config: ServeConfig) -> FastAPI:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Result not available.",
             )
-        reports = result.get("reports") or []
-        parsed_reports = [
-            ReportContent(
-                report_format=entry.get("report_format"),
-                content=entry.get("content", ""),
-            )
-            for entry in reports
-            if entry.get("report_format")
-        ]
+        parsed_reports = _parse_reports(result)
         if not parsed_reports:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No report content found for this job.",
             )
-        zip_bytes = _build_zip_bytes(job_id, parsed_reports)
+
+        async def _stream_zip():
+            chunks = _iter_zip_chunks(job_id, parsed_reports)
+            while True:
+                # Deflate off the event loop, one chunk at a time.
+                chunk = await anyio.to_thread.run_sync(
+                    next, chunks, None, limiter=_ZIP_LIMITER
+                )
+                if chunk is None:
+                    return
+                yield chunk
+
         headers = {
-            "Content-Type": "application/zip",
             "Content-Disposition": f'attachment; filename="threat-thinker-{job_id}.zip"',
         }
-        return Response(
-            content=zip_bytes, media_type="application/zip", headers=headers
+        return StreamingResponse(
+            _stream_zip(), media_type="application/zip", headers=headers
         )
 
     return app
@@ -16,6 +16,7 @@ import yaml
 
 DEFAULT_ALLOWED_INPUTS = ["mermaid", "drawio", "threat-dragon", "image", "ir"]
 DEFAULT_ALLOWED_IMAGE_TYPES = ["image/png", "image/jpeg", "image/webp"]
+EVENT_LOOPS = ("auto", "asyncio", "uvloop")
 
 
 @dataclass
@@ -35,6 +36,7 @@ class CorsConfig:
 class ServerConfig:
     bind: str = "0.0.0.0"
     port: int = 8000
+    event_loop: str = "auto"  # auto | asyncio | uvloop
     cors: CorsConfig = field(default_factory=CorsConfig)
     openapi: OpenAPIConfig = field(default_factory=OpenAPIConfig)
 
@@ -93,6 +95,7 @@ class QueueConfig:
     queue_key: str = "tt:queue"
     job_key_prefix: str = "tt:job"
     job_ttl_seconds: int = 900
+    redis_max_connections: int = 64
 
 
 @dataclass
@@ -192,6 +195,7 @@ def _load_server(data: Dict[str, Any]) -> ServerConfig:
     return ServerConfig(
         bind=srv.get("bind", "0.0.0.0"),
         port=int(srv.get("port", 8000)),
+        event_loop=str(srv.get("event_loop", "auto")).lower(),
         cors=CorsConfig(
             enabled=bool(cors_data.get("enabled", False)),
             allow_origins=_coerce_list(cors_data.get("allow_origins")),
@@ -263,6 +267,7 @@ def _load_queue(data: Dict[str, Any]) -> QueueConfig:
         queue_key=q.get("queue_key", "tt:queue"),
         job_key_prefix=q.get("job_key_prefix", "tt:job"),
         job_ttl_seconds=int(q.get("job_ttl_seconds", 900)),
+        redis_max_connections=int(q.get("redis_max_connections", 64)),
     )
 
 
@@ -326,6 +331,11 @@ def load_config(path: str) -> ServeConfig:
             "API key authentication is enabled but no API keys are configured. "
             "Set security.auth.api_keys or SERVE_API_KEYS."
         )
+    if cfg.server.event_loop not in EVENT_LOOPS:
+        raise ValueError(
+            f"Unsupported server.event_loop '{cfg.server.event_loop}'; "
+            f"expected one of: {', '.join(EVENT_LOOPS)}."
+        )
     if cfg.queue.backend != "redis":
         raise ValueError("Only Redis queue backend is supported in the serve MVP.")
     return cfg
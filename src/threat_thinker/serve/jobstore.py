@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import json
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from redis import Redis as SyncRedis
 from redis.asyncio import Redis as AsyncRedis
+from redis.client import NEVER_DECODE
 
+from threat_thinker.json_utils import dumps_json, loads_json
 from threat_thinker.serve.config import QueueConfig
 from threat_thinker.serve.schemas import JobStatus
 
@@ -30,12 +31,22 @@ def _result_key(prefix: str, job_id: str) -> str:
     return f"{prefix}:{job_id}:result"
 
 
+def _input_key(prefix: str, job_id: str) -> str:
+    return f"{prefix}:{job_id}:input"
+
+
 class AsyncJobStore:
     def __init__(self, redis: AsyncRedis, config: QueueConfig) -> None:
         self.redis = redis
         self.config = config
 
-    async def enqueue(self, payload: Dict[str, Any]) -> str:
+    async def enqueue(
+        self, payload: Dict[str, Any], input_bytes: Optional[bytes] = None
+    ) -> str:
+        """
+        Queue a job. Binary uploads are passed as `input_bytes` and stored raw
+        under their own key rather than base64-encoded inside the payload.
+        """
         job_id = str(uuid.uuid4())
         now = _utc_now()
         job_key = _job_key(self.config.job_key_prefix, job_id)
@@ -43,11 +54,20 @@ class AsyncJobStore:
             "status": STATUS_QUEUED,
             "created_at": now,
             "updated_at": now,
-            "payload": json.dumps(payload),
+            "payload": dumps_json(payload, indent=False),
         }
-        await self.redis.hset(job_key, mapping=mapping)
-        await self.redis.expire(job_key, self.config.job_ttl_seconds)
-        await self.redis.rpush(self.config.queue_key, job_id)
+        # One MULTI round trip; workers never see a queued id without its job.
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(job_key, mapping=mapping)
+            pipe.expire(job_key, self.config.job_ttl_seconds)
+            if input_bytes is not None:
+                pipe.set(
+                    _input_key(self.config.job_key_prefix, job_id),
+                    input_bytes,
+                    ex=self.config.job_ttl_seconds,
+                )
+            pipe.rpush(self.config.queue_key, job_id)
+            await pipe.execute()
         return job_id
 
     async def get_status(self, job_id: str) -> Dict[str, Any]:
@@ -75,7 +95,7 @@ class AsyncJobStore:
         if not raw:
             return None
         try:
-            result = json.loads(raw)
+            result = loads_json(raw)
         except Exception:
             return None
         result["job_id"] = job_id
@@ -105,10 +125,19 @@ class SyncJobStore:
         if not payload:
             return None
         try:
-            return json.loads(payload)
+            return loads_json(payload)
         except Exception:
             return None
 
+    def load_input_bytes(self, job_id: str) -> Optional[bytes]:
+        """Return the raw upload stored by `AsyncJobStore.enqueue`, if any."""
+        # The client decodes replies to str; binary uploads must stay bytes.
+        return self.redis.execute_command(
+            "GET",
+            _input_key(self.config.job_key_prefix, job_id),
+            **{NEVER_DECODE: []},
+        )
+
     def mark_running(self, job_id: str) -> None:
         job_key = _job_key(self.config.job_key_prefix, job_id)
         now = _utc_now()
@@ -141,6 +170,6 @@ class SyncJobStore:
         self.redis.expire(job_key, self.config.job_ttl_seconds)
         self.redis.set(
             _result_key(self.config.job_key_prefix, job_id),
-            json.dumps(result),
+            dumps_json(result, indent=False),
             ex=self.config.job_ttl_seconds,
         )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import time
-from ipaddress import ip_address, ip_network
-from typing import Mapping, Optional
+from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Mapping, Optional, Tuple, Union
 
 from redis.asyncio import Redis
 
@@ -21,9 +22,11 @@ class RateLimiter:
             return True
         minute = int(time.time() // 60)
         redis_key = f"tt:rl:{key}:{minute}"
-        count = await self.redis.incr(redis_key)
-        if count == 1:
-            await self.redis.expire(redis_key, 60)
+        # Create the window with its TTL and count the hit in one round trip.
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(redis_key, 0, ex=60, nx=True)
+            pipe.incr(redis_key)
+            _, count = await pipe.execute()
         return count <= self.config.requests_per_minute
 
     def scope_key(self, client_ip: Optional[str], api_key: Optional[str]) -> str:
@@ -69,14 +72,24 @@ def _should_trust_proxy_headers(
         client_ip = ip_address(client_host)
     except ValueError:
         return False
-    for proxy in config.trusted_proxies:
+    return any(
+        client_ip in network
+        for network in _trusted_networks(tuple(config.trusted_proxies))
+    )
+
+
+@lru_cache(maxsize=8)
+def _trusted_networks(
+    proxies: Tuple[str, ...],
+) -> Tuple[Union[IPv4Network, IPv6Network], ...]:
+    """Parse the trusted proxy list once instead of on every request."""
+    networks = []
+    for proxy in proxies:
         try:
-            network = ip_network(proxy, strict=False)
+            networks.append(ip_network(proxy, strict=False))
         except ValueError:
             continue
-        if client_ip in network:
-            return True
-    return False
+    return tuple(networks)
 
 
 def _first_valid_ip(value: str) -> Optional[str]:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import base64
-import json
 import logging
 import os
 import tempfile
@@ -26,6 +25,7 @@ from threat_thinker.context_loader import (
     read_context_text,
 )
 from threat_thinker.llm.inference import (
+    graph_skeleton_json,
     llm_infer_hints,
     llm_infer_threats,
     llm_rerank_chunks,
@@ -160,7 +160,10 @@ def _assert_provider_ready(
 
 
 def analyze_job(
-    payload: Dict[str, Any], engine: EngineConfig, timeouts: TimeoutConfig
+    payload: Dict[str, Any],
+    engine: EngineConfig,
+    timeouts: TimeoutConfig,
+    input_bytes: Optional[bytes] = None,
 ) -> AnalysisResult:
     request = AnalyzeRequest.model_validate(payload)
     job_input = request.input
@@ -183,7 +186,10 @@ def analyze_job(
         diagram_path = ""
 
         if job_input.type == "image":
-            data = _decode_bytes(job_input.data_b64)
+            if input_bytes is not None:
+                data = input_bytes
+            else:
+                data = _decode_bytes(job_input.data_b64)
             if not data:
                 raise AnalysisError("Image payload is empty.")
             diagram_path = _write_temp_bytes(data, suffix or ".png")
@@ -207,20 +213,7 @@ def analyze_job(
         )
 
         if request.infer_hints:
-            skeleton = json.dumps(
-                {
-                    "nodes": [
-                        {"id": node.id, "label": node.label}
-                        for node in graph.nodes.values()
-                    ],
-                    "edges": [
-                        {"from": edge.src, "to": edge.dst, "label": edge.label}
-                        for edge in graph.edges
-                    ],
-                },
-                ensure_ascii=False,
-                indent=2,
-            )
+            skeleton = graph_skeleton_json(graph)
             try:
                 inferred = llm_infer_hints(
                     skeleton,
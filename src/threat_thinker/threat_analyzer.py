@@ -2,14 +2,39 @@
 Threat analysis functionality
 """
 
-import json
-from dataclasses import asdict
 from typing import List, Optional
 
-from threat_thinker.models import Graph, Threat
+from threat_thinker.json_utils import dumps_json
+from threat_thinker.models import Edge, Graph, Node, Threat
 from threat_thinker.zone_utils import representative_zone_name, zone_path_names
 
 
+def node_prompt_dict(n: Node) -> dict:
+    """Shallow field dict for a node (same keys/order as dataclasses.asdict)."""
+    return {
+        "id": n.id,
+        "label": n.label,
+        "zone": n.zone,
+        "zones": n.zones,
+        "type": n.type,
+        "data": n.data,
+        "auth": n.auth,
+        "notes": n.notes,
+    }
+
+
+def edge_prompt_dict(e: Edge) -> dict:
+    """Shallow field dict for an edge (same keys/order as dataclasses.asdict)."""
+    return {
+        "src": e.src,
+        "dst": e.dst,
+        "label": e.label,
+        "protocol": e.protocol,
+        "data": e.data,
+        "id": e.id,
+    }
+
+
 def graph_to_prompt(g: Graph) -> str:
     """
     Convert graph to JSON string for LLM prompts.
@@ -22,16 +47,16 @@ def graph_to_prompt(g: Graph) -> str:
     """
     nodes = []
     for n in g.nodes.values():
-        node_dict = asdict(n)
+        node_dict = node_prompt_dict(n)
         if g.zones:
             node_dict["zone_path"] = zone_path_names(n.zones, g.zones)
             node_dict["zone"] = node_dict.get("zone") or representative_zone_name(
                 n.zones, g.zones
             )
         nodes.append(node_dict)
-    edges = [asdict(e) for e in g.edges]
+    edges = [edge_prompt_dict(e) for e in g.edges]
     # help LLM with available IDs for evidence
-    return json.dumps({"nodes": nodes, "edges": edges}, ensure_ascii=False, indent=2)
+    return dumps_json({"nodes": nodes, "edges": edges})
 
 
 def denoise_threats(
@@ -68,10 +93,10 @@ def denoise_threats(
 
     # stable sort: score desc, then severity, then title
     filtered.sort(key=lambda x: (-x.score, x.severity, x.title))
-    if topn:
-        filtered = filtered[:topn]
 
-    # merge near-duplicates by (title, evidence) signature
+    # merge near-duplicates by (title, evidence) signature before applying
+    # topn, so the highest-scored variant is kept and duplicates don't use
+    # up result slots; stop as soon as topn distinct threats are collected
     sig_seen = set()
     uniq: List[Threat] = []
     for t in filtered:
@@ -84,6 +109,8 @@ def denoise_threats(
             continue
         sig_seen.add(sig)
         uniq.append(t)
+        if topn and len(uniq) >= topn:
+            break
 
     # Assign sequential IDs to final threats
     for i, threat in enumerate(uniq, 1):
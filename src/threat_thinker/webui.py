@@ -524,20 +524,7 @@ def _generate_report(
         )
 
         if infer_hints:
-            skeleton = json.dumps(
-                {
-                    "nodes": [
-                        {"id": node.id, "label": node.label}
-                        for node in graph.nodes.values()
-                    ],
-                    "edges": [
-                        {"from": edge.src, "to": edge.dst, "label": edge.label}
-                        for edge in graph.edges
-                    ],
-                },
-                ensure_ascii=False,
-                indent=2,
-            )
+            skeleton = cli.graph_skeleton_json(graph)
             inferred = cli.llm_infer_hints(
                 skeleton,
                 llm_api,
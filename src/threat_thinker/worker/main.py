@@ -28,12 +28,20 @@ def _process_job(job_id: str, store: SyncJobStore, config: ServeConfig) -> None:
         store.mark_failed(job_id, "Job payload missing or expired.")
         return
 
+    input_bytes = None
+    if (payload.get("input") or {}).get("type") == "image":
+        input_bytes = store.load_input_bytes(job_id)
+
     store.mark_running(job_id)
     start = time.time()
 
     with ThreadPoolExecutor(max_workers=1) as executor:
         future = executor.submit(
-            analyze_job, payload, config.engine, config.security.timeouts
+            analyze_job,
+            payload,
+            config.engine,
+            config.security.timeouts,
+            input_bytes,
         )
         try:
             result = future.result(timeout=config.security.timeouts.analyze_seconds)
@@ -2,10 +2,15 @@
 Utilities for working with zones and nested trust boundaries.
 """
 
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from threat_thinker.models import Zone
 
+# Below this many rectangles the per-point Python scan beats building arrays.
+BATCH_POINT_MIN_RECTS = 32
+# Points tested per NumPy block, bounding the points x rects mask size.
+_BATCH_POINT_BLOCK = 4096
+
 
 def _rect_contains(a: Dict[str, float], b: Dict[str, float]) -> bool:
     """Return True if rectangle a fully contains rectangle b."""
@@ -123,3 +128,38 @@ def containing_zone_ids_for_point(
     """
     candidates = [rect["id"] for rect in rects if _rect_contains_point(rect, x, y)]
     return sort_zone_ids_by_hierarchy(candidates, zones)
+
+
+def containing_zone_ids_for_points(
+    points: Sequence[Tuple[float, float]],
+    rects: Sequence[Dict[str, float]],
+    zones: Dict[str, Zone],
+) -> List[List[str]]:
+    """
+    Batch form of `containing_zone_ids_for_point`: one outer->inner id list per
+    point, in order. Many rectangles are tested against all points at once
+    with NumPy instead of one Python comparison per (point, rect) pair.
+    """
+    if len(rects) < BATCH_POINT_MIN_RECTS or not points:
+        return [containing_zone_ids_for_point(x, y, rects, zones) for x, y in points]
+
+    import numpy as np  # deferred: parsers load at CLI start-up
+
+    left = np.array([rect["x"] for rect in rects], dtype=np.float64)
+    top = np.array([rect["y"] for rect in rects], dtype=np.float64)
+    right = left + np.array([rect["width"] for rect in rects], dtype=np.float64)
+    bottom = top + np.array([rect["height"] for rect in rects], dtype=np.float64)
+    ids = [rect["id"] for rect in rects]
+    coords = np.array(points, dtype=np.float64).reshape(-1, 2)
+
+    results: List[List[str]] = []
+    for start in range(0, len(coords), _BATCH_POINT_BLOCK):
+        block = coords[start : start + _BATCH_POINT_BLOCK]
+        x = block[:, 0:1]
+        y = block[:, 1:2]
+        inside = (left <= x) & (x <= right) & (top <= y) & (y <= bottom)
+        for row in inside:
+            results.append(
+                sort_zone_ids_by_hierarchy([ids[j] for j in np.flatnonzero(row)], zones)
+            )
+    return results
@@ -0,0 +1,129 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import threat_thinker.llm.inference as inference
+from threat_thinker.llm.cache import cached_json_response, configure_response_cache
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    configure_response_cache(str(tmp_path))
+    yield tmp_path
+    configure_response_cache(None)
+
+
+def _counting_client(calls):
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm(self, *, system_prompt, user_prompt, **kwargs):
+            calls.append(user_prompt)
+            return '{"nodes": {"A": {"type": "actor"}}}'
+
+    return _Client
+
+
+def test_llm_infer_hints_reuses_cached_response(monkeypatch, response_cache):
+    calls = []
+    monkeypatch.setattr(inference, "LLMClient", _counting_client(calls))
+
+    first = inference.llm_infer_hints('{"nodes": [{"id": "A"}]}', "openai", "gpt-4.1")
+    second = inference.llm_infer_hints('{"nodes": [{"id": "A"}]}', "openai", "gpt-4.1")
+
+    assert first == second == {"nodes": {"A": {"type": "actor"}}}
+    assert len(calls) == 1
+    assert len(list(response_cache.glob("*.json"))) == 1
+
+    inference.llm_infer_hints('{"nodes": [{"id": "A"}]}', "openai", "gpt-4.1-mini")
+    assert len(calls) == 2
+
+
+def test_llm_infer_hints_skips_cache_when_disabled(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(inference, "LLMClient", _counting_client(calls))
+    configure_response_cache(None)
+
+    inference.llm_infer_hints('{"nodes": []}', "openai", "gpt-4.1")
+    inference.llm_infer_hints('{"nodes": []}', "openai", "gpt-4.1")
+
+    assert len(calls) == 2
+
+
+def test_corrupt_cache_entry_is_treated_as_miss(monkeypatch, response_cache):
+    calls = []
+    monkeypatch.setattr(inference, "LLMClient", _counting_client(calls))
+
+    inference.llm_infer_hints('{"nodes": []}', "openai", "gpt-4.1")
+    for entry in response_cache.glob("*.json"):
+        entry.write_text("{truncated", encoding="utf-8")
+    result = inference.llm_infer_hints('{"nodes": []}', "openai", "gpt-4.1")
+
+    assert result == {"nodes": {"A": {"type": "actor"}}}
+    assert len(calls) == 2
+
+
+def test_no_cache_env_var_overrides_cache_dir(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(inference, "LLMClient", _counting_client(calls))
+    monkeypatch.setenv("THREAT_THINKER_NO_CACHE", "1")
+    configure_response_cache(str(tmp_path))
+
+    inference.llm_infer_hints('{"nodes": []}', "openai", "gpt-4.1")
+    inference.llm_infer_hints('{"nodes": []}', "openai", "gpt-4.1")
+
+    assert len(calls) == 2
+    assert not list(tmp_path.glob("*.json"))
+    configure_response_cache(None)
+
+
+def test_cache_key_separates_endpoints(monkeypatch, response_cache):
+    calls = []
+    monkeypatch.setattr(inference, "LLMClient", _counting_client(calls))
+    skeleton = '{"nodes": []}'
+
+    inference.llm_infer_hints(
+        skeleton, "ollama", "llama3", ollama_host="http://a:11434"
+    )
+    inference.llm_infer_hints(
+        skeleton, "ollama", "llama3", ollama_host="http://b:11434"
+    )
+    inference.llm_infer_hints(skeleton, "bedrock", "claude", aws_region="us-east-1")
+    inference.llm_infer_hints(skeleton, "bedrock", "claude", aws_region="eu-west-1")
+    inference.llm_infer_hints(
+        skeleton, "bedrock", "claude", aws_profile="dev", aws_region="eu-west-1"
+    )
+    assert len(calls) == 5
+
+    inference.llm_infer_hints(
+        skeleton, "ollama", "llama3", ollama_host="http://a:11434"
+    )
+    assert len(calls) == 5
+
+
+def test_cache_key_separates_request_formats(response_cache):
+    calls = []
+
+    def _call():
+        calls.append(1)
+        return {"ok": True}
+
+    for request_format in (
+        {"response_format": {"type": "json_object"}},
+        {"response_format": {"type": "json_schema"}},
+        {"response_format": {"type": "json_object"}},
+    ):
+        cached_json_response(
+            "openai", "gpt-4.1", "sys", "user", _call, request_format=request_format
+        )
+
+    assert len(calls) == 2
@@ -10,6 +10,7 @@ import pytest
 # Add src to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
+import threat_thinker.llm.inference as inference
 from threat_thinker.llm.inference import _validate_hints_payload
 
 
@@ -33,3 +34,359 @@ def test_validate_hints_payload_rejects_non_list_edges():
     payload = {"nodes": {}, "edges": {}}
     with pytest.raises(ValueError):
         _validate_hints_payload(payload)
+
+
+def test_llm_infer_threats_batch_parses_outputs_per_graph(monkeypatch):
+    from threat_thinker.models import Graph, Node
+
+    submitted = {}
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm_batch(self, requests, **kwargs):
+            submitted["ids"] = [custom_id for custom_id, _, _ in requests]
+            return {
+                "one": '{"threats": [{"title": "Batch threat", "severity": "High"}]}',
+                "two": "not-json",
+            }, {}
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    results = inference.llm_infer_threats_batch(
+        [("one", graph), ("two", graph)], "gpt-4.1", poll_interval=0
+    )
+
+    assert submitted["ids"] == ["one", "two"]
+    assert [t.title for t in results["one"]] == ["Batch threat"]
+    assert "two" not in results
+
+
+def test_llm_infer_threats_batch_resubmits_strict_schema_rejections(monkeypatch):
+    from threat_thinker.models import Graph, Node
+
+    submissions = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm_batch(self, requests, *, response_format, **kwargs):
+            ids = [custom_id for custom_id, _, _ in requests]
+            submissions.append((response_format["type"], ids))
+            if response_format["type"] == "json_schema":
+                return {}, {
+                    "one": {
+                        "status_code": 400,
+                        "param": "response_format",
+                        "message": "Invalid schema for response_format.",
+                    },
+                    "two": {
+                        "status_code": 400,
+                        "code": "context_length_exceeded",
+                        "message": "maximum context length exceeded",
+                    },
+                }
+            return {
+                "one": '{"threats": [{"title": "Fallback threat", "severity": "Low"}]}'
+            }, {}
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+    monkeypatch.setattr(inference, "_STRICT_SCHEMA_REJECTED", set())
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    results = inference.llm_infer_threats_batch(
+        [("one", graph), ("two", graph)], "legacy-model", poll_interval=0
+    )
+
+    # Only the schema rejection is retried, in json_object mode.
+    assert submissions == [("json_schema", ["one", "two"]), ("json_object", ["one"])]
+    assert [t.title for t in results["one"]] == ["Fallback threat"]
+    assert "two" not in results
+    assert len(inference._STRICT_SCHEMA_REJECTED) == 1
+
+
+def test_llm_infer_threats_batch_raises_when_every_graph_failed(monkeypatch):
+    from threat_thinker.models import Graph, Node
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm_batch(self, requests, **kwargs):
+            return {}, {
+                "one": {"status_code": 429, "message": "rate limit exceeded"},
+            }
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+    monkeypatch.setattr(inference, "_STRICT_SCHEMA_REJECTED", set())
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    with pytest.raises(RuntimeError, match="one: rate limit exceeded"):
+        inference.llm_infer_threats_batch([("one", graph)], "gpt-4.1", poll_interval=0)
+    assert not inference._STRICT_SCHEMA_REJECTED
+
+
+@pytest.mark.parametrize(
+    ("api", "structured"), [("openai", True), ("anthropic", False)]
+)
+def test_llm_infer_threats_uses_structured_output_when_supported(
+    monkeypatch, api, structured
+):
+    from threat_thinker.models import Graph, Node
+
+    captured = {}
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm(self, *, system_prompt, user_prompt, response_format, **kwargs):
+            captured["user_prompt"] = user_prompt
+            captured["response_format"] = response_format
+            return '{"threats": [{"title": "Threat", "severity": "Low"}]}'
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    inference.llm_infer_threats(graph, api, "model")
+
+    assert ("Required JSON structure" in captured["user_prompt"]) is not structured
+    assert "Rules:" in captured["user_prompt"]
+    if structured:
+        assert captured["response_format"] is inference.THREAT_RESPONSE_FORMAT
+    else:
+        assert captured["response_format"] == {"type": "json_object"}
+
+
+def test_llm_infer_threats_falls_back_when_strict_schema_is_rejected(monkeypatch):
+    from threat_thinker.models import Graph, Node
+
+    formats = []
+
+    class _BadRequest(Exception):
+        status_code = 400
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm(self, *, user_prompt, response_format, **kwargs):
+            formats.append(response_format["type"])
+            if response_format["type"] == "json_schema":
+                raise _BadRequest("response_format json_schema is not supported")
+            assert "Required JSON structure" in user_prompt
+            return '{"threats": [{"title": "Fallback threat", "severity": "Low"}]}'
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+    monkeypatch.setattr(inference, "_STRICT_SCHEMA_REJECTED", set())
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    first = inference.llm_infer_threats(graph, "openai", "legacy-model")
+    second = inference.llm_infer_threats(graph, "openai", "legacy-model")
+
+    assert [t.title for t in first] == ["Fallback threat"]
+    assert [t.title for t in second] == ["Fallback threat"]
+    # The rejection is remembered, so later calls go straight to json_object.
+    assert formats == ["json_schema", "json_object", "json_object"]
+
+
+def test_llm_infer_threats_propagates_other_structured_output_errors(monkeypatch):
+    from threat_thinker.models import Graph, Node
+
+    class _Unauthorized(Exception):
+        status_code = 401
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm(self, **kwargs):
+            raise _Unauthorized("invalid api key")
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+    monkeypatch.setattr(inference, "_STRICT_SCHEMA_REJECTED", set())
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    with pytest.raises(_Unauthorized):
+        inference.llm_infer_threats(graph, "openai", "model")
+    assert not inference._STRICT_SCHEMA_REJECTED
+
+
+def test_llm_infer_threats_does_not_fall_back_on_other_bad_requests(monkeypatch):
+    from threat_thinker.models import Graph, Node
+
+    formats = []
+
+    class _BadRequest(Exception):
+        status_code = 400
+        code = "context_length_exceeded"
+        param = "messages"
+        body = {
+            "message": "This model's maximum context length is 128000 tokens.",
+            "code": "context_length_exceeded",
+            "param": "messages",
+        }
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm(self, *, response_format, **kwargs):
+            formats.append(response_format["type"])
+            raise _BadRequest("maximum context length exceeded")
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+    monkeypatch.setattr(inference, "_STRICT_SCHEMA_REJECTED", set())
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    with pytest.raises(_BadRequest):
+        inference.llm_infer_threats(graph, "openai", "model")
+    assert formats == ["json_schema"]
+    assert not inference._STRICT_SCHEMA_REJECTED
+
+
+@pytest.mark.parametrize(
+    "error_body",
+    [
+        {"message": "Invalid parameter.", "param": "response_format"},
+        {"error": {"message": "'json_schema' is not supported with this model."}},
+    ],
+)
+def test_is_strict_schema_rejection_reads_error_body(error_body):
+    class _BadRequest(Exception):
+        status_code = 400
+        body = error_body
+
+    class _Unauthorized(_BadRequest):
+        status_code = 401
+
+    assert inference._is_strict_schema_rejection(_BadRequest("bad request"))
+    assert not inference._is_strict_schema_rejection(_Unauthorized("bad request"))
+
+
+def test_threat_response_format_schema_is_strict_compatible():
+    def _check(schema):
+        if schema.get("type") == "object":
+            assert schema["additionalProperties"] is False
+            assert sorted(schema["required"]) == sorted(schema["properties"])
+            for child in schema["properties"].values():
+                _check(child)
+        if schema.get("type") == "array":
+            _check(schema["items"])
+
+    _check(inference.THREAT_RESPONSE_FORMAT["json_schema"]["schema"])
+
+
+def test_get_language_name_maps_known_codes_and_uppercases_unknown():
+    assert inference._get_language_name("ja") == "Japanese"
+    assert inference._get_language_name("pt") == "Portuguese"
+    assert inference._get_language_name("xx") == "XX"
+
+
+def test_threats_from_payload_caps_at_instructed_maximum():
+    payload = {"threats": [{"title": f"T{i}"} for i in range(15)]}
+
+    threats = inference._threats_from_payload(payload)
+
+    assert len(threats) == inference.MAX_THREATS_PER_RESPONSE == 12
+    assert threats[-1].title == "T11"
+
+
+def test_llm_infer_threats_serializes_graph_once_across_fallback(monkeypatch):
+    from threat_thinker.models import Graph, Node
+
+    serialized = []
+    original = inference._graph_prompt_payload
+
+    def _counting_payload(g):
+        serialized.append(g)
+        return original(g)
+
+    class _BadRequest(Exception):
+        status_code = 400
+        param = "response_format"
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm(self, *, response_format, **kwargs):
+            if response_format["type"] == "json_schema":
+                raise _BadRequest("invalid parameter")
+            return '{"threats": [{"title": "Fallback threat", "severity": "Low"}]}'
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+    monkeypatch.setattr(inference, "_graph_prompt_payload", _counting_payload)
+    monkeypatch.setattr(inference, "_STRICT_SCHEMA_REJECTED", set())
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    inference.llm_infer_threats(graph, "openai", "legacy-model")
+
+    # The strict attempt and its json_object retry share one serialization.
+    assert serialized == [graph]
+
+
+@pytest.mark.parametrize(
+    ("api", "response", "expected_calls"),
+    [
+        ("openai", '{"findings": []}', 1),
+        ("openai", '{"threats": [{"title": ""}]}', 2),
+        ("anthropic", '{"findings": []}', 2),
+    ],
+)
+def test_llm_infer_threats_skips_retry_for_schema_shape_errors(
+    monkeypatch, api, response, expected_calls
+):
+    from threat_thinker.models import Graph, Node
+
+    calls = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def call_llm(self, **kwargs):
+            calls.append(kwargs)
+            return response
+
+    monkeypatch.setattr(inference, "LLMClient", _Client)
+    monkeypatch.setattr(inference, "count_tokens", lambda text, model: 1)
+
+    graph = Graph(nodes={"api": Node(id="api", label="API")}, edges=[])
+    with pytest.raises(RuntimeError, match="invalid JSON"):
+        inference.llm_infer_threats(graph, api, "model")
+
+    assert len(calls) == expected_calls
+
+
+def test_graph_skeleton_json_is_compact_and_keeps_non_ascii():
+    import json
+
+    from threat_thinker.models import Edge, Graph, Node
+
+    graph = Graph(
+        nodes={"u": Node(id="u", label="ユーザー"), "api": Node(id="api", label="API")},
+        edges=[Edge(src="u", dst="api", label="HTTPS")],
+    )
+
+    skeleton = inference.graph_skeleton_json(graph)
+
+    assert skeleton == json.dumps(
+        {
+            "nodes": [{"id": "u", "label": "ユーザー"}, {"id": "api", "label": "API"}],
+            "edges": [{"from": "u", "to": "api", "label": "HTTPS"}],
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
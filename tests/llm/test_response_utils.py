@@ -0,0 +1,65 @@
+"""
+Tests for LLM response repair helpers.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import threat_thinker.llm.response_utils as response_utils
+from threat_thinker.llm.response_utils import fix_truncated_json, safe_json_loads
+
+
+def test_fix_truncated_json_returns_valid_input_unchanged():
+    text = '{"threats": [{"title": "A"}]}'
+    assert fix_truncated_json(text) is text
+
+
+def test_fix_truncated_json_drops_incomplete_trailing_threat():
+    text = '{"threats": [{"title": "A", "why": "x"}, {"title": "B", "wh'
+    assert json.loads(fix_truncated_json(text)) == {
+        "threats": [{"title": "A", "why": "x"}]
+    }
+
+
+def test_fix_truncated_json_closes_nested_containers_in_order():
+    text = '{"threats": [{"title": "B", "evidence": {"nodes": ["a"], "edges": ["'
+    assert json.loads(fix_truncated_json(text)) == {
+        "threats": [{"title": "B", "evidence": {"nodes": ["a"], "edges": []}}]
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"threats": [{"title": "Uses } and ]", "why": "a \\" quoted [x"}, {"ti',
+        '{"threats": [{"title": "Uses } and ]", "why": "a \\" quoted [x"}, ',
+    ],
+)
+def test_fix_truncated_json_ignores_brackets_inside_strings(text):
+    assert json.loads(fix_truncated_json(text)) == {
+        "threats": [{"title": "Uses } and ]", "why": 'a " quoted [x'}]
+    }
+
+
+def test_safe_json_loads_repairs_truncated_first_element():
+    assert safe_json_loads('{"threats": [{"title": "A", "sev') == {"threats": []}
+
+
+def test_safe_json_loads_skips_cleanup_for_bare_json(monkeypatch):
+    def _unexpected(response):
+        raise AssertionError("bare JSON should not be cleaned")
+
+    monkeypatch.setattr(response_utils, "clean_json_response", _unexpected)
+    assert safe_json_loads('{"threats": []}') == {"threats": []}
+
+
+def test_safe_json_loads_repairs_fenced_truncated_json_quietly(capsys):
+    response = '```json\n{"threats": [{"title": "A"}, {"ti'
+    assert safe_json_loads(response) == {"threats": [{"title": "A"}]}
+    assert capsys.readouterr().out == ""
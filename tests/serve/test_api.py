@@ -17,8 +17,9 @@ def _base_config() -> ServeConfig:
 def _capture_enqueue(monkeypatch):
     captured = {}
 
-    async def _fake_enqueue(self, payload):
+    async def _fake_enqueue(self, payload, input_bytes=None):
         captured["payload"] = payload
+        captured["input_bytes"] = input_bytes
         return "job-1"
 
     monkeypatch.setattr(AsyncJobStore, "enqueue", _fake_enqueue)
@@ -250,6 +251,49 @@ def test_analyze_multipart_accepts_context_files(monkeypatch):
     assert all(ctx["data_b64"] for ctx in payload["contexts"])
 
 
+def test_analyze_multipart_image_is_queued_as_raw_bytes(monkeypatch):
+    cfg = _base_config()
+    captured = _capture_enqueue(monkeypatch)
+    client = TestClient(create_app(cfg))
+    image = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+
+    response = client.post(
+        "/v1/analyze",
+        files={"file": ("diagram.png", image, "image/png")},
+    )
+
+    assert response.status_code == 202
+    assert captured["input_bytes"] == image
+    assert captured["payload"]["input"]["type"] == "image"
+    assert captured["payload"]["input"]["data_b64"] is None
+
+
+def test_analyze_multipart_stops_reading_oversized_image(monkeypatch):
+    from starlette.datastructures import UploadFile as StarletteUploadFile
+
+    cfg = _base_config()
+    cfg.security.request_limits.max_body_bytes = 0
+    cfg.security.request_limits.max_image_bytes = 100_000
+    _capture_enqueue(monkeypatch)
+    reads = []
+    read = StarletteUploadFile.read
+
+    async def _counting_read(self, size=-1):
+        data = await read(self, size)
+        reads.append(len(data))
+        return data
+
+    monkeypatch.setattr(StarletteUploadFile, "read", _counting_read)
+    client = TestClient(create_app(cfg))
+    response = client.post(
+        "/v1/analyze",
+        files={"file": ("diagram.png", b"\0" * 1_000_000, "image/png")},
+    )
+
+    assert response.status_code == 413
+    assert sum(reads) < 1_000_000
+
+
 def test_analyze_ir_rejects_when_not_allowed(monkeypatch):
     cfg = _base_config()
     cfg.engine.allowed_inputs = ["mermaid"]
@@ -281,3 +325,114 @@ def test_analyze_multipart_json_autodetect_stays_threat_dragon(monkeypatch):
 
     assert response.status_code == 202
     assert captured["payload"]["input"]["type"] == "threat-dragon"
+
+
+def test_result_zip_is_built_off_the_event_loop_thread(monkeypatch):
+    import threading
+    import zipfile
+    from io import BytesIO
+
+    import threat_thinker.serve.api as serve_api
+
+    async def _fake_get_result(self, job_id):
+        return {"reports": [{"report_format": "markdown", "content": "# hi"}]}
+
+    monkeypatch.setattr(AsyncJobStore, "get_result", _fake_get_result)
+    threads = []
+    iter_chunks = serve_api._iter_zip_chunks
+
+    def _recording_iter(job_id, reports):
+        for chunk in iter_chunks(job_id, reports):
+            threads.append(threading.current_thread())
+            yield chunk
+
+    monkeypatch.setattr(serve_api, "_iter_zip_chunks", _recording_iter)
+    app = create_app(_base_config())
+
+    with TestClient(app) as client:
+        loop_thread = client.portal.call(threading.current_thread)
+        response = client.get("/v1/jobs/job-1/result.zip")
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(BytesIO(response.content)) as zf:
+        assert zf.read("threat-thinker-job-1.md") == b"# hi"
+    assert threads and loop_thread not in threads
+
+
+def test_openapi_json_is_built_and_serialized_once(monkeypatch):
+    import threat_thinker.serve.api as serve_api
+
+    calls = []
+    get_openapi = serve_api.get_openapi
+
+    def _counting_get_openapi(**kwargs):
+        calls.append(1)
+        return get_openapi(**kwargs)
+
+    monkeypatch.setattr(serve_api, "get_openapi", _counting_get_openapi)
+    client = TestClient(create_app(_base_config()))
+
+    first = client.get("/openapi.json")
+    second = client.get("/openapi.json")
+
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert first.content == second.content
+    schema = first.json()
+    assert "ApiKeyAuth" in schema["components"]["securitySchemes"]
+    assert "/v1/analyze" in schema["paths"]
+    assert len(calls) == 1
+
+
+def test_app_uses_bounded_redis_pool(monkeypatch):
+    from redis.asyncio import BlockingConnectionPool
+
+    captured = {}
+    init = AsyncJobStore.__init__
+
+    def _capture_init(self, redis, config):
+        captured["redis"] = redis
+        init(self, redis, config)
+
+    monkeypatch.setattr(AsyncJobStore, "__init__", _capture_init)
+    cfg = _base_config()
+    cfg.queue.redis_max_connections = 7
+    create_app(cfg)
+
+    pool = captured["redis"].connection_pool
+    assert isinstance(pool, BlockingConnectionPool)
+    assert pool.max_connections == 7
+
+
+def test_result_endpoints_share_single_report_fallback(monkeypatch):
+    import zipfile
+    from io import BytesIO
+
+    async def _fake_get_result(self, job_id):
+        return {"report_format": "markdown", "content": "# legacy"}
+
+    monkeypatch.setattr(AsyncJobStore, "get_result", _fake_get_result)
+    client = TestClient(create_app(_base_config()))
+
+    result = client.get("/v1/jobs/job-1/result")
+    archive = client.get("/v1/jobs/job-1/result.zip")
+
+    assert result.json()["reports"] == [
+        {"report_format": "markdown", "content": "# legacy"}
+    ]
+    assert archive.status_code == 200
+    with zipfile.ZipFile(BytesIO(archive.content)) as zf:
+        assert zf.read("threat-thinker-job-1.md") == b"# legacy"
+
+
+def test_detect_input_type_maps_extensions_case_insensitively():
+    from threat_thinker.serve.api import _detect_input_type
+    from threat_thinker.serve.schemas import InputType
+
+    assert _detect_input_type("flow.MMD") == InputType.MERMAID
+    assert _detect_input_type("diagram.drawio") == InputType.DRAWIO
+    assert _detect_input_type("model.json") == InputType.THREAT_DRAGON
+    assert _detect_input_type("photo.JPEG") == InputType.IMAGE
+    assert _detect_input_type("anim.gif") is None
+    assert _detect_input_type("README") is None
+    assert _detect_input_type(None) is None
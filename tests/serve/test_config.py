@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from threat_thinker.serve.config import load_config
 
 
@@ -75,3 +77,48 @@ security:
     cfg = load_config(str(config_path))
     assert cfg.security.rate_limit.trust_proxy_headers is True
     assert cfg.security.rate_limit.trusted_proxies == ["10.0.0.0/8", "192.168.0.1"]
+
+
+def test_queue_redis_max_connections(tmp_path: Path):
+    config_path = tmp_path / "serve.yaml"
+    config_path.write_text(
+        """
+security:
+  auth:
+    mode: "none"
+queue:
+  redis_max_connections: 8
+""",
+        encoding="utf-8",
+    )
+
+    cfg = load_config(str(config_path))
+    assert cfg.queue.redis_max_connections == 8
+
+
+def test_server_event_loop_is_validated(tmp_path: Path):
+    config_path = tmp_path / "serve.yaml"
+    config_path.write_text(
+        """
+server:
+  event_loop: "UVLOOP"
+security:
+  auth:
+    mode: "none"
+""",
+        encoding="utf-8",
+    )
+    assert load_config(str(config_path)).server.event_loop == "uvloop"
+
+    config_path.write_text(
+        """
+server:
+  event_loop: "trio"
+security:
+  auth:
+    mode: "none"
+""",
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError, match="event_loop"):
+        load_config(str(config_path))
@@ -16,6 +16,8 @@ async def test_async_jobstore_roundtrip():
     )
     status = await store.get_status(job_id)
     assert status["status"] == "queued"
+    assert await redis.lrange(store.config.queue_key, 0, -1) == [job_id]
+    assert await redis.ttl(f"{store.config.job_key_prefix}:{job_id}") > 0
 
     await redis.hset(
         f"{store.config.job_key_prefix}:{job_id}",
@@ -41,3 +43,22 @@ def test_sync_jobstore_load_payload_and_status():
 
     payload = store.load_payload(job_id)
     assert payload == {"hello": "world"}
+
+
+@pytest.mark.asyncio
+async def test_enqueued_input_bytes_reach_sync_store_undecoded():
+    server = fakeredis.FakeServer()
+    cfg = QueueConfig()
+    async_store = AsyncJobStore(
+        fakeredis.aioredis.FakeRedis(server=server, decode_responses=True), cfg
+    )
+    sync_store = SyncJobStore(
+        fakeredis.FakeRedis(server=server, decode_responses=True), cfg
+    )
+    image = b"\x89PNG\r\n\x1a\n\xff\x00"
+
+    job_id = await async_store.enqueue({"input": {"type": "image"}}, input_bytes=image)
+
+    assert sync_store.load_input_bytes(job_id) == image
+    assert sync_store.load_payload(job_id) == {"input": {"type": "image"}}
+    assert sync_store.load_input_bytes("missing") is None
@@ -32,3 +32,26 @@ def test_resolve_client_ip_ignores_forwarded_for_when_untrusted():
     headers = {"x-forwarded-for": "203.0.113.9"}
 
     assert resolve_client_ip("10.0.0.1", headers, config) == "10.0.0.1"
+
+
+def test_resolve_client_ip_matches_cidr_and_skips_invalid_proxies():
+    config = RateLimitConfig(
+        trust_proxy_headers=True, trusted_proxies=["not-an-ip", "10.0.0.0/8"]
+    )
+    headers = {"x-forwarded-for": "203.0.113.9"}
+
+    assert resolve_client_ip("10.1.2.3", headers, config) == "203.0.113.9"
+    assert resolve_client_ip("192.168.0.1", headers, config) == "192.168.0.1"
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_window_expires():
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    limiter = RateLimiter(redis, RateLimitConfig(enabled=True, requests_per_minute=5))
+
+    assert await limiter.allow("client1")
+    assert await limiter.allow("client1")
+
+    (key,) = await redis.keys("tt:rl:client1:*")
+    assert await redis.get(key) == "2"
+    assert 0 < await redis.ttl(key) <= 60
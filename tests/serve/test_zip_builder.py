@@ -1,7 +1,7 @@
 import zipfile
 from io import BytesIO
 
-from threat_thinker.serve.api import _build_zip_bytes, ReportContent
+from threat_thinker.serve.api import _build_zip_bytes, _iter_zip_chunks, ReportContent
 
 
 def test_build_zip_bytes_includes_reports():
@@ -16,3 +16,18 @@ def test_build_zip_bytes_includes_reports():
         assert "threat-thinker-abc123.md" in names
         assert "threat-thinker-abc123.json" in names
         assert zf.read("threat-thinker-abc123.md").decode() == "# hello"
+
+
+def test_iter_zip_chunks_streams_large_reports_in_pieces():
+    content = "".join(f"line {idx}\n" for idx in range(200_000))
+    reports = [
+        ReportContent(report_format="markdown", content=content),
+        ReportContent(report_format="html", content="<p>ok</p>"),
+    ]
+    chunks = list(_iter_zip_chunks("big", reports))
+
+    assert len(chunks) > 2
+    with zipfile.ZipFile(BytesIO(b"".join(chunks)), "r") as zf:
+        assert zf.testzip() is None
+        assert zf.read("threat-thinker-big.md").decode() == content
+        assert zf.read("threat-thinker-big.html") == b"<p>ok</p>"
@@ -113,10 +113,11 @@ def test_select_think_input_supports_ir():
         ir="graphs/system.ir.json",
     )
 
-    diagram_file, diagram_format = _select_think_input(args)
+    diagram_file, diagram_format, document = _select_think_input(args)
 
     assert diagram_file == "graphs/system.ir.json"
     assert diagram_format == INPUT_FORMAT_IR
+    assert document is None
 
 
 def test_select_think_input_keeps_json_autodetect_as_threat_dragon():
@@ -130,7 +131,39 @@ def test_select_think_input_keeps_json_autodetect_as_threat_dragon():
         ir=None,
     )
 
-    diagram_file, diagram_format = _select_think_input(args)
+    diagram_file, diagram_format, document = _select_think_input(args)
 
     assert diagram_file == str(fixture_path)
     assert diagram_format == INPUT_FORMAT_THREAT_DRAGON
+    assert document["detail"]["diagrams"]
+
+
+def test_parser_is_built_once_and_reports_current_version(monkeypatch, capsys):
+    assert cli._build_parser() is cli._build_parser()
+
+    monkeypatch.setattr(cli, "get_threat_thinker_version", lambda: "1.2.3")
+    monkeypatch.setattr(sys, "argv", ["threat-thinker", "--version"])
+    try:
+        cli.main()
+    except SystemExit as exc:
+        assert exc.code == 0
+
+    assert capsys.readouterr().out == "1.2.3 (Threat Thinker)\n"
+
+
+def test_importing_cli_does_not_load_rag_stack():
+    import subprocess
+
+    src = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys, threat_thinker.main; "
+        "print('threat_thinker.rag.local' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src)},
+    )
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import threat_thinker.cliui as cliui
+from threat_thinker.cliui import (
+    Colors,
+    LogLevel,
+    ModernCLI,
+    ProgressBar,
+    ThinkingIndicator,
+)
+from threat_thinker.models import ImportMetrics
+
+
+def test_thinking_indicator_stop_wakes_animation_thread(capsys):
+    indicator = ThinkingIndicator("Parsing")
+    indicator.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    indicator.stop()
+
+    assert time.monotonic() - started < 0.4
+    assert not indicator.thread.is_alive()
+    assert "Parsing..." in capsys.readouterr().out
+
+
+def test_thinking_indicator_can_restart():
+    indicator = ThinkingIndicator()
+    indicator.start()
+    indicator.stop()
+    indicator.start()
+    assert indicator.thread.is_alive()
+    indicator.stop()
+    assert not indicator.thread.is_alive()
+
+
+def test_thinking_indicator_reuse_switches_message_and_clears_longest(capsys):
+    indicator = ThinkingIndicator()
+    indicator.start("Parsing diagram structure")
+    time.sleep(0.05)
+    indicator.set_message("Short")
+    indicator.stop()
+    first = capsys.readouterr().out
+    assert "Parsing diagram structure..." in first
+    # The clear pass covers the longer message that was on screen.
+    assert " " * len("Parsing diagram structure") in first.rsplit("\r", 2)[-2]
+
+    indicator.start("Identifying threats")
+    time.sleep(0.05)
+    indicator.stop()
+    assert "Identifying threats..." in capsys.readouterr().out
+
+
+def test_log_renders_styled_line_and_hides_debug(capsys):
+    cli = ModernCLI(verbose=False)
+    cli.success("Saved")
+    cli.debug("hidden")
+    cli.log(LogLevel.WARNING, "Careful", "line one\n\nline two")
+
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == f"{Colors.GREEN}✅ Saved{Colors.RESET}"
+    assert out[1] == f"{Colors.YELLOW}⚠️ Careful{Colors.RESET}"
+    assert out[2:] == [
+        f"  {Colors.DIM}line one{Colors.RESET}",
+        f"  {Colors.DIM}line two{Colors.RESET}",
+    ]
+
+
+def test_progress_bar_throttles_redraws_but_always_draws_completion(
+    capsys, monkeypatch
+):
+    clock = [100.0]
+    monkeypatch.setattr(cliui.time, "monotonic", lambda: clock[0])
+
+    bar = ProgressBar(total=10)
+    for _ in range(5):
+        bar.update()
+    assert capsys.readouterr().out.count("\r") == 1
+
+    clock[0] += 2 * cliui.PROGRESS_REDRAW_INTERVAL
+    bar.update()
+    bar.update()
+    out = capsys.readouterr().out
+    assert out.count("\r") == 1
+    assert "(6/10)" in out
+
+    bar.update(4)
+    bar.finish()
+    out = capsys.readouterr().out
+    assert out.count("(10/10)") == 2
+    assert out.endswith("\n")
+
+
+def test_show_metrics_summary_prints_bullets_in_order(capsys):
+    metrics = ImportMetrics(
+        total_lines=12, edge_candidates=4, edges_parsed=3, node_label_candidates=1
+    )
+    ModernCLI().show_metrics_summary(metrics)
+
+    out = capsys.readouterr().out.splitlines()
+    assert "Parsing metrics:" in out[0]
+    assert "Processed" in out[1] and "12" in out[1]
+    assert "Found" in out[2] and "3" in out[2]
+    assert "Success rate:" in out[3] and "60.0%" in out[3]
@@ -210,6 +210,26 @@ class TestExportMd:
         assert "System|A" in result
         assert "Reason|with|pipes" in result
         assert "Action|with|pipes" in result
+        # Summary table cells escape pipes so the row keeps four columns
+        assert "| T001 | Title\\|with\\|pipes | Low | 3.0 |" in result
+
+    def test_markdown_table_folds_newlines(self):
+        """Test that multi-line titles stay on one summary table row"""
+        threat = Threat(
+            id="T001",
+            title="Line one\nline two",
+            stride=["S"],
+            severity="High",
+            score=8.0,
+            affected=["API"],
+            why="Reason",
+            references=[],
+            recommended_action="Fix",
+        )
+
+        result = export_md([threat], None)
+
+        assert "| T001 | Line one line two | High | 8.0 |" in result
 
 
 class TestExportHtml:
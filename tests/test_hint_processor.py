@@ -212,3 +212,46 @@ class TestMergeLlmHints:
         result = merge_llm_hints(graph, hints)
 
         assert "A" not in result.nodes
+
+    def test_merge_edge_hints_updates_first_parallel_edge(self):
+        """Test edge hints target the first edge for a repeated src/dst pair"""
+        graph = Graph()
+        graph.nodes["A"] = Node(id="A", label="A")
+        graph.nodes["B"] = Node(id="B", label="B")
+        graph.edges.append(Edge(src="A", dst="B", label="login"))
+        graph.edges.append(Edge(src="A", dst="B", label="logout"))
+        graph.edges.append(Edge(src="B", dst="A", label="reply"))
+
+        hints = {
+            "edges": [
+                {"from": "A", "to": "B", "protocol": "HTTPS"},
+                {"from": "B", "to": "A", "protocol": "HTTP"},
+            ]
+        }
+
+        result = merge_llm_hints(graph, hints)
+
+        assert [e.protocol for e in result.edges] == ["HTTPS", None, "HTTP"]
+
+    def test_merge_hints_data_keeps_first_seen_order(self):
+        """Test merged data lists are deduplicated in insertion order"""
+        graph = Graph()
+        graph.nodes["A"] = Node(id="A", label="A", data=["pii", "tokens"])
+        graph.nodes["B"] = Node(id="B", label="B")
+        graph.edges.append(Edge(src="A", dst="B", data=["session"]))
+
+        hints = {
+            "nodes": {"A": {"data": ["secrets", "pii", "credentials", 42]}},
+            "edges": [{"from": "A", "to": "B", "data": ["pii", "session", "jwt"]}],
+        }
+
+        result = merge_llm_hints(graph, hints)
+
+        assert result.nodes["A"].data == [
+            "pii",
+            "tokens",
+            "secrets",
+            "credentials",
+            "42",
+        ]
+        assert result.edges[0].data == ["session", "pii", "jwt"]
@@ -29,5 +29,34 @@ def test_detect_input_format_keeps_json_as_threat_dragon():
     assert detected == loader.INPUT_FORMAT_THREAT_DRAGON
 
 
+def test_detected_threat_dragon_document_is_passed_to_parser(monkeypatch):
+    captured = {}
+
+    def _fake_parse_threat_dragon(path, document=None):
+        captured["document"] = document
+        return "graph", "metrics"
+
+    monkeypatch.setattr(loader, "parse_threat_dragon", _fake_parse_threat_dragon)
+
+    path = str(FIXTURE_DIR / "threat_dragon_simple.json")
+    input_format, document = loader.detect_input(path)
+    loader.load_input(input_format, path, document=document)
+
+    assert input_format == loader.INPUT_FORMAT_THREAT_DRAGON
+    assert captured["document"] is document
+
+
+def test_detect_input_format_maps_extensions_case_insensitively(monkeypatch):
+    monkeypatch.setattr(loader, "load_threat_dragon_json", lambda path: None)
+
+    assert loader.detect_input_format("diagrams/System.MMD") == "mermaid"
+    assert loader.detect_input_format("arch.v2.drawio") == "drawio"
+    assert loader.detect_input_format("export.xml") == "drawio"
+    assert loader.detect_input_format("photo.WebP") == "image"
+    assert loader.detect_input_format("system.ir.json") is None
+    assert loader.detect_input_format("notes.txt") is None
+    assert loader.detect_input_format("Makefile") is None
+
+
 def test_suffix_for_text_input_supports_ir():
     assert loader.suffix_for_text_input(loader.INPUT_FORMAT_IR) == ".json"
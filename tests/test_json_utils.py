@@ -0,0 +1,72 @@
+"""
+Tests for JSON serialization helpers.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import threat_thinker.json_utils as json_utils
+from threat_thinker.json_utils import dumps_json, loads_json
+
+SAMPLE = {
+    "threats": [{"id": "T1", "title": "認証の欠如", "score": 7.5, "evidence": []}],
+    "graph": {"nodes": [{"id": "A", "auth": None, "data": ["PII"]}]},
+    "count": 1,
+}
+
+
+def test_dumps_json_matches_stdlib_pretty_output():
+    assert dumps_json(SAMPLE) == json.dumps(SAMPLE, ensure_ascii=False, indent=2)
+
+
+def test_dumps_json_compact_round_trips():
+    compact = dumps_json(SAMPLE, indent=False)
+    assert "\n" not in compact
+    assert json.loads(compact) == SAMPLE
+
+
+def test_dumps_json_falls_back_for_wide_integers():
+    value = {"big": 2**70}
+    assert json.loads(dumps_json(value)) == value
+    assert dumps_json(value, indent=False) == '{"big":1180591620717411303424}'
+
+
+def test_loads_json_parses_and_raises_stdlib_error():
+    text = json.dumps(SAMPLE, ensure_ascii=False)
+
+    assert loads_json(text) == SAMPLE
+    with pytest.raises(json.JSONDecodeError):
+        loads_json('{"threats": [')
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "{}",
+        "{}\n",
+        '{\n  "a": 1\n}',
+        '{\r\n  "a": "x"\r\n}\r\n',
+        "\n\n",
+        '{\r"a":1\r}\r',
+        '{\r"a":1\r}',
+        '{"a": "x\u2028y\u2029z"}',
+        '{"a": "\x85"}\n',
+        '{"a": "\u2028"}\u2029',
+        '{"a": "é"}\r\n\r',
+    ],
+)
+def test_count_json_lines_matches_splitlines(text):
+    raw = text.encode("utf-8")
+    assert json_utils.count_json_lines(raw) == len(text.splitlines())
+
+
+def test_count_json_lines_counts_cr_only_and_unicode_line_breaks():
+    assert json_utils.count_json_lines(b'{\r"a":1\r}\r') == 3
+    assert json_utils.count_json_lines('{"a": "x\u2028y"}'.encode("utf-8")) == 2
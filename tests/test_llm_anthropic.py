@@ -0,0 +1,21 @@
+import pytest
+
+from threat_thinker.llm.providers.anthropic import AnthropicProvider
+
+
+def test_anthropic_providers_share_client_per_api_key(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-one")
+    first = AnthropicProvider()
+    second = AnthropicProvider()
+    assert first.client is second.client
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-two")
+    rotated = AnthropicProvider()
+    assert rotated.client is not first.client
+    assert rotated.client.api_key == "sk-ant-two"
+
+
+def test_anthropic_provider_requires_api_key(monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    with pytest.raises(RuntimeError, match="ANTHROPIC_API_KEY"):
+        AnthropicProvider()
@@ -0,0 +1,81 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from threat_thinker.llm.providers.openai import OpenAIProvider
+
+
+def test_openai_providers_share_client_per_api_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-one")
+    first = OpenAIProvider()
+    second = OpenAIProvider()
+    assert first.client is second.client
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-two")
+    rotated = OpenAIProvider()
+    assert rotated.client is not first.client
+    assert rotated.client.api_key == "sk-test-two"
+
+
+def test_openai_provider_requires_api_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    with pytest.raises(RuntimeError, match="OPENAI_API_KEY"):
+        OpenAIProvider()
+
+
+def test_openai_call_api_batch_collects_per_request_errors(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-batch")
+    provider = OpenAIProvider()
+
+    ok = {
+        "custom_id": "one",
+        "response": {
+            "status_code": 200,
+            "body": {"choices": [{"message": {"content": '{"threats": []}'}}]},
+        },
+        "error": None,
+    }
+    failed = {
+        "custom_id": "two",
+        "response": {
+            "status_code": 400,
+            "body": {
+                "error": {
+                    "message": "Invalid schema for response_format.",
+                    "param": "response_format",
+                    "code": None,
+                }
+            },
+        },
+        "error": None,
+    }
+    files = {
+        "out": json.dumps(ok) + "\n",
+        "err": json.dumps(failed) + "\n",
+    }
+    batch = SimpleNamespace(
+        id="batch_1", status="completed", output_file_id="out", error_file_id="err"
+    )
+    provider.client = SimpleNamespace(
+        files=SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="input"),
+            content=lambda file_id: SimpleNamespace(text=files[file_id]),
+        ),
+        batches=SimpleNamespace(create=lambda **kwargs: batch),
+    )
+
+    outputs, errors = provider.call_api_batch(
+        "gpt-4.1", [("one", "sys", "a"), ("two", "sys", "b")], poll_interval=0
+    )
+
+    assert outputs == {"one": '{"threats": []}'}
+    assert errors == {
+        "two": {
+            "status_code": 400,
+            "code": None,
+            "param": "response_format",
+            "message": "Invalid schema for response_format.",
+        }
+    }
@@ -1,4 +1,8 @@
+import json
+import threading
+
 import numpy as np
+import pytest
 
 from threat_thinker.models import Edge, Graph, Node, Threat
 from threat_thinker.rag import (
@@ -66,7 +70,15 @@ def test_retrieve_context_limits_results_dense_strategy(monkeypatch):
         edges=[Edge(src="A", dst="B", label="SQL over TLS")],
     )
 
-    def _fake_search(kb_name, query, topk, embed_fn=None, strategy="dense"):
+    def _fake_search(
+        kb_name,
+        query,
+        topk,
+        embed_fn=None,
+        strategy="dense",
+        bundle=None,
+        query_vec=None,
+    ):
         return [
             {
                 "kb": kb_name,
@@ -87,6 +99,65 @@ def test_retrieve_context_limits_results_dense_strategy(monkeypatch):
     assert "Web Server" in ctx["query"]
 
 
+def test_retrieve_context_uses_preloaded_bundles(monkeypatch):
+    graph = Graph(nodes={"A": Node(id="A", label="Web Server")}, edges=[])
+    seen = []
+
+    def _fake_search(
+        kb_name,
+        query,
+        topk,
+        embed_fn=None,
+        strategy="dense",
+        bundle=None,
+        query_vec=None,
+    ):
+        seen.append((kb_name, bundle))
+        return []
+
+    def _no_load(kb_name):
+        raise AssertionError("preloaded KBs must not be reloaded")
+
+    monkeypatch.setattr(rag_local, "search_kb", _fake_search)
+    monkeypatch.setattr(rag_local, "_load_kb_bundle", _no_load)
+    options = RetrievalOptions(
+        strategy="dense", reranker="off", candidates=5, min_score=0.0
+    )
+    bundles = [object(), object()]
+    retrieve_context_for_graph(
+        graph, ["kb1", "kb2"], topk=1, options=options, bundles=bundles
+    )
+    # Searches run concurrently, so only the KB-to-bundle pairing is fixed.
+    assert len(seen) == 2
+    assert dict(seen) == {"kb1": bundles[0], "kb2": bundles[1]}
+
+
+def test_dense_retrieval_searches_kbs_concurrently(monkeypatch):
+    graph = Graph(nodes={"A": Node(id="A", label="Web Server")}, edges=[])
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _fake_search(
+        kb_name,
+        query,
+        topk,
+        embed_fn=None,
+        strategy="dense",
+        bundle=None,
+        query_vec=None,
+    ):
+        # Only returns once all three KB searches are in flight together.
+        barrier.wait()
+        return [{"kb": kb_name, "chunk_id": "c", "score": 0.5, "text": kb_name}]
+
+    monkeypatch.setattr(rag_local, "search_kb", _fake_search)
+    options = RetrievalOptions(strategy="dense", reranker="off")
+    ctx = retrieve_context_for_graph(
+        graph, ["kb1", "kb2", "kb3"], topk=3, options=options
+    )
+
+    assert [r["kb"] for r in ctx["results"]] == ["kb1", "kb2", "kb3"]
+
+
 def test_hybrid_prioritizes_sparse_relevance(tmp_path, monkeypatch):
     kb_root = tmp_path / "kb"
     monkeypatch.setenv("THREAT_THINKER_KB_ROOT", str(kb_root))
@@ -432,3 +503,122 @@ def test_attach_rag_sources_uses_rerank_fn_for_backfill():
     assert dropped == 0
     assert len(enriched) == 1
     assert enriched[0].rag_sources[0]["chunk_id"] == "b1"
+
+
+def _write_kb(kb_root, name, texts, dim=4, dtype=np.float32):
+    kb_path = kb_root / name
+    kb_path.mkdir(parents=True)
+    with open(kb_path / "chunks.jsonl", "w", encoding="utf-8") as f:
+        for idx, text in enumerate(texts):
+            f.write(
+                json.dumps(
+                    {"chunk_id": f"{name}-{idx}", "source": f"{name}.md", "text": text}
+                )
+                + "\n"
+            )
+    vectors = (np.eye(len(texts), dim) + 0.1).astype(dtype)
+    np.save(kb_path / "embeddings.npy", vectors)
+
+
+def test_hybrid_embeds_all_query_variants_in_one_call(tmp_path, monkeypatch):
+    kb_root = tmp_path / "kb"
+    monkeypatch.setenv("THREAT_THINKER_KB_ROOT", str(kb_root))
+    _write_kb(kb_root, "kb1", ["session management", "sql injection"])
+    _write_kb(kb_root, "kb2", ["tls configuration", "audit logging"])
+
+    calls = []
+
+    def _counting_embed(texts, model):
+        calls.append(list(texts))
+        return _fake_embed(texts, model)
+
+    graph = Graph(
+        nodes={
+            "A": Node(id="A", label="Web", zone="Internet", data=["PII"]),
+            "B": Node(id="B", label="DB", zone="Private", data=["PII"]),
+        },
+        edges=[Edge(src="A", dst="B", label="SQL", protocol="sql")],
+    )
+    options = RetrievalOptions(strategy="hybrid", reranker="off", min_score=0.0)
+    ctx = retrieve_context_for_graph(
+        graph, ["kb1", "kb2"], topk=2, embed_fn=_counting_embed, options=options
+    )
+
+    assert len(calls) == 1
+    assert calls[0] == ctx["queries"]
+    assert len(ctx["queries"]) > 1
+    assert ctx["results"]
+
+
+def test_top_indices_matches_full_sort():
+    scores = np.array([0.1, 0.9, 0.4, 0.7, 0.2], dtype=np.float32)
+
+    assert rag_local._top_indices(scores, 3).tolist() == [1, 3, 2]
+    assert rag_local._top_indices(scores, 10).tolist() == [1, 3, 2, 4, 0]
+
+
+def test_loaded_kb_embeddings_are_unit_rows(tmp_path, monkeypatch):
+    kb_root = tmp_path / "kb"
+    monkeypatch.setenv("THREAT_THINKER_KB_ROOT", str(kb_root))
+    _write_kb(kb_root, "kb1", ["session management", "sql injection"])
+
+    (bundle,) = rag_local.load_kb_bundles(["kb1"])
+
+    assert np.allclose(np.linalg.norm(bundle.embeddings, axis=1), 1.0)
+
+
+def test_float16_kb_stays_half_precision_and_ranks_like_float32(tmp_path, monkeypatch):
+    kb_root = tmp_path / "kb"
+    monkeypatch.setenv("THREAT_THINKER_KB_ROOT", str(kb_root))
+    texts = ["session management", "sql injection", "tls configuration"]
+    _write_kb(kb_root, "half", texts, dtype=np.float16)
+    _write_kb(kb_root, "full", texts)
+    monkeypatch.setattr(rag_local, "_MATVEC_TILE_ROWS", 2)
+
+    half, full = rag_local.load_kb_bundles(["half", "full"])
+    query = np.array([0.1, 0.2, 1.0, 0.0], dtype=np.float32)
+    half_rank = rag_local._dense_rank(
+        half.chunks, half.embeddings, "q", 3, "m", None, query_vec=query
+    )
+    full_rank = rag_local._dense_rank(
+        full.chunks, full.embeddings, "q", 3, "m", None, query_vec=query
+    )
+
+    assert half.embeddings.dtype == np.float16
+    assert half_rank[0] == full_rank[0] == [2, 1, 0]
+    assert np.allclose(
+        [half_rank[1][i] for i in range(3)],
+        [full_rank[1][i] for i in range(3)],
+        atol=1e-3,
+    )
+
+
+def test_openai_embeddings_reuse_shared_provider_client(monkeypatch):
+    from threat_thinker.llm.providers.openai import OpenAIProvider
+
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-embed")
+    shared = OpenAIProvider().client
+    calls = []
+
+    class _Item:
+        def __init__(self, vec):
+            self.embedding = vec
+
+    def _create(model, input):
+        calls.append(len(input))
+        return type("R", (), {"data": [_Item([1.0, 0.0]) for _ in input]})()
+
+    monkeypatch.setattr(shared.embeddings, "create", _create)
+
+    first = rag_local._embed_with_openai(["a", "b"], "m")
+    second = rag_local._embed_with_openai(["c"], "m")
+
+    assert calls == [2, 1]
+    assert first.shape == (2, 2) and second.shape == (1, 2)
+
+
+def test_openai_embeddings_require_api_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    with pytest.raises(rag_local.KnowledgeBaseError, match="OPENAI_API_KEY"):
+        rag_local._embed_with_openai(["a"], "m")
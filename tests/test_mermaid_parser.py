@@ -283,3 +283,94 @@ ext --> api"""
             assert graph.nodes["ext"].zones == [zones_by_name["Internet"]]
         finally:
             os.unlink(temp_path)
+
+    def test_node_in_several_subgraphs_keeps_every_enclosing_zone(self):
+        """Test repeat sightings union their zone chains, outer to inner"""
+        content = """graph TD
+subgraph Cloud
+  subgraph VPC
+    subgraph Private
+      svc --> db
+      svc --> cache
+    end
+  end
+  subgraph Edge
+    cdn --> svc
+  end
+end"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".mmd", delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            graph, _ = parse_mermaid(temp_path)
+            ids = {z.name: zid for zid, z in graph.zones.items()}
+            assert graph.nodes["svc"].zones == [
+                ids["Cloud"],
+                ids["VPC"],
+                ids["Edge"],
+                ids["Private"],
+            ]
+            assert graph.nodes["cdn"].zones == [ids["Cloud"], ids["Edge"]]
+            assert graph.nodes["db"].zone == "Private"
+        finally:
+            os.unlink(temp_path)
+
+    def test_subgraph_end_keyword_is_exact(self):
+        """Test 'end' closes a subgraph only as a standalone keyword"""
+        content = """graph TD
+SUBGRAPH Edge[DMZ]
+  endpoint[Public Endpoint]
+END
+endpoint --> db"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".mmd", delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            graph, _ = parse_mermaid(temp_path)
+            assert [z.name for z in graph.zones.values()] == ["DMZ"]
+            assert graph.nodes["endpoint"].label == "Public Endpoint"
+            assert graph.nodes["endpoint"].zone == "DMZ"
+            assert graph.nodes["db"].zones == []
+        finally:
+            os.unlink(temp_path)
+
+    def test_node_shapes_resolve_to_labels(self):
+        """Test every supported node shape yields its inner label"""
+        from threat_thinker.parsers.mermaid_parser import _parse_node_token
+
+        assert _parse_node_token("db[(Orders DB)]") == ("db", "Orders DB")
+        assert _parse_node_token("api((API))") == ("api", "API")
+        assert _parse_node_token("hex{{Router}}") == ("hex", "Router")
+        assert _parse_node_token("sub[[Batch]]") == ("sub", "Batch")
+        assert _parse_node_token('web["Web App"]') == ("web", "Web App")
+        assert _parse_node_token("svc(Service)") == ("svc", "Service")
+        assert _parse_node_token("gw{Gateway}") == ("gw", "Gateway")
+        assert _parse_node_token("flag>Flag]") == (None, None)
+        assert _parse_node_token("plain") == ("plain", None)
+
+    def test_plain_arrow_fast_path_matches_edge_regexes(self, monkeypatch):
+        """Test the string-split fast path parses exactly like the regexes"""
+        import threat_thinker.parsers.mermaid_parser as mermaid_parser
+
+        lines = [
+            "user[User] --> web[Web App]",
+            "api-gw --> order-svc[(Orders)]",
+            "a-->b",
+            "-->_",
+            "a --> b --> c",
+            "web -- REST --> api",
+            "api -->|HTTPS| db",
+            "a <--> b",
+            "a ---> b",
+            "a->b --> c",
+        ]
+        fast = {line: mermaid_parser._parse_edge_entries(line) for line in lines}
+        monkeypatch.setattr(mermaid_parser, "_plain_arrow_split", lambda line: None)
+        slow = {line: mermaid_parser._parse_edge_entries(line) for line in lines}
+
+        assert fast == slow
+        assert fast["user[User] --> web[Web App]"] == [
+            ("user", "web", None, "User", "Web App")
+        ]
@@ -0,0 +1,200 @@
+import numpy as np
+import pytest
+
+from threat_thinker.models import Graph, Node
+from threat_thinker.rag import (
+    RetrievalOptions,
+    SemanticCache,
+    retrieve_context_for_graph,
+)
+import threat_thinker.rag.local as rag_local
+
+
+def test_semantic_cache_hits_similar_vectors_only_within_scope(tmp_path):
+    cache = SemanticCache(tmp_path / "cache.json", threshold=0.95)
+    cache.store("scope", np.array([1.0, 0.0, 0.0, 0.0]), {"context_text": "cached"})
+
+    assert cache.lookup("scope", np.array([1.0, 0.01, 0.0, 0.0])) == {
+        "context_text": "cached"
+    }
+    assert cache.lookup("scope", np.array([0.0, 1.0, 0.0, 0.0])) is None
+    assert cache.lookup("other", np.array([1.0, 0.0, 0.0, 0.0])) is None
+
+
+def test_semantic_cache_round_trips_through_disk(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = SemanticCache(path)
+    cache.store("scope", np.array([0.2, 0.4, 0.6]), {"results": [{"kb": "kb1"}]})
+    cache.save()
+
+    reloaded = SemanticCache.load(path)
+    assert len(reloaded) == 1
+    assert reloaded.lookup("scope", np.array([0.2, 0.4, 0.6])) == {
+        "results": [{"kb": "kb1"}]
+    }
+
+
+def test_semantic_cache_keeps_newest_entries(tmp_path):
+    cache = SemanticCache(max_entries=2)
+    for idx in range(3):
+        vector = np.zeros(3)
+        vector[idx] = 1.0
+        cache.store("scope", vector, {"idx": idx})
+
+    assert len(cache) == 2
+    assert cache.lookup("scope", np.array([1.0, 0.0, 0.0])) is None
+    assert cache.lookup("scope", np.array([0.0, 0.0, 1.0])) == {"idx": 2}
+
+
+def test_retrieve_context_reuses_semantic_cache_hit(monkeypatch):
+    graph = Graph(nodes={"A": Node(id="A", label="Web Server")}, edges=[])
+    calls = []
+
+    def _fake_search(
+        kb_name,
+        query,
+        topk,
+        embed_fn=None,
+        strategy="dense",
+        bundle=None,
+        query_vec=None,
+    ):
+        calls.append(kb_name)
+        return [{"kb": kb_name, "chunk_id": "c1", "score": 0.9, "text": "t"}]
+
+    monkeypatch.setattr(rag_local, "search_kb", _fake_search)
+    bundle = rag_local.LoadedKB(
+        name="kb1",
+        chunks=[],
+        embeddings=np.zeros((0, 2)),
+        meta={},
+        bm25_df={},
+        bm25_avgdl=0.0,
+    )
+    options = RetrievalOptions(strategy="dense", reranker="off")
+    cache = SemanticCache()
+
+    def _embed(texts, model):
+        return np.ones((len(texts), 2), dtype=np.float32)
+
+    kwargs = dict(
+        topk=1, embed_fn=_embed, options=options, bundles=[bundle], semantic_cache=cache
+    )
+    first = retrieve_context_for_graph(graph, ["kb1"], **kwargs)
+    second = retrieve_context_for_graph(graph, ["kb1"], **kwargs)
+
+    assert calls == ["kb1"]
+    assert second == first
+    assert len(cache) == 1
+
+
+def test_retrieve_context_semantic_cache_hit_reports_current_query(monkeypatch):
+    monkeypatch.setattr(
+        rag_local,
+        "search_kb",
+        lambda kb_name, query, **kwargs: [
+            {"kb": kb_name, "chunk_id": "c1", "score": 0.9, "text": "t"}
+        ],
+    )
+    bundle = rag_local.LoadedKB(
+        name="kb1",
+        chunks=[],
+        embeddings=np.zeros((0, 2)),
+        meta={},
+        bm25_df={},
+        bm25_avgdl=0.0,
+    )
+    cache = SemanticCache()
+    kwargs = dict(
+        topk=1,
+        embed_fn=lambda texts, model: np.ones((len(texts), 2), dtype=np.float32),
+        options=RetrievalOptions(strategy="dense", reranker="off"),
+        bundles=[bundle],
+        semantic_cache=cache,
+    )
+    web = Graph(nodes={"A": Node(id="A", label="Web Server")}, edges=[])
+    api = Graph(nodes={"A": Node(id="A", label="API Server")}, edges=[])
+
+    first = retrieve_context_for_graph(web, ["kb1"], **kwargs)
+    second = retrieve_context_for_graph(api, ["kb1"], **kwargs)
+
+    assert second["results"] == first["results"]
+    assert second["query"] == rag_local.generate_graph_query(api)
+    # `first` is the stored payload; the hit must not rewrite it.
+    assert first["query"] == rag_local.generate_graph_query(web)
+
+
+def test_retrieve_context_semantic_cache_scope_includes_reranker(monkeypatch):
+    graph = Graph(nodes={"A": Node(id="A", label="Web Server")}, edges=[])
+    retrieved = []
+
+    def _fake_retrieve(graph, query, *args, **kwargs):
+        retrieved.append(query)
+        return {"query": query, "queries": [query], "results": []}
+
+    monkeypatch.setattr(rag_local, "_retrieve_context", _fake_retrieve)
+    bundle = rag_local.LoadedKB(
+        name="kb1",
+        chunks=[],
+        embeddings=np.zeros((0, 2)),
+        meta={},
+        bm25_df={},
+        bm25_avgdl=0.0,
+    )
+    cache = SemanticCache()
+    kwargs = dict(
+        topk=1,
+        embed_fn=lambda texts, model: np.ones((len(texts), 2), dtype=np.float32),
+        options=RetrievalOptions(strategy="hybrid", reranker="llm"),
+        rerank_fn=lambda q, candidates: [1.0] * len(candidates),
+        bundles=[bundle],
+        semantic_cache=cache,
+    )
+
+    retrieve_context_for_graph(graph, ["kb1"], rerank_id="openai:a", **kwargs)
+    retrieve_context_for_graph(graph, ["kb1"], rerank_id="openai:a", **kwargs)
+    retrieve_context_for_graph(graph, ["kb1"], rerank_id="anthropic:b", **kwargs)
+    # A reranker without an id cannot be told apart, so it skips the cache.
+    retrieve_context_for_graph(graph, ["kb1"], **kwargs)
+
+    assert len(retrieved) == 3
+    assert len(cache) == 2
+
+
+@pytest.mark.parametrize("strategy", ["dense", "hybrid"])
+def test_retrieve_context_embeds_query_once_on_cache_miss(strategy):
+    graph = Graph(nodes={"A": Node(id="A", label="Web Server")}, edges=[])
+    chunks = [
+        {"chunk_id": "c1", "source": "doc", "text": "web server hardening"},
+        {"chunk_id": "c2", "source": "doc", "text": "database backups"},
+    ]
+    bundle = rag_local.LoadedKB(
+        name="kb1",
+        chunks=chunks,
+        embeddings=np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32),
+        meta={},
+        bm25_df={"web": 1, "server": 1, "hardening": 1, "database": 1, "backups": 1},
+        bm25_avgdl=2.5,
+        chunk_ids=rag_local._object_column(c["chunk_id"] for c in chunks),
+        sources=rag_local._object_column(c["source"] for c in chunks),
+        texts=rag_local._object_column(c["text"] for c in chunks),
+    )
+    embedded = []
+
+    def _embed(texts, model):
+        embedded.extend(texts)
+        return np.tile(np.array([1.0, 0.2], dtype=np.float32), (len(texts), 1))
+
+    result = retrieve_context_for_graph(
+        graph,
+        ["kb1"],
+        topk=1,
+        embed_fn=_embed,
+        options=RetrievalOptions(strategy=strategy, reranker="off"),
+        bundles=[bundle],
+        semantic_cache=SemanticCache(),
+    )
+
+    assert result["results"][0]["chunk_id"] == "c1"
+    assert len(embedded) == len(set(embedded))
+    assert embedded[0] == rag_local.generate_graph_query(graph)
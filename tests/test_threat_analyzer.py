@@ -9,7 +9,14 @@ import json
 # Add src to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from threat_thinker.threat_analyzer import graph_to_prompt, denoise_threats
+from dataclasses import asdict
+
+from threat_thinker.threat_analyzer import (
+    denoise_threats,
+    edge_prompt_dict,
+    graph_to_prompt,
+    node_prompt_dict,
+)
 from threat_thinker.models import Graph, Node, Edge, Threat
 
 
@@ -88,6 +95,25 @@ class TestGraphToPrompt:
         assert edge_data["label"] is None
         assert edge_data["protocol"] is None
 
+    def test_prompt_dicts_match_asdict(self):
+        """Test node/edge prompt dicts stay in sync with the dataclass fields"""
+        node = Node(
+            id="A",
+            label="API",
+            zone="DMZ",
+            zones=["z0"],
+            type="service",
+            data=["PII"],
+            auth=True,
+            notes="n",
+        )
+        edge = Edge(
+            src="A", dst="B", label="call", protocol="HTTPS", data=["t"], id="e1"
+        )
+
+        assert list(node_prompt_dict(node).items()) == list(asdict(node).items())
+        assert list(edge_prompt_dict(edge).items()) == list(asdict(edge).items())
+
 
 class TestDenoiseThreats:
     """Test cases for denoise_threats function"""
@@ -427,3 +453,34 @@ class TestDenoiseThreats:
         assert "SQL Injection" in threat_titles  # Higher score, kept
         assert "XSS Attack" in threat_titles
         # sql injection (lowercase) should be merged with SQL Injection
+
+    def test_denoise_duplicates_do_not_consume_topn_slots(self):
+        """Test topn counts distinct threats after duplicate merging"""
+
+        def _threat(title, score):
+            return Threat(
+                id="",
+                title=title,
+                stride=["T"],
+                severity="High",
+                score=score,
+                affected=["API"],
+                why="Input validation missing",
+                references=["ASVS V5.1.1"],
+                recommended_action="Validate input",
+                evidence_nodes=["API"],
+            )
+
+        threats = [
+            _threat("SQL Injection", 9.0),
+            _threat("sql injection", 8.0),
+            _threat("XSS", 7.0),
+            _threat("CSRF", 6.0),
+        ]
+
+        result = denoise_threats(threats, topn=2)
+
+        assert [(t.id, t.title, t.score) for t in result] == [
+            ("T001", "SQL Injection", 9.0),
+            ("T002", "XSS", 7.0),
+        ]
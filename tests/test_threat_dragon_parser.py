@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from threat_thinker.parsers.threat_dragon_parser import (
     is_threat_dragon_json,
+    load_threat_dragon_json,
     parse_threat_dragon,
 )
 
@@ -34,6 +35,45 @@ def test_is_threat_dragon_json_rejects_non_td_json():
         os.unlink(tmp_path)
 
 
+def test_load_threat_dragon_json_returns_document_only_for_td_models(tmp_path):
+    document = load_threat_dragon_json(str(FIXTURE_PATH))
+    assert document["detail"]["diagrams"]
+
+    other = tmp_path / "other.json"
+    other.write_text(json.dumps([1, 2, 3]), encoding="utf-8")
+    assert load_threat_dragon_json(str(other)) is None
+
+
+def test_parse_reuses_document_passed_from_detection(tmp_path, monkeypatch):
+    import threat_thinker.parsers.threat_dragon_parser as td_parser
+
+    path = tmp_path / "model.json"
+    path.write_bytes(FIXTURE_PATH.read_bytes())
+    document = load_threat_dragon_json(str(path))
+
+    def _no_loads(raw):
+        raise AssertionError("document must not be parsed again")
+
+    monkeypatch.setattr(td_parser, "loads_json", _no_loads)
+    graph, metrics = parse_threat_dragon(str(path), document=document)
+
+    assert graph.nodes
+    assert graph.threat_dragon.original_model is document
+    assert metrics.total_lines == len(FIXTURE_PATH.read_text().splitlines())
+
+
+def test_parse_warnings_go_to_logger(tmp_path, caplog, capsys):
+    path = tmp_path / "broken.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    with caplog.at_level("WARNING", logger="threat_thinker.parsers"):
+        graph, _ = parse_threat_dragon(str(path))
+
+    assert graph.nodes == {}
+    assert "Failed to parse Threat Dragon JSON" in caplog.text
+    assert capsys.readouterr().out == ""
+
+
 def test_parse_threat_dragon_basic_graph():
     graph, metrics = parse_threat_dragon(str(FIXTURE_PATH))
 
@@ -119,3 +159,15 @@ def test_parse_threat_dragon_nested_boundaries():
     outside = graph.nodes["external-caller"]
     assert outside.zone is None
     assert outside.zones == []
+
+
+def test_total_lines_counts_crlf_and_missing_trailing_newline(tmp_path):
+    text = FIXTURE_PATH.read_text(encoding="utf-8").rstrip("\n")
+    expected = len(text.splitlines())
+    crlf = tmp_path / "crlf.json"
+    crlf.write_bytes(text.replace("\n", "\r\n").encode("utf-8") + b"\r\n")
+    bare = tmp_path / "bare.json"
+    bare.write_bytes(text.encode("utf-8"))
+
+    assert parse_threat_dragon(str(crlf))[1].total_lines == expected
+    assert parse_threat_dragon(str(bare))[1].total_lines == expected
@@ -0,0 +1,99 @@
+"""
+Tests for zone_utils module
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import threat_thinker.zone_utils as zone_utils
+from threat_thinker.zone_utils import (
+    BATCH_POINT_MIN_RECTS,
+    compute_zone_tree_from_rectangles,
+    containing_zone_ids_for_point,
+    containing_zone_ids_for_points,
+)
+
+
+# Deep inside the nested squares, on a square's corner, on the edge shared by
+# two strips, outside every rectangle, and near the top edge of the squares.
+POINTS = [(200.0, 200.0), (5.0, 5.0), (520.0, 50.0), (900.0, 900.0), (97.5, 3.0)]
+
+
+def _rects(count):
+    """Nested squares followed by side-by-side strips, `count` rectangles in total."""
+    nested = min(count, 20)
+    rects = [
+        {
+            "id": f"n{i}",
+            "name": f"N{i}",
+            "x": i * 5.0,
+            "y": i * 5.0,
+            "width": 400.0 - i * 10,
+            "height": 400.0 - i * 10,
+        }
+        for i in range(nested)
+    ]
+    rects += [
+        {
+            "id": f"s{i}",
+            "name": f"S{i}",
+            "x": 500.0 + i * 20,
+            "y": 0.0,
+            "width": 20.0,
+            "height": 50.0,
+        }
+        for i in range(count - nested)
+    ]
+    return rects
+
+
+@pytest.mark.parametrize(
+    ("rect_count", "scalar"),
+    [(BATCH_POINT_MIN_RECTS - 1, True), (BATCH_POINT_MIN_RECTS, False)],
+)
+def test_containing_zone_ids_for_points_matches_per_point_scan(
+    monkeypatch, rect_count, scalar
+):
+    rects = _rects(rect_count)
+    zones = compute_zone_tree_from_rectangles(rects)
+    expected = [containing_zone_ids_for_point(x, y, rects, zones) for x, y in POINTS]
+
+    scans = []
+    real_scan = zone_utils.containing_zone_ids_for_point
+
+    def _counting_scan(x, y, rects, zones):
+        scans.append((x, y))
+        return real_scan(x, y, rects, zones)
+
+    monkeypatch.setattr(zone_utils, "containing_zone_ids_for_point", _counting_scan)
+
+    assert containing_zone_ids_for_points(POINTS, rects, zones) == expected
+    # Below the threshold each point is scanned in Python; at or above it the
+    # NumPy path handles every point at once.
+    assert len(scans) == (len(POINTS) if scalar else 0)
+
+
+def test_containing_zone_ids_for_points_paths_agree(monkeypatch):
+    rects = _rects(BATCH_POINT_MIN_RECTS + 8)
+    zones = compute_zone_tree_from_rectangles(rects)
+    batched = containing_zone_ids_for_points(POINTS, rects, zones)
+
+    monkeypatch.setattr(zone_utils, "BATCH_POINT_MIN_RECTS", len(rects) + 1)
+    scalar = containing_zone_ids_for_points(POINTS, rects, zones)
+
+    assert batched == scalar
+    assert batched[0][:2] == ["n0", "n1"]
+    assert batched[2] == ["s0", "s1"]
+    assert batched[3] == []
+
+
+def test_containing_zone_ids_for_points_handles_no_points():
+    rects = _rects(BATCH_POINT_MIN_RECTS)
+    zones = compute_zone_tree_from_rectangles(rects)
+
+    assert containing_zone_ids_for_points([], rects, zones) == []